@@ -0,0 +1,86 @@
+"""
+benchmarks/bench_checkpoint.py
+
+Measures checkpoint encode/save/load cost against the cost
+of one simulated day, and the overhead of checkpointing
+every N days.
+
+Run:
+    python -m benchmarks.bench_checkpoint
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from governing_brain.brain import GoverningBrain
+from simulation.checkpoint import (
+    encode_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+    stream_with_checkpoints,
+)
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+DAYS = 1_000
+INTERVALS = (1, 10, 100)
+REPEATS = 2_000
+
+
+def _engine() -> TimeEngine:
+    return TimeEngine(
+        GoverningBrain(), SyntheticUser("Benchmark", seed=1), total_days=DAYS
+    )
+
+
+def _per_call(function, repeats: int = REPEATS) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+def run_benchmark():
+    engine = _engine()
+    for _ in engine.stream():
+        if engine.current_day == DAYS // 2:
+            break
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "run.ckpt")
+        save_checkpoint(engine, path)
+
+        size = len(encode_checkpoint(engine))
+        encode = _per_call(lambda: encode_checkpoint(engine))
+        save = _per_call(lambda: save_checkpoint(engine, path))
+        load = _per_call(lambda: load_checkpoint(path))
+
+        start = time.perf_counter()
+        for _ in _engine().stream():
+            pass
+        baseline = time.perf_counter() - start
+        per_day = baseline / DAYS
+
+        print(f"checkpoint size : {size} bytes")
+        print(f"encode          : {encode * 1e6:8.1f} us")
+        print(f"save (atomic)   : {save * 1e6:8.1f} us")
+        print(f"load            : {load * 1e6:8.1f} us")
+        print(f"one day         : {per_day * 1e6:8.1f} us")
+        print()
+        print(f"{'every N days':>12} | {'run (s)':>8} | {'overhead':>8}")
+        print("-" * 35)
+        print(f"{'never':>12} | {baseline:>8.3f} | {'-':>8}")
+
+        for every in INTERVALS:
+            start = time.perf_counter()
+            for _ in stream_with_checkpoints(_engine(), path, every):
+                pass
+            elapsed = time.perf_counter() - start
+            print(f"{every:>12} | {elapsed:>8.3f} | "
+                  f"{(elapsed / baseline - 1) * 100:>7.1f}%")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,51 @@
+"""
+benchmarks/bench_explanations.py
+
+Compares the decision loop with eager and lazy
+explanation records (CPU time and allocations).
+
+Run:
+    python -m benchmarks.bench_explanations
+"""
+
+import time
+import tracemalloc
+
+from governing_brain.brain import GoverningBrain
+from benchmarks.bench_router import make_states
+
+
+DECISIONS = 50_000
+
+
+def _measure(brain: GoverningBrain, states):
+    start = time.perf_counter()
+    for state in states:
+        brain.decide(state)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    records = [brain.decide(state)[1] for state in states]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+
+    return elapsed, retained
+
+
+def run_benchmark():
+    states = make_states(DECISIONS)
+
+    print(f"{'mode':>6} | {'us/decision':>11} | {'bytes/record':>12}")
+    print("-" * 36)
+
+    for label, lazy in (("eager", False), ("lazy", True)):
+        elapsed, retained = _measure(
+            GoverningBrain(lazy_explanations=lazy), states
+        )
+        print(f"{label:>6} | {elapsed / DECISIONS * 1e6:>11.2f} | "
+              f"{retained / DECISIONS:>12.0f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,85 @@
+"""
+benchmarks/bench_log_table.py
+
+Compares SimulationLog lists with the columnar
+SimulationLogTable: evaluation and JSONL export time, plus
+saving and re-analysing a memory-mapped log segment.
+
+Run:
+    python -m benchmarks.bench_log_table
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from governing_brain.brain import GoverningBrain
+from policy_evolution.evaluator import PolicyEvaluator
+from simulation.log_segment import LogSegment, save_segment
+from simulation.log_table import SimulationLogTable
+from simulation.sinks import FileSink
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+DAYS = 20_000
+
+
+def _timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run_benchmark():
+    logs = TimeEngine(
+        GoverningBrain(lazy_explanations=True),
+        SyntheticUser("Benchmark", seed=1),
+        total_days=DAYS,
+    ).run()
+
+    table, build = _timed(lambda: SimulationLogTable.from_logs(logs))
+    expected, list_eval = _timed(lambda: PolicyEvaluator(logs).evaluate())
+    result, table_eval = _timed(lambda: PolicyEvaluator(table).evaluate())
+    assert result == expected
+
+    with tempfile.TemporaryDirectory() as directory:
+        def write_logs():
+            with FileSink(str(Path(directory) / "logs.jsonl")) as sink:
+                for log in logs:
+                    sink.write(log)
+
+        _, list_export = _timed(write_logs)
+        _, table_export = _timed(
+            lambda: table.to_jsonl(str(Path(directory) / "table.jsonl"))
+        )
+        _, table_csv = _timed(
+            lambda: table.to_csv(str(Path(directory) / "table.csv"))
+        )
+
+        segment_path = str(Path(directory) / "run.seg")
+        _, segment_save = _timed(
+            lambda: save_segment(table, segment_path, "benchmark", seed=1)
+        )
+        segment, segment_open = _timed(lambda: LogSegment(segment_path))
+        # Closed before the temporary directory is removed
+        with segment:
+            result, segment_eval = _timed(
+                lambda: PolicyEvaluator(segment).evaluate()
+            )
+        assert result == expected
+
+    print(f"days              : {DAYS}")
+    print(f"build table       : {build:8.3f} s")
+    print(f"evaluate (list)   : {list_eval:8.3f} s")
+    print(f"evaluate (table)  : {table_eval:8.3f} s")
+    print(f"JSONL (FileSink)  : {list_export:8.3f} s")
+    print(f"JSONL (table)     : {table_export:8.3f} s")
+    print(f"CSV (table)       : {table_csv:8.3f} s")
+    print(f"save segment      : {segment_save:8.3f} s")
+    print(f"open segment      : {segment_open:8.3f} s")
+    print(f"evaluate (mmap)   : {segment_eval:8.3f} s")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,58 @@
+"""
+benchmarks/bench_parallel_runner.py
+
+Measures run_parallel_simulation for 1, 2, 4 and 8 worker
+processes on the same user configurations.
+
+Scaling is bounded by the machine's core count.
+
+Run:
+    python -m benchmarks.bench_parallel_runner
+"""
+
+import os
+import time
+
+from simulation.parallel_runner import (
+    SyntheticUserConfig,
+    run_parallel_simulation,
+)
+
+
+WORKER_COUNTS = (1, 2, 4, 8)
+USERS = 400
+DAYS = 90
+
+
+def run_benchmark():
+    configs = [
+        SyntheticUserConfig(
+            name=f"user-{i}",
+            compliance_bias=0.4 + 0.4 * (i % 11) / 10,
+            fatigue_sensitivity=0.3 + 0.4 * (i % 7) / 6,
+            avoidance_tendency=0.1 + 0.4 * (i % 5) / 4,
+        )
+        for i in range(USERS)
+    ]
+
+    print(f"{USERS} users x {DAYS} days, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} | {'seconds':>8} | {'scaling':>8}")
+    print("-" * 32)
+
+    baseline = None
+    reference = None
+    for workers in WORKER_COUNTS:
+        start = time.perf_counter()
+        result = run_parallel_simulation(configs, days=DAYS, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        reference = reference or result
+        if result != reference:
+            raise RuntimeError("Results depend on the worker count")
+
+        baseline = baseline or elapsed
+        print(f"{workers:>8} | {elapsed:>8.3f} | {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,49 @@
+"""
+benchmarks/bench_population.py
+
+Measures PopulationTimeEngine against per-user TimeEngine
+runs (extrapolated from a sample of users).
+
+Run:
+    python -m benchmarks.bench_population
+"""
+
+import time
+
+from governing_brain.brain import GoverningBrain
+from simulation.population import PopulationTimeEngine, SyntheticPopulation
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+POPULATION_SIZES = (1_000, 10_000, 50_000)
+DAYS = 365
+SCALAR_SAMPLE = 20
+
+
+def run_benchmark():
+    start = time.perf_counter()
+    for seed in range(SCALAR_SAMPLE):
+        user = SyntheticUser(f"user-{seed}", seed=seed)
+        TimeEngine(GoverningBrain(), user, total_days=DAYS).run()
+    scalar_per_user = (time.perf_counter() - start) / SCALAR_SAMPLE
+
+    print(f"{DAYS} simulated days")
+    print(f"{'users':>8} | {'TimeEngine est. (s)':>19} | "
+          f"{'population (s)':>14} | {'speedup':>8}")
+    print("-" * 60)
+
+    for size in POPULATION_SIZES:
+        population = SyntheticPopulation.uniform(size, seed=0)
+
+        start = time.perf_counter()
+        PopulationTimeEngine(population, total_days=DAYS).run().evaluate()
+        elapsed = time.perf_counter() - start
+
+        scalar = scalar_per_user * size
+        print(f"{size:>8} | {scalar:>19.1f} | "
+              f"{elapsed:>14.3f} | {scalar / elapsed:>7.0f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
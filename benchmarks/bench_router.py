@@ -0,0 +1,49 @@
+"""
+benchmarks/bench_router.py
+
+Compares per-decision latency of the policy pipeline
+(select_strategy) against the compiled rule router.
+
+Run:
+    python -m benchmarks.bench_router
+"""
+
+import random
+import timeit
+
+from governing_brain.policies.compiler import compile_router
+from governing_brain.policies.router import select_strategy
+from governing_brain.state_model import BehavioralState
+
+
+SAMPLE_SIZE = 10_000
+
+
+def make_states(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        BehavioralState(
+            rng.random(), rng.random(), rng.random(),
+            rng.random(), rng.random(), rng.uniform(-1.0, 1.0),
+        )
+        for _ in range(size)
+    ]
+
+
+def run_benchmark():
+    states = make_states(SAMPLE_SIZE)
+    routers = (
+        ("select_strategy", select_strategy),
+        ("compiled", compile_router()),
+    )
+
+    for label, router in routers:
+        elapsed = min(timeit.repeat(
+            lambda: [router(s) for s in states], number=10, repeat=5,
+        ))
+        per_decision = elapsed / (10 * SAMPLE_SIZE)
+        print(f"{label:>16} : {per_decision * 1e9:8.1f} ns/decision")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,57 @@
+"""
+benchmarks/bench_sharded.py
+
+Measures sharded brain throughput for 1, 2, 4 and 8 worker
+processes on the same synthetic request stream.
+
+Scaling is bounded by the machine's core count: with fewer
+cores than workers the extra processes only add IPC cost.
+
+Run:
+    python -m benchmarks.bench_sharded
+"""
+
+import os
+import random
+import time
+
+from service.load_client import make_request_batch
+from service.sharded import ShardedBrain
+
+
+WORKER_COUNTS = (1, 2, 4, 8)
+USERS = 2_000
+DAYS = 10
+CHUNK = 4_096
+
+
+def make_stream(users: int = USERS, days: int = DAYS, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        (f"user-{user}", make_request_batch(rng, day))
+        for day in range(days)
+        for user in range(users)
+    ]
+
+
+def run_benchmark():
+    stream = make_stream()
+    print(f"{len(stream)} requests, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} | {'seconds':>8} | {'req/s':>10} | {'scaling':>8}")
+    print("-" * 44)
+
+    baseline = None
+    for workers in WORKER_COUNTS:
+        with ShardedBrain(workers) as sharded:
+            start = time.perf_counter()
+            for offset in range(0, len(stream), CHUNK):
+                sharded.process(stream[offset:offset + CHUNK])
+            elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        print(f"{workers:>8} | {elapsed:>8.3f} | "
+              f"{len(stream) / elapsed:>10.0f} | {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,89 @@
+"""
+benchmarks/bench_signal_ingest.py
+
+Measures ingestion of raw telemetry records into
+SignalBatch (one frozen Signal each) against SignalColumns.
+
+Run:
+    python -m benchmarks.bench_signal_ingest
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.signal_columns import SignalColumns, epoch_us
+from governing_brain.state_model import SIGNAL_EFFECTS
+
+
+SIGNAL_COUNTS = (1_000, 100_000, 1_000_000)
+
+
+def make_records(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    names = np.array(sorted(SIGNAL_EFFECTS), dtype=object)
+    start = datetime(2025, 1, 1)
+    end = start + timedelta(hours=1)
+    offsets = rng.integers(0, 3_600_000_000, count)
+    return {
+        "names": names[rng.integers(0, len(names), count)].tolist(),
+        "values": np.ones(count),
+        "confidences": rng.random(count),
+        "timestamps_us": epoch_us(start) + offsets,
+        "window_start": start,
+        "window_end": end,
+    }
+
+
+def ingest_objects(records) -> SignalBatch:
+    start = records["window_start"]
+    return SignalBatch(
+        signals=[
+            Signal(name, value, confidence, start + timedelta(microseconds=t))
+            for name, value, confidence, t in zip(
+                records["names"],
+                records["values"].tolist(),
+                records["confidences"].tolist(),
+                (records["timestamps_us"] - epoch_us(start)).tolist(),
+            )
+        ],
+        window_start=start,
+        window_end=records["window_end"],
+    )
+
+
+def ingest_columns(records) -> SignalColumns:
+    return SignalColumns.from_records(
+        names=records["names"],
+        values=records["values"],
+        confidences=records["confidences"],
+        timestamps_us=records["timestamps_us"],
+        window_start_us=epoch_us(records["window_start"]),
+        window_end_us=epoch_us(records["window_end"]),
+    )
+
+
+def run_benchmark():
+    print(f"{'signals':>10} | {'SignalBatch (s)':>15} | "
+          f"{'SignalColumns (s)':>17} | {'speedup':>8}")
+    print("-" * 60)
+
+    for count in SIGNAL_COUNTS:
+        records = make_records(count)
+
+        start = time.perf_counter()
+        ingest_objects(records)
+        objects = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ingest_columns(records)
+        columns = time.perf_counter() - start
+
+        print(f"{count:>10} | {objects:>15.3f} | "
+              f"{columns:>17.3f} | {objects / columns:>7.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,59 @@
+"""
+benchmarks/bench_state_batch.py
+
+Measures population-scale state evolution with
+update_state_batch against per-user update_state calls.
+
+Run:
+    python -m benchmarks.bench_state_batch
+"""
+
+import time
+
+import numpy as np
+
+from governing_brain.state_array import (
+    BehavioralStateArray,
+    SIGNAL_COLUMNS,
+    update_state_batch,
+)
+from governing_brain.state_model import update_state
+from benchmarks.bench_state_update import make_batch
+
+
+POPULATION_SIZES = (1_000, 100_000, 1_000_000)
+SCALAR_SAMPLE = 20_000
+
+
+def run_benchmark():
+    rng = np.random.default_rng(0)
+
+    # Per-user scalar cost, extrapolated from a sample
+    batch = make_batch(3)
+    state = update_state(None, batch)
+    start = time.perf_counter()
+    for _ in range(SCALAR_SAMPLE):
+        update_state(state, batch)
+    scalar_per_user = (time.perf_counter() - start) / SCALAR_SAMPLE
+
+    print(f"{'users':>10} | {'scalar est. (s)':>15} | "
+          f"{'batch (s)':>10} | {'speedup':>8}")
+    print("-" * 55)
+
+    for size in POPULATION_SIZES:
+        states = BehavioralStateArray.cold_start(size)
+        signals = rng.random((size, len(SIGNAL_COLUMNS))) * (
+            rng.random((size, len(SIGNAL_COLUMNS))) < 0.15
+        )
+
+        start = time.perf_counter()
+        update_state_batch(states, signals)
+        elapsed = time.perf_counter() - start
+
+        scalar = scalar_per_user * size
+        print(f"{size:>10} | {scalar:>15.3f} | "
+              f"{elapsed:>10.4f} | {scalar / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
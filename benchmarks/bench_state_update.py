@@ -0,0 +1,76 @@
+"""
+benchmarks/bench_state_update.py
+
+Compares the single-pass, table-driven update_state
+against the per-dimension reference implementation.
+
+Run:
+    python -m benchmarks.bench_state_update
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.state_model import (
+    BehavioralState,
+    SIGNAL_EFFECTS,
+    _update_state_multipass,
+    update_state,
+)
+
+
+BATCH_SIZES = (1, 10, 100, 1_000)
+
+
+def make_batch(size: int, seed: int = 0) -> SignalBatch:
+    """
+    Builds a deterministic batch of known signal names.
+    """
+
+    rng = random.Random(seed)
+    now = datetime(2025, 1, 1, 8, 0)
+    names = sorted(SIGNAL_EFFECTS)
+
+    return SignalBatch(
+        signals=[
+            Signal(
+                name=rng.choice(names),
+                value=1.0,
+                confidence=rng.random(),
+                timestamp=now,
+            )
+            for _ in range(size)
+        ],
+        window_start=now - timedelta(hours=8),
+        window_end=now,
+    )
+
+
+def run_benchmark():
+    state = BehavioralState(0.5, 0.5, 0.3, 0.5, 0.5, 0.0)
+
+    print(f"{'signals':>8} | {'multipass (us)':>15} | "
+          f"{'table (us)':>11} | {'speedup':>7}")
+    print("-" * 52)
+
+    for size in BATCH_SIZES:
+        batch = make_batch(size)
+        number = max(10, 100_000 // size)
+
+        reference = min(timeit.repeat(
+            lambda: _update_state_multipass(state, batch),
+            number=number, repeat=5,
+        )) / number
+        table = min(timeit.repeat(
+            lambda: update_state(state, batch),
+            number=number, repeat=5,
+        )) / number
+
+        print(f"{size:>8} | {reference * 1e6:>15.2f} | "
+              f"{table * 1e6:>11.2f} | {reference / table:>6.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,43 @@
+"""
+benchmarks/bench_sweep.py
+
+Measures a cold sweep, a fully cached re-run, and a re-run
+after widening the seed range (only new cells simulate).
+
+Run:
+    python -m benchmarks.bench_sweep
+"""
+
+import tempfile
+import time
+
+from simulation.sweep import run_sweep
+
+
+GRID = dict(
+    compliance_bias=(0.3, 0.45, 0.6, 0.75),
+    fatigue_sensitivity=(0.3, 0.6),
+    avoidance_tendency=(0.2, 0.5),
+    days=(90,),
+    seeds=(1, 2, 3),
+)
+
+
+def run_benchmark():
+    with tempfile.TemporaryDirectory() as cache:
+        print(f"{'run':>14} | {'cells':>5} | {'computed':>8} | {'time (s)':>8}")
+        print("-" * 46)
+        for label, grid in (
+            ("cold", GRID),
+            ("cached", GRID),
+            ("+1 seed", {**GRID, "seeds": (1, 2, 3, 4)}),
+        ):
+            start = time.perf_counter()
+            result = run_sweep(**grid, cache_dir=cache)
+            elapsed = time.perf_counter() - start
+            print(f"{label:>14} | {len(result.evaluations):>5} | "
+                  f"{result.computed:>8} | {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,91 @@
+"""
+benchmarks/bench_wire_format.py
+
+Compares the packed binary SignalBatch encoding with the
+decision service's JSON encoding: payload size and
+encode/decode time per batch.
+
+Run:
+    python -m benchmarks.bench_wire_format
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.signal_registry import SIGNAL_NAMES
+from governing_brain.wire_format import (
+    decode_signal_batch,
+    encode_signal_batch,
+)
+from service.protocol import decode_request, encode_batch
+
+
+BATCH_SIZES = (10, 100, 1_000, 10_000)
+TARGET_SIGNALS = 100_000
+
+
+def make_signal_batch(size: int, seed: int = 0) -> SignalBatch:
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    return SignalBatch(
+        signals=[
+            Signal(
+                rng.choice(SIGNAL_NAMES),
+                1.0,
+                rng.random(),
+                start + timedelta(microseconds=rng.randint(0, 3600 * 10**6)),
+            )
+            for _ in range(size)
+        ],
+        window_start=start,
+        window_end=start + timedelta(hours=1),
+    )
+
+
+def _per_call(function, argument, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function(argument)
+    return (time.perf_counter() - start) / repeats
+
+
+def run_benchmark():
+    try:
+        from governing_brain.signal_columns import SignalColumns
+    except ImportError:
+        SignalColumns = None
+
+    print(f"{'signals':>8} | {'JSON B':>9} | {'bin B':>8} | "
+          f"{'JSON enc/dec (ms)':>17} | {'bin enc/dec (ms)':>16} | "
+          f"{'columns dec (ms)':>16}")
+    print("-" * 90)
+
+    for size in BATCH_SIZES:
+        batch = make_signal_batch(size)
+        repeats = max(1, TARGET_SIGNALS // size)
+
+        json_data = encode_batch("user-0", batch)
+        binary = encode_signal_batch(batch)
+
+        json_encode = _per_call(
+            lambda b: encode_batch("user-0", b), batch, repeats
+        )
+        json_decode = _per_call(decode_request, json_data, repeats)
+        bin_encode = _per_call(encode_signal_batch, batch, repeats)
+        bin_decode = _per_call(decode_signal_batch, binary, repeats)
+
+        columns = "n/a"
+        if SignalColumns is not None:
+            seconds = _per_call(SignalColumns.from_wire, binary, repeats)
+            columns = f"{seconds * 1e3:.3f}"
+
+        print(f"{size:>8} | {len(json_data):>9} | {len(binary):>8} | "
+              f"{json_encode * 1e3:>8.3f}/{json_decode * 1e3:<8.3f} | "
+              f"{bin_encode * 1e3:>7.3f}/{bin_decode * 1e3:<8.3f} | "
+              f"{columns:>16}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
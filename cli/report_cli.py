@@ -6,9 +6,14 @@ Phase 4.3 — Human Approval Workflow
 
 Run:
     python -m cli.report_cli
+    python -m cli.report_cli --days 10000 --output summary --progress
+    python -m cli.report_cli --segment run.seg --start 9000 --stop 10000
 """
 
-from simulation.run_simulation import run_basic_simulation
+import argparse
+from typing import Dict, List, Optional
+
+from simulation.run_simulation import OutputMode, run_basic_simulation
 from policy_evolution.evaluator import PolicyEvaluator
 from policy_evolution.signal_engine import EvolutionSignalEngine
 from policy_evolution.updater import PolicyUpdater
@@ -33,16 +38,45 @@ def prompt_for_approval() -> bool:
         print("Please enter 'y' or 'n'.")
 
 
-def run_report(days: int = 7):
-    # -------------------------------------------------
-    # 1. Run simulation (Phase 2)
-    # -------------------------------------------------
-    logs = run_basic_simulation(days=days)
+def run_report(
+    days: int = 7,
+    output: "OutputMode | str" = OutputMode.VERBOSE,
+    path: Optional[str] = None,
+    progress: bool = False,
+    segment: Optional[str] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+):
+    """
+    With segment (a simulation.log_segment file), reports on
+    rows [start, stop) of that recorded run instead of running
+    a new simulation; only the slice is read from disk.
+    """
 
-    # -------------------------------------------------
-    # 2. Evaluate governance (Phase 3.1)
-    # -------------------------------------------------
-    evaluation = PolicyEvaluator(logs).evaluate()
+    run_metadata: Optional[Dict[str, object]] = None
+
+    if segment is not None:
+        # -------------------------------------------------
+        # 1-2. Evaluate a slice of a recorded run (Phase 3.1)
+        # -------------------------------------------------
+        from simulation.log_segment import LogSegment
+
+        with LogSegment(segment) as recorded:
+            evaluation = PolicyEvaluator(recorded[start:stop]).evaluate()
+            run_metadata = recorded.metadata(start, stop)
+    else:
+        # -------------------------------------------------
+        # 1. Run simulation (Phase 2)
+        #    (see OutputMode: large runs should not print days)
+        # -------------------------------------------------
+        logs = run_basic_simulation(
+            days=days, output=output, path=path, progress=progress
+        )
+
+        # -------------------------------------------------
+        # 2. Evaluate governance (Phase 3.1)
+        # -------------------------------------------------
+        evaluation = PolicyEvaluator(logs).evaluate()
 
     # -------------------------------------------------
     # 3. Derive evolution signals (Phase 3.2)
@@ -84,6 +118,7 @@ def run_report(days: int = 7):
         signals=signals,
         recommendation=recommendation,
         proposed_version=proposed_version,
+        run_metadata=run_metadata,
     )
 
     print("\n" + report)
@@ -108,5 +143,48 @@ def run_report(days: int = 7):
         print("\nNo recommendation to approve.")
 
 
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Run a simulation and review its policy evolution report."
+    )
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument(
+        "--output",
+        choices=[mode.value for mode in OutputMode],
+        default=OutputMode.VERBOSE.value,
+        help="simulation output while the report's simulation runs",
+    )
+    parser.add_argument(
+        "--path", help="log file for the jsonl and csv output modes"
+    )
+    parser.add_argument(
+        "--progress", action="store_true", help="show a progress indicator"
+    )
+    parser.add_argument(
+        "--segment",
+        help="report on a recorded log segment instead of simulating",
+    )
+    parser.add_argument(
+        "--start", type=int, default=0, help="first segment row to report on"
+    )
+    parser.add_argument(
+        "--stop", type=int, help="segment row to stop before (default: end)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.output in (OutputMode.JSONL, OutputMode.CSV) and not args.path:
+        parser.error(f"--output {args.output} requires --path")
+
+    run_report(
+        days=args.days,
+        output=args.output,
+        path=args.path,
+        progress=args.progress,
+        segment=args.segment,
+        start=args.start,
+        stop=args.stop,
+    )
+
+
 if __name__ == "__main__":
-    run_report()
+    main()
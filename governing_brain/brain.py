@@ -12,72 +12,201 @@ This module contains NO policy logic.
 """
 
 from datetime import datetime
-from typing import Tuple
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from governing_brain.state_model import BehavioralState
 from governing_brain.policies.router import select_strategy
 from governing_brain.outputs import GovernanceDirective
-from governing_brain.explanations import ExplanationRecord
+from governing_brain.explanations import (
+    DEFAULT_EXPECTED_OUTCOME,
+    DEFAULT_REVERSAL_CONDITION,
+    DEFAULT_TRIGGER,
+    Explanation,
+    ExplanationRecord,
+    LazyExplanationRecord,
+    render_action_summary,
+    render_state_snapshot,
+    render_state_summary,
+)
 from governing_brain.strategies import Strategy
+from governing_brain.decision_cache import DecisionCache
+from governing_brain.policies.rules import DEFAULT_RULES
+
+
+# =========================================================
+# Interned Directives
+# =========================================================
+
+def _make_directive(strategy: Strategy) -> GovernanceDirective:
+    """
+    Builds abstract governance directives based on strategy.
+    """
+
+    if strategy == Strategy.ENFORCEMENT:
+        return GovernanceDirective(
+            strategy=strategy,
+            required_strictness=0.9,
+            allowed_capabilities=["alarm_enforcement"],
+            escalation_limit=1.0,
+            recovery_allowed=False,
+            explanation_required=True,
+        )
+
+    if strategy == Strategy.SUPPORT:
+        return GovernanceDirective(
+            strategy=strategy,
+            required_strictness=0.3,
+            allowed_capabilities=["coaching"],
+            escalation_limit=0.2,
+            recovery_allowed=True,
+            explanation_required=True,
+        )
+
+    # Default: STABILIZATION, COMPENSATION, STRATEGIC_PAUSE
+    return GovernanceDirective(
+        strategy=strategy,
+        required_strictness=0.5,
+        allowed_capabilities=[],
+        escalation_limit=0.5,
+        recovery_allowed=True,
+        explanation_required=False,
+    )
+
+
+# Validated once; directives are immutable and shared across decisions.
+DIRECTIVES: Dict[Strategy, GovernanceDirective] = {
+    strategy: _make_directive(strategy) for strategy in Strategy
+}
 
 
 class GoverningBrain:
     """
     Central orchestration unit for behavioral governance decisions.
+
+    The strategy router defaults to select_strategy. A compiled
+    router (see governing_brain.policies.compiler) may be supplied
+    for lower per-decision latency.
+
+    With margin_cache=True, directives are reused while the state
+    stays within the distance to the nearest policy threshold
+    (see governing_brain.decision_cache). verify_cache=True
+    re-routes every cache hit and raises on disagreement.
+
+    With lazy_explanations=True, decisions return
+    LazyExplanationRecord instances that render their strings,
+    ids and snapshots only when accessed.
     """
 
+    def __init__(
+        self,
+        router: Optional[Callable[[BehavioralState], Strategy]] = None,
+        margin_cache: bool = False,
+        verify_cache: bool = False,
+        lazy_explanations: bool = False,
+    ):
+        self.router = router or select_strategy
+        self.lazy_explanations = lazy_explanations
+
+        self.decision_cache: Optional[DecisionCache] = None
+        if margin_cache:
+            self.decision_cache = DecisionCache(
+                rules=self._router_rules(), verify=verify_cache
+            )
+
     def decide(
-        self, state: BehavioralState
-    ) -> Tuple[GovernanceDirective, ExplanationRecord]:
+        self,
+        state: BehavioralState,
+        cache_key: Hashable = None,
+    ) -> Tuple[GovernanceDirective, Explanation]:
         """
         Executes one governance decision cycle.
+
+        cache_key identifies the state trajectory (e.g. a user id)
+        when the margin cache is enabled; it is ignored otherwise.
         """
 
-        strategy = select_strategy(state)
+        cache = self.decision_cache
+
+        if cache is None:
+            strategy = self.router(state)
+            directive = self._build_directive(strategy)
+        else:
+            directive = cache.lookup(cache_key, state)
+
+            if directive is None:
+                directive = self._build_directive(self.router(state))
+                cache.store(cache_key, state, directive)
+            elif cache.verify and self.router(state) != directive.strategy:
+                raise RuntimeError(
+                    "Margin cache returned a stale strategy for "
+                    f"{state}: {directive.strategy}"
+                )
+
+            strategy = directive.strategy
 
-        directive = self._build_directive(strategy)
         explanation = self._build_explanation(strategy, state)
 
         return directive, explanation
 
+    def _router_rules(self):
+        """
+        Rules whose thresholds bound the active router.
+        """
+
+        if self.router is select_strategy:
+            return DEFAULT_RULES
+
+        rules = getattr(self.router, "__rules__", None)
+        if rules is None:
+            raise ValueError(
+                "margin_cache requires select_strategy or a compiled router"
+            )
+        return rules
+
+    def decide_batch(
+        self, states: Sequence[BehavioralState]
+    ) -> List[Tuple[GovernanceDirective, Optional[Explanation]]]:
+        """
+        Executes one governance decision cycle per state.
+
+        Directives are shared, prebuilt instances. Explanations
+        are built only where the directive requires one
+        (explanation_required); other entries carry None.
+        The margin cache is not consulted.
+        """
+
+        router = self.router
+        directives = DIRECTIVES
+        results = []
+
+        for state in states:
+            directive = directives[router(state)]
+            explanation = (
+                self._build_explanation(directive.strategy, state)
+                if directive.explanation_required else None
+            )
+            results.append((directive, explanation))
+
+        return results
+
     # =========================================================
     # Directive Construction
     # =========================================================
 
     def _build_directive(self, strategy: Strategy) -> GovernanceDirective:
         """
-        Builds abstract governance directives based on strategy.
+        Returns the prebuilt governance directive for a strategy.
         """
 
-        if strategy == Strategy.ENFORCEMENT:
-            return GovernanceDirective(
-                strategy=strategy,
-                required_strictness=0.9,
-                allowed_capabilities=["alarm_enforcement"],
-                escalation_limit=1.0,
-                recovery_allowed=False,
-                explanation_required=True,
-            )
-
-        if strategy == Strategy.SUPPORT:
-            return GovernanceDirective(
-                strategy=strategy,
-                required_strictness=0.3,
-                allowed_capabilities=["coaching"],
-                escalation_limit=0.2,
-                recovery_allowed=True,
-                explanation_required=True,
-            )
-
-        # Default: STABILIZATION, COMPENSATION, STRATEGIC_PAUSE
-        return GovernanceDirective(
-            strategy=strategy,
-            required_strictness=0.5,
-            allowed_capabilities=[],
-            escalation_limit=0.5,
-            recovery_allowed=True,
-            explanation_required=False,
-        )
+        return DIRECTIVES[strategy]
 
     # =========================================================
     # Explanation Construction
@@ -85,36 +214,30 @@ class GoverningBrain:
 
     def _build_explanation(
         self, strategy: Strategy, state: BehavioralState
-    ) -> ExplanationRecord:
+    ) -> Explanation:
         """
         Builds an auditable explanation record for the decision.
         """
 
-        state_snapshot = {
-            "discipline_level": state.discipline_level,
-            "failure_risk": state.failure_risk,
-            "fatigue_index": state.fatigue_index,
-            "avoidance_tendency": state.avoidance_tendency,
-            "context_importance": state.context_importance,
-            "momentum_trend": state.momentum_trend,
-        }
-
-        state_summary = (
-            f"failure_risk={state.failure_risk}, "
-            f"fatigue_index={state.fatigue_index}, "
-            f"avoidance_tendency={state.avoidance_tendency}, "
-            f"context_importance={state.context_importance}, "
-            f"discipline_level={state.discipline_level}, "
-            f"momentum_trend={state.momentum_trend}"
+        values = (
+            state.discipline_level,
+            state.failure_risk,
+            state.avoidance_tendency,
+            state.fatigue_index,
+            state.context_importance,
+            state.momentum_trend,
         )
 
+        if self.lazy_explanations:
+            return LazyExplanationRecord(strategy, values)
+
         return ExplanationRecord(
-            trigger="Policy evaluation based on behavioral state",
+            trigger=DEFAULT_TRIGGER,
             strategy_selected=strategy,
-            state_snapshot=state_snapshot,
-            state_summary=state_summary,
-            action_summary=f"Selected {strategy.value} strategy",
-            expected_outcome="Improved long-term behavioral stability",
-            reversal_condition="State variables return to safe ranges",
+            state_snapshot=render_state_snapshot(values),
+            state_summary=render_state_summary(values),
+            action_summary=render_action_summary(strategy),
+            expected_outcome=DEFAULT_EXPECTED_OUTCOME,
+            reversal_condition=DEFAULT_REVERSAL_CONDITION,
             decision_confidence=1.0,
         )
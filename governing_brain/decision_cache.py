@@ -0,0 +1,139 @@
+"""
+decision_cache.py
+
+Margin-based cache of governance directives.
+
+A decision stays valid while every state field remains
+closer to its anchor value than to the nearest policy
+threshold on that field: no comparison in any policy can
+flip, so the selected strategy cannot change.
+
+Design guarantees:
+- A hit always equals a fresh routing decision
+- Strict inequality: states on a threshold never hit
+- No policy logic (thresholds come from the rules)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+from governing_brain.outputs import GovernanceDirective
+from governing_brain.policies.rules import (
+    DEFAULT_RULES,
+    Rule,
+    field_thresholds,
+)
+from governing_brain.state_model import BehavioralState, STATE_DIMENSIONS
+
+
+# =========================================================
+# Margin Computation
+# =========================================================
+
+def decision_margins(
+    state: BehavioralState,
+    thresholds: Dict[str, Tuple[float, ...]],
+) -> Tuple[float, ...]:
+    """
+    Distance from each state field (STATE_DIMENSIONS order)
+    to the nearest threshold compared against it.
+
+    Fields with no thresholds have an infinite margin.
+    """
+
+    margins = []
+    for name in STATE_DIMENSIONS:
+        value = getattr(state, name)
+        margins.append(min(
+            (abs(value - t) for t in thresholds.get(name, ())),
+            default=float("inf"),
+        ))
+    return tuple(margins)
+
+
+# =========================================================
+# Cache
+# =========================================================
+
+@dataclass(frozen=True)
+class CachedDecision:
+    """
+    Directive selected at an anchor state, with the
+    per-field margins within which it remains valid.
+    """
+
+    anchor: Tuple[float, ...]
+    margins: Tuple[float, ...]
+    directive: GovernanceDirective
+
+
+class DecisionCache:
+    """
+    Per-key store of margin-bounded decisions.
+
+    Keys identify independent state trajectories
+    (e.g. user ids). verify=True re-routes every hit and
+    raises if the cached strategy differs.
+    """
+
+    def __init__(
+        self,
+        rules: Tuple[Rule, ...] = DEFAULT_RULES,
+        verify: bool = False,
+    ):
+        self.thresholds = field_thresholds(rules)
+        self.verify = verify
+
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, CachedDecision] = {}
+
+    def lookup(
+        self, key: Hashable, state: BehavioralState
+    ) -> Optional[GovernanceDirective]:
+        """
+        Return the cached directive if the state is still
+        inside its margins, else None (counted as a miss).
+        """
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            for name, anchor, margin in zip(
+                STATE_DIMENSIONS, entry.anchor, entry.margins
+            ):
+                if not abs(getattr(state, name) - anchor) < margin:
+                    break
+            else:
+                self.hits += 1
+                return entry.directive
+
+        self.misses += 1
+        return None
+
+    def store(
+        self,
+        key: Hashable,
+        state: BehavioralState,
+        directive: GovernanceDirective,
+    ) -> CachedDecision:
+        entry = CachedDecision(
+            anchor=tuple(getattr(state, name) for name in STATE_DIMENSIONS),
+            margins=decision_margins(state, self.thresholds),
+            directive=directive,
+        )
+        self._entries[key] = entry
+        return entry
+
+    def invalidate(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,288 @@
+"""
+explanation_log.py
+
+Columnar, append-only audit store for explanation records.
+
+Records are buffered as typed columns and flushed in fixed-size
+segments (one .npz file each). A manifest keeps per-segment
+time bounds and strategy counts, so queries by strategy and
+time range only open the segments they need and never build
+per-record Python objects.
+
+Rendered strings are not stored: every ExplanationRecord field
+is derived from the strategy, state, confidence, timestamp and
+decision id (see explanations.render_*). Records with a
+non-default trigger, expected outcome or reversal condition
+are rejected rather than stored incompletely.
+
+Requires NumPy.
+"""
+
+import json
+from array import array
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+import numpy as np
+
+from governing_brain.explanations import (
+    DEFAULT_EXPECTED_OUTCOME,
+    DEFAULT_REVERSAL_CONDITION,
+    DEFAULT_TRIGGER,
+    Explanation,
+    ExplanationRecord,
+    LazyExplanationRecord,
+    render_action_summary,
+    render_state_snapshot,
+    render_state_summary,
+)
+from governing_brain.inputs import epoch_us, from_epoch_us
+from governing_brain.state_model import STATE_DIMENSIONS
+from governing_brain.strategies import (
+    Strategy,
+    STRATEGIES_BY_CODE,
+    STRATEGY_CODES,
+)
+
+
+# =========================================================
+# Schema
+# =========================================================
+
+FLOAT_COLUMNS = STATE_DIMENSIONS + ("confidence",)
+
+COLUMNS = ("strategy",) + FLOAT_COLUMNS + ("timestamp_us", "decision_id")
+
+MANIFEST_NAME = "manifest.jsonl"
+
+# Fields that are not stored: append() only accepts the defaults
+_FIXED_FIELDS = (
+    ("trigger", DEFAULT_TRIGGER),
+    ("expected_outcome", DEFAULT_EXPECTED_OUTCOME),
+    ("reversal_condition", DEFAULT_REVERSAL_CONDITION),
+)
+
+
+# =========================================================
+# Explanation Log
+# =========================================================
+
+class ExplanationLog:
+    """
+    Segmented columnar log of explanation records.
+
+    Columns:
+    - strategy: uint8 (STRATEGY_CODES)
+    - six state fields and confidence: float64
+    - timestamp_us: int64 microseconds since the epoch (UTC)
+    - decision_id: 16 raw UUID bytes per record
+    """
+
+    def __init__(self, directory: str, segment_size: int = 65_536):
+        if segment_size <= 0:
+            raise ValueError("segment_size must be positive")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+
+        self.segments: List[Dict] = []
+        manifest = self.directory / MANIFEST_NAME
+        if manifest.exists():
+            with manifest.open("r", encoding="utf-8") as f:
+                self.segments = [json.loads(line) for line in f if line.strip()]
+
+        self._reset_buffer()
+
+    # -----------------------------
+    # Append
+    # -----------------------------
+
+    def _reset_buffer(self):
+        self._strategy = array("B")
+        self._floats = {name: array("d") for name in FLOAT_COLUMNS}
+        self._timestamps = array("q")
+        self._ids = bytearray()
+
+    def append(self, record: Explanation):
+        """
+        Buffers one record.
+
+        Raises ValueError if the record's trigger, expected
+        outcome or reversal condition is not the default, since
+        those strings are not stored.
+        """
+
+        if isinstance(record, LazyExplanationRecord):
+            values = record.state_values
+            timestamp_us = record.timestamp_us
+            decision_id = record.decision_uuid
+        else:
+            for name, default in _FIXED_FIELDS:
+                if getattr(record, name) != default:
+                    raise ValueError(
+                        f"ExplanationLog only stores the default {name}"
+                    )
+            snapshot = record.state_snapshot
+            values = tuple(snapshot[name] for name in STATE_DIMENSIONS)
+            timestamp_us = epoch_us(record.timestamp)
+            decision_id = UUID(record.decision_id)
+
+        self._strategy.append(STRATEGY_CODES[record.strategy_selected])
+        for name, value in zip(STATE_DIMENSIONS, values):
+            self._floats[name].append(value)
+        self._floats["confidence"].append(record.decision_confidence)
+        self._timestamps.append(timestamp_us)
+        self._ids += decision_id.bytes
+
+        if len(self._strategy) >= self.segment_size:
+            self.flush()
+
+    def extend(self, records: Iterable[Explanation]):
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        stored = sum(segment["count"] for segment in self.segments)
+        return stored + len(self._strategy)
+
+    # -----------------------------
+    # Flush
+    # -----------------------------
+
+    def flush(self):
+        """
+        Writes buffered records as a new segment.
+        """
+
+        count = len(self._strategy)
+        if count == 0:
+            return
+
+        columns = {
+            "strategy": np.frombuffer(self._strategy, dtype=np.uint8),
+            "timestamp_us": np.frombuffer(self._timestamps, dtype=np.int64),
+            "decision_id": np.frombuffer(
+                bytes(self._ids), dtype=np.uint8
+            ).reshape(count, 16),
+        }
+        for name, values in self._floats.items():
+            columns[name] = np.frombuffer(values, dtype=np.float64)
+
+        name = f"segment-{len(self.segments):06d}.npz"
+        np.savez(self.directory / name, **columns)
+
+        segment = {
+            "file": name,
+            "count": count,
+            "start_us": int(columns["timestamp_us"].min()),
+            "end_us": int(columns["timestamp_us"].max()),
+            "strategies": sorted(set(self._strategy)),
+        }
+        with (self.directory / MANIFEST_NAME).open(
+            "a", encoding="utf-8"
+        ) as f:
+            f.write(json.dumps(segment) + "\n")
+
+        self.segments.append(segment)
+        self._reset_buffer()
+
+    # -----------------------------
+    # Query
+    # -----------------------------
+
+    def query(
+        self,
+        strategy: Optional[Strategy] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Iterable[str] = COLUMNS,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Returns the requested columns for flushed records
+        matching strategy and the inclusive [start, end] range.
+        """
+
+        columns = tuple(columns)
+        code = STRATEGY_CODES[strategy] if strategy is not None else None
+        start_us = epoch_us(start) if start is not None else None
+        end_us = epoch_us(end) if end is not None else None
+
+        parts: Dict[str, List[np.ndarray]] = {name: [] for name in columns}
+
+        for segment in self.segments:
+            if code is not None and code not in segment["strategies"]:
+                continue
+            if start_us is not None and segment["end_us"] < start_us:
+                continue
+            if end_us is not None and segment["start_us"] > end_us:
+                continue
+
+            with np.load(self.directory / segment["file"]) as data:
+                mask = np.ones(segment["count"], dtype=bool)
+                if code is not None:
+                    mask &= data["strategy"] == code
+                if start_us is not None or end_us is not None:
+                    timestamps = data["timestamp_us"]
+                    if start_us is not None:
+                        mask &= timestamps >= start_us
+                    if end_us is not None:
+                        mask &= timestamps <= end_us
+
+                for name in columns:
+                    parts[name].append(data[name][mask])
+
+        return {
+            name: (
+                np.concatenate(arrays) if arrays
+                else _empty_column(name)
+            )
+            for name, arrays in parts.items()
+        }
+
+    # -----------------------------
+    # Audit access
+    # -----------------------------
+
+    @staticmethod
+    def materialize(
+        columns: Dict[str, np.ndarray], index: int
+    ) -> ExplanationRecord:
+        """
+        Rebuilds the ExplanationRecord stored at one row
+        of a full-column query result.
+        """
+
+        strategy = STRATEGIES_BY_CODE[int(columns["strategy"][index])]
+        values = tuple(
+            float(columns[name][index]) for name in STATE_DIMENSIONS
+        )
+
+        return ExplanationRecord(
+            trigger=DEFAULT_TRIGGER,
+            strategy_selected=strategy,
+            state_snapshot=render_state_snapshot(values),
+            state_summary=render_state_summary(values),
+            action_summary=render_action_summary(strategy),
+            expected_outcome=DEFAULT_EXPECTED_OUTCOME,
+            reversal_condition=DEFAULT_REVERSAL_CONDITION,
+            decision_confidence=float(columns["confidence"][index]),
+            decision_id=str(
+                UUID(bytes=columns["decision_id"][index].tobytes())
+            ),
+            timestamp=from_epoch_us(
+                columns["timestamp_us"][index]
+            ).replace(tzinfo=UTC),
+        )
+
+
+def _empty_column(name: str) -> np.ndarray:
+    if name == "strategy":
+        return np.empty(0, dtype=np.uint8)
+    if name == "timestamp_us":
+        return np.empty(0, dtype=np.int64)
+    if name == "decision_id":
+        return np.empty((0, 16), dtype=np.uint8)
+    return np.empty(0, dtype=np.float64)
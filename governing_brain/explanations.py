@@ -11,14 +11,79 @@ Explanations are immutable records intended for:
 - Long-term analysis
 """
 
-from dataclasses import dataclass, field
+import math
+import time
+from dataclasses import FrozenInstanceError, dataclass, field
 from datetime import datetime, UTC
-from typing import Dict, Any
-from uuid import uuid4
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+from uuid import UUID, uuid4
 
 from governing_brain.strategies import Strategy
 
 
+# =========================================================
+# Shared Rendering
+# =========================================================
+
+# State values are passed in BehavioralState field order:
+# (discipline_level, failure_risk, avoidance_tendency,
+#  fatigue_index, context_importance, momentum_trend)
+StateValues = Tuple[float, float, float, float, float, float]
+
+DEFAULT_TRIGGER = "Policy evaluation based on behavioral state"
+DEFAULT_EXPECTED_OUTCOME = "Improved long-term behavioral stability"
+DEFAULT_REVERSAL_CONDITION = "State variables return to safe ranges"
+
+
+def render_state_snapshot(values: StateValues) -> Dict[str, Any]:
+    discipline, failure, avoidance, fatigue, context, momentum = values
+    return {
+        "discipline_level": discipline,
+        "failure_risk": failure,
+        "fatigue_index": fatigue,
+        "avoidance_tendency": avoidance,
+        "context_importance": context,
+        "momentum_trend": momentum,
+    }
+
+
+def render_state_summary(values: StateValues) -> str:
+    discipline, failure, avoidance, fatigue, context, momentum = values
+    return (
+        f"failure_risk={failure}, "
+        f"fatigue_index={fatigue}, "
+        f"avoidance_tendency={avoidance}, "
+        f"context_importance={context}, "
+        f"discipline_level={discipline}, "
+        f"momentum_trend={momentum}"
+    )
+
+
+def render_action_summary(strategy: Strategy) -> str:
+    return f"Selected {strategy.value} strategy"
+
+
+def render_summary(
+    trigger: str,
+    strategy: Strategy,
+    action_summary: str,
+    expected_outcome: str,
+    confidence: float,
+) -> str:
+    return (
+        f"Trigger='{trigger}' | "
+        f"Strategy={strategy.value} | "
+        f"Action='{action_summary}' | "
+        f"Expected='{expected_outcome}' | "
+        f"Confidence={confidence:.2f}"
+    )
+
+
+# =========================================================
+# Explanation Record
+# =========================================================
+
 @dataclass(frozen=True)
 class ExplanationRecord:
     """
@@ -56,10 +121,166 @@ class ExplanationRecord:
         Human-readable one-line explanation summary.
         Intended for logs, CLI output, and UI surfaces.
         """
-        return (
-            f"Trigger='{self.trigger}' | "
-            f"Strategy={self.strategy_selected.value} | "
-            f"Action='{self.action_summary}' | "
-            f"Expected='{self.expected_outcome}' | "
-            f"Confidence={self.decision_confidence:.2f}"
+        return render_summary(
+            self.trigger,
+            self.strategy_selected,
+            self.action_summary,
+            self.expected_outcome,
+            self.decision_confidence,
         )
+
+
+# =========================================================
+# Lazy Explanation Record
+# =========================================================
+
+class LazyExplanationRecord:
+    """
+    Deferred ExplanationRecord for the default policy trigger.
+
+    Holds the strategy, a tuple of state values and the
+    decision time. Strings, snapshot, decision id and timestamp
+    are rendered on first access and match ExplanationRecord
+    output exactly.
+
+    Immutable like ExplanationRecord: attributes cannot be set
+    and state_snapshot is a read-only mapping.
+    """
+
+    __slots__ = (
+        "strategy_selected",
+        "decision_confidence",
+        "_state",
+        "_created",
+        "_uuid",
+        "_decision_id",
+        "_timestamp",
+        "_snapshot",
+    )
+
+    trigger = DEFAULT_TRIGGER
+    expected_outcome = DEFAULT_EXPECTED_OUTCOME
+    reversal_condition = DEFAULT_REVERSAL_CONDITION
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        state: StateValues,
+        decision_confidence: float = 1.0,
+    ):
+        init = object.__setattr__
+        init(self, "strategy_selected", strategy)
+        init(self, "decision_confidence", decision_confidence)
+        init(self, "_state", state)
+        init(self, "_created", time.time())
+        # Filled once on first access
+        init(self, "_uuid", None)
+        init(self, "_decision_id", None)
+        init(self, "_timestamp", None)
+        init(self, "_snapshot", None)
+
+    def __setattr__(self, name: str, value: Any):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    # -----------------------------
+    # Raw decision data
+    # -----------------------------
+
+    @property
+    def state_values(self) -> StateValues:
+        return self._state
+
+    @property
+    def created_at(self) -> float:
+        """
+        Decision time as POSIX seconds.
+        """
+        return self._created
+
+    @property
+    def decision_uuid(self) -> UUID:
+        """
+        Decision id as a UUID, without rendering the string.
+        """
+        if self._uuid is None:
+            object.__setattr__(self, "_uuid", uuid4())
+        return self._uuid
+
+    @property
+    def timestamp_us(self) -> int:
+        """
+        Decision time in epoch microseconds, rounded exactly
+        as datetime.fromtimestamp rounds it for `timestamp`.
+        """
+        seconds = math.floor(self._created)
+        return seconds * 1_000_000 + round((self._created - seconds) * 1e6)
+
+    # -----------------------------
+    # Rendered on access
+    # -----------------------------
+
+    @property
+    def state_snapshot(self) -> Mapping[str, Any]:
+        if self._snapshot is None:
+            object.__setattr__(
+                self,
+                "_snapshot",
+                MappingProxyType(render_state_snapshot(self._state)),
+            )
+        return self._snapshot
+
+    @property
+    def state_summary(self) -> str:
+        return render_state_summary(self._state)
+
+    @property
+    def action_summary(self) -> str:
+        return render_action_summary(self.strategy_selected)
+
+    @property
+    def decision_id(self) -> str:
+        if self._decision_id is None:
+            object.__setattr__(self, "_decision_id", str(self.decision_uuid))
+        return self._decision_id
+
+    @property
+    def timestamp(self) -> datetime:
+        if self._timestamp is None:
+            object.__setattr__(
+                self, "_timestamp", datetime.fromtimestamp(self._created, UTC)
+            )
+        return self._timestamp
+
+    @property
+    def summary(self) -> str:
+        return render_summary(
+            self.trigger,
+            self.strategy_selected,
+            self.action_summary,
+            self.expected_outcome,
+            self.decision_confidence,
+        )
+
+    def materialize(self) -> ExplanationRecord:
+        """
+        Returns the equivalent eager ExplanationRecord.
+        """
+        return ExplanationRecord(
+            trigger=self.trigger,
+            strategy_selected=self.strategy_selected,
+            state_snapshot=render_state_snapshot(self._state),
+            state_summary=self.state_summary,
+            action_summary=self.action_summary,
+            expected_outcome=self.expected_outcome,
+            reversal_condition=self.reversal_condition,
+            decision_confidence=self.decision_confidence,
+            decision_id=self.decision_id,
+            timestamp=self.timestamp,
+        )
+
+
+# Either record type; both expose the same read interface.
+Explanation = ExplanationRecord | LazyExplanationRecord
@@ -9,10 +9,36 @@ It enforces input validity and normalization.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, UTC
 from typing import Optional, List
 
 
+# =========================================================
+# Epoch Timestamps
+# =========================================================
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+NAIVE_EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def epoch_us(timestamp: datetime) -> int:
+    """
+    Microseconds since the epoch. Naive datetimes are UTC,
+    as produced by SignalBatch's defaults.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return (timestamp - EPOCH) // MICROSECOND
+
+
+def from_epoch_us(value: int) -> datetime:
+    """
+    Naive UTC datetime for an epoch-microsecond timestamp.
+    """
+    return NAIVE_EPOCH + timedelta(microseconds=int(value))
+
+
 # =========================================================
 # Signal Definition
 # =========================================================
@@ -8,7 +8,7 @@ Directives are immutable, validated, and bounded.
 """
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Sequence
 
 from governing_brain.strategies import Strategy
 
@@ -18,11 +18,15 @@ class GovernanceDirective:
     """
     Represents abstract control directives
     emitted by the Governing Brain.
+
+    allowed_capabilities accepts any sequence of strings and
+    is stored as a normalized tuple (it was a list before
+    directives were interned and shared by GoverningBrain).
     """
 
     strategy: Strategy
     required_strictness: float
-    allowed_capabilities: List[str]
+    allowed_capabilities: Sequence[str]
     escalation_limit: float
     recovery_allowed: bool
     explanation_required: bool
@@ -49,4 +53,7 @@ class GovernanceDirective:
                 raise ValueError("allowed_capabilities must be non-empty strings")
             normalized_caps.append(cap.strip().lower())
 
-        object.__setattr__(self, "allowed_capabilities", normalized_caps)
+        # Stored as a tuple so interned directives stay immutable
+        object.__setattr__(
+            self, "allowed_capabilities", tuple(normalized_caps)
+        )
@@ -0,0 +1,102 @@
+"""
+batch_router.py
+
+Vectorized counterpart of router.select_strategy.
+
+Evaluates every governance policy over arrays of states
+and keeps the explicit first-match-wins priority order
+of POLICY_PIPELINE.
+
+Design principles:
+- Masks are generated from DEFAULT_RULES, which mirrors the
+  scalar policies
+- Deterministic
+- One vectorized call per population
+
+Requires NumPy.
+"""
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+from governing_brain.policies.rules import Rule, policy_rules
+from governing_brain.state_array import BehavioralStateArray
+from governing_brain.strategies import Strategy, STRATEGY_CODES
+
+
+# =========================================================
+# Policy Masks (generated from the rules mirroring policies/*.py)
+# =========================================================
+
+MaskFn = Callable[[BehavioralStateArray], np.ndarray]
+
+_COMPARISONS = {
+    ">=": np.greater_equal,
+    "<=": np.less_equal,
+    ">": np.greater,
+    "<": np.less,
+}
+
+
+def compile_mask(rules: Tuple[Rule, ...]) -> MaskFn:
+    """
+    Vectorized PolicyFn: True where any of the rules matches.
+    """
+
+    compiled = tuple(
+        tuple(
+            (condition.field, _COMPARISONS[condition.op], condition.threshold)
+            for condition in rule.conditions
+        )
+        for rule in rules
+    )
+
+    def mask(s: BehavioralStateArray) -> np.ndarray:
+        matched = np.zeros(len(s), dtype=bool)
+        for conditions in compiled:
+            rule_matched = np.ones(len(s), dtype=bool)
+            for name, compare, threshold in conditions:
+                rule_matched &= compare(getattr(s, name), threshold)
+            matched |= rule_matched
+        return matched
+
+    mask.__rules__ = rules
+    return mask
+
+
+burnout_mask = compile_mask(policy_rules("burnout"))
+early_support_mask = compile_mask(policy_rules("support"))
+context_guard_mask = compile_mask(policy_rules("context"))
+enforcement_mask = compile_mask(policy_rules("enforcement"))
+
+
+# =========================================================
+# Explicit Policy Priority Order (same as POLICY_PIPELINE)
+# =========================================================
+
+BATCH_POLICY_PIPELINE: Tuple[Tuple[MaskFn, Strategy], ...] = (
+    (burnout_mask, Strategy.SUPPORT),              # Human safety override
+    (early_support_mask, Strategy.SUPPORT),        # Burnout prevention
+    (context_guard_mask, Strategy.STABILIZATION),  # Situational cost
+    (enforcement_mask, Strategy.ENFORCEMENT),      # Discipline enforcement
+)
+
+
+# =========================================================
+# Batch Strategy Router
+# =========================================================
+
+def select_strategy_batch(states: BehavioralStateArray) -> np.ndarray:
+    """
+    Returns a uint8 array of strategy codes (see STRATEGY_CODES),
+    one per state, using first-match-wins priority.
+
+    Fallback strategy is STABILIZATION.
+    """
+
+    return np.select(
+        [mask(states) for mask, _ in BATCH_POLICY_PIPELINE],
+        [STRATEGY_CODES[strategy] for _, strategy in BATCH_POLICY_PIPELINE],
+        default=STRATEGY_CODES[Strategy.STABILIZATION],
+    ).astype(np.uint8)
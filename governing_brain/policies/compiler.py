@@ -0,0 +1,128 @@
+"""
+compiler.py
+
+Compiles declarative policy rules into a single,
+flat decision function with thresholds inlined.
+
+Design principles:
+- Same first-match-wins semantics as select_strategy
+- No per-policy calls or None checks
+- Generated source is kept for auditing
+"""
+
+import math
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from governing_brain.state_model import BehavioralState, STATE_DIMENSIONS
+from governing_brain.strategies import Strategy
+from governing_brain.policies.rules import (
+    DEFAULT_RULES,
+    FALLBACK_STRATEGY,
+    Rule,
+    resolve_rules,
+)
+
+
+CompiledRouter = Callable[[BehavioralState], Strategy]
+
+
+# =========================================================
+# Source Generation
+# =========================================================
+
+def _threshold_literal(value: float) -> str:
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"Policy thresholds must be finite, got {value}")
+    # repr() round-trips floats exactly
+    return repr(value)
+
+
+def generate_router_source(
+    rules: Tuple[Rule, ...] = DEFAULT_RULES,
+    parameters: Optional[Mapping[str, float]] = None,
+    fallback: Optional[Strategy] = FALLBACK_STRATEGY,
+    function_name: str = "compiled_select_strategy",
+) -> str:
+    """
+    Generates Python source for a decision function.
+
+    parameters may override any threshold by its rule
+    parameter name; unrelated keys are ignored.
+    fallback=None generates a policy that returns None
+    when no rule matches.
+    """
+
+    lines: List[str] = [f"def {function_name}(state):"]
+
+    for rule in resolve_rules(rules, parameters):
+        clauses = []
+        for condition in rule.conditions:
+            if condition.field not in STATE_DIMENSIONS:
+                raise ValueError(
+                    f"Rule {rule.name} references unknown field "
+                    f"{condition.field}"
+                )
+            clauses.append(
+                f"state.{condition.field} {condition.op} "
+                f"{_threshold_literal(condition.threshold)}"
+            )
+
+        lines.append(f"    # {rule.name}")
+        lines.append(f"    if {' and '.join(clauses)}:")
+        lines.append(f"        return {rule.strategy.name}")
+
+    lines.append(
+        f"    return {fallback.name if fallback is not None else None}"
+    )
+    return "\n".join(lines) + "\n"
+
+
+# =========================================================
+# Compilation
+# =========================================================
+
+def _compile(source: str, function_name: str):
+    namespace: Dict[str, object] = {s.name: s for s in Strategy}
+    exec(compile(source, f"<compiled {function_name}>", "exec"), namespace)
+
+    function = namespace[function_name]
+    function.__source__ = source
+    return function
+
+
+def compile_router(
+    rules: Tuple[Rule, ...] = DEFAULT_RULES,
+    parameters: Optional[Mapping[str, float]] = None,
+    fallback: Strategy = FALLBACK_STRATEGY,
+) -> CompiledRouter:
+    """
+    Compiles rules into a drop-in replacement for select_strategy.
+
+    The generated source is available as the function's
+    __source__ attribute, and the resolved rules as __rules__.
+    """
+
+    rules = resolve_rules(rules, parameters)
+    router = _compile(
+        generate_router_source(rules, None, fallback),
+        "compiled_select_strategy",
+    )
+    router.__rules__ = rules
+    return router
+
+
+def compile_policy(
+    rules: Tuple[Rule, ...], function_name: str
+) -> Callable[[BehavioralState], Optional[Strategy]]:
+    """
+    Compiles one policy's rules into a PolicyFn: the first
+    matching rule's strategy, or None.
+    """
+
+    policy = _compile(
+        generate_router_source(rules, None, None, function_name),
+        function_name,
+    )
+    policy.__rules__ = rules
+    return policy
@@ -0,0 +1,330 @@
+"""
+lookup_table.py
+
+Precomputed strategy lookup table (offline build).
+
+Policies only compare state fields against fixed thresholds.
+Each field is mapped onto its threshold cell: the open span
+between two consecutive thresholds, or a threshold itself.
+Every state inside one 6D cell satisfies exactly the same
+policy comparisons, so evaluating the router once per cell
+yields a compact uint8 table that is exact for every state,
+not just states on the 0.05 threshold grid.
+
+Design guarantees:
+- Table entries come from the live router
+- Tables carry a fingerprint of the rules they were built from
+  (DEFAULT_RULES mirrors the live policies, so the
+  fingerprint covers select_strategy too)
+- Stale tables are rejected on load
+"""
+
+import hashlib
+import json
+import math
+import mmap
+import random
+import struct
+from bisect import bisect_right
+from itertools import product
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from governing_brain.state_model import BehavioralState, STATE_DIMENSIONS
+from governing_brain.strategies import (
+    Strategy,
+    STRATEGIES_BY_CODE,
+    STRATEGY_CODES,
+)
+from governing_brain.policies.compiler import (
+    compile_router,
+    generate_router_source,
+)
+from governing_brain.policies.router import select_strategy
+from governing_brain.policies.rules import (
+    DEFAULT_RULES,
+    Rule,
+    field_thresholds,
+)
+
+
+# =========================================================
+# Table Format
+# =========================================================
+
+# Policy thresholds sit on this grid; validation samples it
+GRID_STEP = 0.05
+
+FIELD_RANGES: Dict[str, Tuple[float, float]] = {
+    name: ((-1.0, 1.0) if name == "momentum_trend" else (0.0, 1.0))
+    for name in STATE_DIMENSIONS
+}
+
+TABLE_MAGIC = b"ASMLUT1\n"
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+def rules_fingerprint(rules: Tuple[Rule, ...] = DEFAULT_RULES) -> str:
+    """
+    Stable hash of the rule set (fields, operators,
+    thresholds, strategies and priority order).
+    """
+    source = generate_router_source(rules)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _rules_router(
+    rules: Tuple[Rule, ...]
+) -> Callable[[BehavioralState], Strategy]:
+    # DEFAULT_RULES mirrors select_strategy's policies
+    return select_strategy if rules is DEFAULT_RULES else compile_router(rules)
+
+
+def cell_boundaries(thresholds: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    Boundaries such that bisect_right(boundaries, value) is the
+    value's cell among sorted thresholds: even = open span
+    (2 * thresholds below), odd = exactly on a threshold.
+    """
+    return tuple(
+        bound
+        for t in thresholds
+        for bound in (t, math.nextafter(t, math.inf))
+    )
+
+
+def cell_representative(cell: int, thresholds: Tuple[float, ...]) -> float:
+    """
+    A value lying inside the given cell.
+    """
+
+    if cell % 2:
+        return thresholds[cell // 2]
+    if not thresholds:
+        return 0.0
+
+    span = cell // 2
+    if span == 0:
+        return thresholds[0] - GRID_STEP / 2
+    if span == len(thresholds):
+        return thresholds[-1] + GRID_STEP / 2
+    return (thresholds[span - 1] + thresholds[span]) / 2
+
+
+# =========================================================
+# Lookup Table
+# =========================================================
+
+class StrategyLookupTable:
+    """
+    uint8 strategy codes indexed by threshold cells.
+
+    Instances are callable and can replace select_strategy
+    as a GoverningBrain router.
+    """
+
+    def __init__(
+        self,
+        rules: Tuple[Rule, ...],
+        table,
+        fingerprint: Optional[str] = None,
+    ):
+        thresholds = field_thresholds(rules)
+        self.thresholds: Tuple[Tuple[float, ...], ...] = tuple(
+            thresholds.get(name, ()) for name in STATE_DIMENSIONS
+        )
+        self.boundaries = tuple(cell_boundaries(t) for t in self.thresholds)
+        self.fingerprint = fingerprint or rules_fingerprint(rules)
+        self.__rules__ = rules
+
+        # Row-major strides over per-field cell counts
+        self.shape = tuple(2 * len(t) + 1 for t in self.thresholds)
+        strides: List[int] = []
+        size = 1
+        for count in reversed(self.shape):
+            strides.insert(0, size)
+            size *= count
+        self.strides = tuple(strides)
+
+        if len(table) != size:
+            raise ValueError(
+                f"Lookup table has {len(table)} entries, expected {size}"
+            )
+        self.table = table
+
+    # -----------------------------
+    # Build
+    # -----------------------------
+
+    @classmethod
+    def build(
+        cls,
+        rules: Tuple[Rule, ...] = DEFAULT_RULES,
+        router: Optional[Callable[[BehavioralState], Strategy]] = None,
+    ) -> "StrategyLookupTable":
+        """
+        Evaluates the router once per threshold cell.
+
+        The router defaults to select_strategy for DEFAULT_RULES
+        and to the compiled rules otherwise.
+        """
+
+        if router is None:
+            router = _rules_router(rules)
+
+        thresholds = field_thresholds(rules)
+        per_field = [thresholds.get(name, ()) for name in STATE_DIMENSIONS]
+
+        table = bytearray()
+        for cells in product(*(range(2 * len(t) + 1) for t in per_field)):
+            state = BehavioralState(*(
+                cell_representative(cell, t)
+                for cell, t in zip(cells, per_field)
+            ))
+            table.append(STRATEGY_CODES[router(state)])
+
+        return cls(rules, bytes(table))
+
+    # -----------------------------
+    # Lookup
+    # -----------------------------
+
+    def index_of(self, state: BehavioralState) -> int:
+        cell = bisect_right
+        b0, b1, b2, b3, b4, b5 = self.boundaries
+        s0, s1, s2, s3, s4, s5 = self.strides
+        return (
+            cell(b0, state.discipline_level) * s0
+            + cell(b1, state.failure_risk) * s1
+            + cell(b2, state.avoidance_tendency) * s2
+            + cell(b3, state.fatigue_index) * s3
+            + cell(b4, state.context_importance) * s4
+            + cell(b5, state.momentum_trend) * s5
+        )
+
+    def lookup_code(self, state: BehavioralState) -> int:
+        return self.table[self.index_of(state)]
+
+    def lookup(self, state: BehavioralState) -> Strategy:
+        return STRATEGIES_BY_CODE[self.table[self.index_of(state)]]
+
+    __call__ = lookup
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    # -----------------------------
+    # Validation
+    # -----------------------------
+
+    def validate(
+        self,
+        router: Optional[Callable[[BehavioralState], Strategy]] = None,
+        samples: int = 100_000,
+        seed: int = 0,
+    ) -> int:
+        """
+        Compares the table with a live router on random states,
+        half of them drawn on the 0.05 grid where thresholds sit.
+        The router defaults to the one generated from the table's
+        rules. Returns the mismatch count.
+        """
+
+        if router is None:
+            router = _rules_router(self.__rules__)
+        rng = random.Random(seed)
+        mismatches = 0
+
+        for i in range(samples):
+            values = []
+            for name in STATE_DIMENSIONS:
+                low, high = FIELD_RANGES[name]
+                if i % 2:
+                    steps = round((high - low) / GRID_STEP)
+                    values.append(
+                        round(low + rng.randint(0, steps) * GRID_STEP, 2)
+                    )
+                else:
+                    values.append(rng.uniform(low, high))
+            state = BehavioralState(*values)
+            if self.lookup(state) != router(state):
+                mismatches += 1
+
+        return mismatches
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+
+    def save(self, path: str):
+        header = json.dumps({
+            "fingerprint": self.fingerprint,
+            "entries": len(self.table),
+        }).encode("utf-8")
+
+        with Path(path).open("wb") as f:
+            f.write(TABLE_MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header)))
+            f.write(header)
+            f.write(self.table)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        rules: Tuple[Rule, ...] = DEFAULT_RULES,
+    ) -> "StrategyLookupTable":
+        """
+        Memory-maps a saved table. Raises ValueError if it
+        was built from different rules.
+        """
+
+        with Path(path).open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapped)
+        if bytes(view[:len(TABLE_MAGIC)]) != TABLE_MAGIC:
+            raise ValueError(f"{path} is not a strategy lookup table")
+
+        offset = len(TABLE_MAGIC)
+        (header_length,) = _HEADER_LENGTH.unpack_from(view, offset)
+        offset += _HEADER_LENGTH.size
+        header = json.loads(bytes(view[offset:offset + header_length]))
+        offset += header_length
+
+        if header["fingerprint"] != rules_fingerprint(rules):
+            raise ValueError(
+                f"{path} was built from different policy rules; rebuild it"
+            )
+
+        return cls(rules, view[offset:], fingerprint=header["fingerprint"])
+
+    @classmethod
+    def load_or_build(
+        cls,
+        path: str,
+        rules: Tuple[Rule, ...] = DEFAULT_RULES,
+    ) -> "StrategyLookupTable":
+        """
+        Loads the table at path, rebuilding and saving it when
+        missing or stale.
+        """
+        try:
+            return cls.load(path, rules)
+        except (FileNotFoundError, ValueError):
+            table = cls.build(rules)
+            table.save(path)
+            return table
+
+
+if __name__ == "__main__":
+    import sys
+
+    output = sys.argv[1] if len(sys.argv) > 1 else "strategy_table.bin"
+    lookup_table = StrategyLookupTable.build()
+    mismatches = lookup_table.validate()
+    lookup_table.save(output)
+    print(
+        f"Wrote {len(lookup_table)} entries to {output} "
+        f"({mismatches} mismatches against select_strategy)"
+    )
@@ -0,0 +1,248 @@
+"""
+rules.py
+
+Declarative description of the governance policies.
+
+Each rule is a conjunction of threshold conditions over
+BehavioralState fields. Rules are listed in explicit
+priority order (first-match-wins), mirroring POLICY_PIPELINE.
+
+DEFAULT_RULES mirrors the hand-written policies (policies/*.py),
+which remain the specification. The compiled router and the
+batch router masks are generated from it; tests check that
+they agree with the policies.
+
+This module contains NO evaluation logic.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, Mapping, Optional, Tuple
+
+from governing_brain.strategies import Strategy
+
+
+# =========================================================
+# Rule Data Model
+# =========================================================
+
+COMPARISON_SUFFIXES: Dict[str, str] = {
+    ">=": "min",
+    "<=": "max",
+    ">": "above",
+    "<": "below",
+}
+
+
+@dataclass(frozen=True)
+class Condition:
+    """
+    Single threshold comparison: state.<field> <op> threshold.
+    """
+
+    field: str
+    op: str
+    threshold: float
+
+    def __post_init__(self):
+        if self.op not in COMPARISON_SUFFIXES:
+            raise ValueError(f"Unsupported comparison operator: {self.op}")
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    Conjunction of conditions selecting a strategy.
+    """
+
+    name: str
+    conditions: Tuple[Condition, ...]
+    strategy: Strategy
+
+    def __post_init__(self):
+        if not self.name or not self.name.isprintable():
+            raise ValueError("Rule name must be a non-empty printable string")
+
+    def parameter_name(self, condition: Condition) -> str:
+        """
+        Stable parameter key for one threshold,
+        e.g. 'burnout.acute_overload.failure_risk_min'.
+        """
+        return (
+            f"{self.name}.{condition.field}_"
+            f"{COMPARISON_SUFFIXES[condition.op]}"
+        )
+
+
+# =========================================================
+# Policy Rules (priority order)
+# =========================================================
+
+DEFAULT_RULES: Tuple[Rule, ...] = (
+    # -------------------------------------------------
+    # burnout.py — Human safety override
+    # -------------------------------------------------
+    Rule(
+        name="burnout.acute_overload",
+        conditions=(
+            Condition("failure_risk", ">=", 0.6),
+            Condition("fatigue_index", ">=", 0.6),
+        ),
+        strategy=Strategy.SUPPORT,
+    ),
+    Rule(
+        name="burnout.downward_spiral",
+        conditions=(
+            Condition("fatigue_index", ">=", 0.7),
+            Condition("momentum_trend", "<=", -0.3),
+        ),
+        strategy=Strategy.SUPPORT,
+    ),
+    Rule(
+        name="burnout.discipline_erosion",
+        conditions=(
+            Condition("discipline_level", "<=", 0.3),
+            Condition("fatigue_index", ">=", 0.6),
+        ),
+        strategy=Strategy.SUPPORT,
+    ),
+    Rule(
+        name="burnout.avoidance_under_load",
+        conditions=(
+            Condition("avoidance_tendency", ">=", 0.6),
+            Condition("fatigue_index", ">=", 0.5),
+        ),
+        strategy=Strategy.SUPPORT,
+    ),
+    # -------------------------------------------------
+    # support.py — Burnout prevention
+    # -------------------------------------------------
+    Rule(
+        name="support.pre_burnout",
+        conditions=(
+            Condition("failure_risk", ">=", 0.45),
+            Condition("failure_risk", "<", 0.6),
+            Condition("fatigue_index", ">=", 0.45),
+            Condition("fatigue_index", "<", 0.6),
+            Condition("discipline_level", ">=", 0.4),
+            Condition("avoidance_tendency", "<=", 0.5),
+        ),
+        strategy=Strategy.SUPPORT,
+    ),
+    Rule(
+        name="support.negative_momentum",
+        conditions=(
+            Condition("momentum_trend", "<=", -0.2),
+            Condition("fatigue_index", ">=", 0.45),
+            Condition("discipline_level", ">=", 0.35),
+            Condition("avoidance_tendency", "<=", 0.5),
+        ),
+        strategy=Strategy.SUPPORT,
+    ),
+    # -------------------------------------------------
+    # context.py — Situational cost protection
+    # -------------------------------------------------
+    Rule(
+        name="context.low_stakes",
+        conditions=(
+            Condition("context_importance", "<=", 0.4),
+            Condition("failure_risk", "<=", 0.5),
+            Condition("fatigue_index", "<=", 0.6),
+            Condition("avoidance_tendency", "<=", 0.5),
+        ),
+        strategy=Strategy.STABILIZATION,
+    ),
+    # -------------------------------------------------
+    # enforcement.py — Discipline enforcement
+    # -------------------------------------------------
+    Rule(
+        name="enforcement.intentional_avoidance",
+        conditions=(
+            Condition("avoidance_tendency", ">=", 0.65),
+            Condition("context_importance", ">=", 0.6),
+            Condition("fatigue_index", "<=", 0.45),
+            Condition("discipline_level", ">=", 0.4),
+            Condition("momentum_trend", ">=", -0.15),
+            Condition("failure_risk", ">=", 0.4),
+        ),
+        strategy=Strategy.ENFORCEMENT,
+    ),
+)
+
+FALLBACK_STRATEGY = Strategy.STABILIZATION
+
+
+# =========================================================
+# Parameter Views
+# =========================================================
+
+def policy_rules(
+    policy: str, rules: Tuple[Rule, ...] = DEFAULT_RULES
+) -> Tuple[Rule, ...]:
+    """
+    Rules of one policy module, by name prefix
+    (e.g. 'burnout' -> 'burnout.*'), in priority order.
+    """
+    prefix = f"{policy}."
+    selected = tuple(rule for rule in rules if rule.name.startswith(prefix))
+    if not selected:
+        raise ValueError(f"No rules for policy {policy!r}")
+    return selected
+
+
+def rule_parameters(
+    rules: Tuple[Rule, ...] = DEFAULT_RULES,
+) -> Dict[str, float]:
+    """
+    Returns every rule threshold keyed by its parameter name.
+    """
+    return {
+        rule.parameter_name(condition): condition.threshold
+        for rule in rules
+        for condition in rule.conditions
+    }
+
+
+def resolve_rules(
+    rules: Tuple[Rule, ...] = DEFAULT_RULES,
+    parameters: Optional[Mapping[str, float]] = None,
+) -> Tuple[Rule, ...]:
+    """
+    Returns rules with thresholds overridden by matching
+    parameter names. Unrelated parameters are ignored.
+    """
+
+    if not parameters:
+        return rules
+
+    return tuple(
+        replace(rule, conditions=tuple(
+            replace(
+                condition,
+                threshold=float(parameters.get(
+                    rule.parameter_name(condition), condition.threshold
+                )),
+            )
+            for condition in rule.conditions
+        ))
+        for rule in rules
+    )
+
+
+def field_thresholds(
+    rules: Tuple[Rule, ...] = DEFAULT_RULES,
+) -> Dict[str, Tuple[float, ...]]:
+    """
+    Returns the sorted, distinct thresholds compared
+    against each state field.
+    """
+
+    thresholds: Dict[str, set] = {}
+    for rule in rules:
+        for condition in rule.conditions:
+            thresholds.setdefault(condition.field, set()).add(
+                condition.threshold
+            )
+
+    return {
+        name: tuple(sorted(values)) for name, values in thresholds.items()
+    }
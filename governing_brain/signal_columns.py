@@ -0,0 +1,351 @@
+"""
+signal_columns.py
+
+Columnar signal batches for high-volume telemetry ingestion.
+
+A SignalColumns batch holds the same information as a
+SignalBatch in parallel arrays instead of one frozen
+Signal per observation. Names are interned: each distinct
+name is normalized once and signals carry its code.
+Batches built from_codes use the signal registry's codes
+directly and skip name handling entirely.
+
+Design guarantees:
+- Same validation rules as Signal / SignalBatch, run vectorized
+- update_state accepts SignalColumns directly
+- Bit-identical state updates (sequential accumulation order)
+
+Requires NumPy. The scalar core does not import this module.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from governing_brain.inputs import (
+    Signal,
+    SignalBatch,
+    epoch_us,
+    from_epoch_us,
+)
+from governing_brain.signal_registry import (
+    EFFECTS_BY_CODE,
+    SIGNAL_CODES,
+    SIGNAL_NAMES,
+)
+from governing_brain.state_model import (
+    NO_EFFECT,
+    SIGNAL_EFFECTS,
+    STATE_DIMENSIONS,
+)
+from governing_brain.wire_format import (
+    HEADER,
+    WIRE_MAGIC,
+    decode_header,
+)
+
+
+# (registered signals x dimensions) deltas, indexed by registry code
+REGISTRY_EFFECTS = np.array(EFFECTS_BY_CODE, dtype=np.float64)
+
+UNREGISTERED_CODE = -1
+
+# wire_format.RECORD as a packed NumPy record type
+WIRE_RECORD_DTYPE = np.dtype([
+    ("code", "<u2"),
+    ("value", "<f8"),
+    ("confidence", "<f8"),
+    ("timestamp_us", "<i8"),
+])
+
+
+# =========================================================
+# Signal Columns
+# =========================================================
+
+@dataclass(frozen=True)
+class SignalColumns:
+    """
+    Signals observed over a decision window, stored as
+    parallel arrays.
+
+    Columns (one entry per signal):
+    - codes: int32 index into names
+    - values: float64
+    - confidences: float64
+    - timestamps_us: int64 microseconds since the epoch (UTC)
+    """
+
+    names: Tuple[str, ...]
+    codes: np.ndarray
+    values: np.ndarray
+    confidences: np.ndarray
+    timestamps_us: np.ndarray
+    window_start_us: int
+    window_end_us: int
+
+    def __post_init__(self):
+        # ----- Vocabulary: normalize each distinct name once -----
+        codes = np.ascontiguousarray(self.codes, dtype=np.int32)
+        normalized = self.names
+        if normalized is not SIGNAL_NAMES:
+            normalized = tuple(name.strip().lower() for name in self.names)
+            if not all(normalized):
+                raise ValueError("Signal name must be a non-empty string")
+
+            if len(set(normalized)) != len(normalized):
+                # Distinct raw names that normalize to the same name
+                vocabulary: Dict[str, int] = {}
+                remap = np.array(
+                    [vocabulary.setdefault(n, len(vocabulary))
+                     for n in normalized],
+                    dtype=np.int32,
+                )
+                normalized = tuple(vocabulary)
+                codes = remap[codes] if codes.size else codes
+
+        # ----- Columns -----
+        values = np.asarray(self.values)
+        if values.dtype.kind not in "biuf":
+            raise ValueError("Signal value must be numeric")
+
+        columns = {
+            "codes": codes,
+            "values": np.ascontiguousarray(values, dtype=np.float64),
+            "confidences": np.ascontiguousarray(
+                self.confidences, dtype=np.float64
+            ),
+            "timestamps_us": np.ascontiguousarray(
+                self.timestamps_us, dtype=np.int64
+            ),
+        }
+        for name, column in columns.items():
+            if column.ndim != 1:
+                raise ValueError(f"{name} must be a 1-D array")
+            if column.shape[0] != codes.shape[0]:
+                raise ValueError("SignalColumns columns must have equal length")
+
+        # ----- Vectorized validation -----
+        if codes.size and (
+            codes.min() < 0 or codes.max() >= len(normalized)
+        ):
+            raise ValueError("Signal name code out of range")
+
+        confidences = columns["confidences"]
+        invalid = ~((confidences >= 0.0) & (confidences <= 1.0))
+        if invalid.any():
+            raise ValueError(
+                f"Signal confidence must be in [0.0, 1.0], "
+                f"got {confidences[invalid][0]}"
+            )
+
+        if self.window_start_us > self.window_end_us:
+            raise ValueError("SignalBatch window_start must be <= window_end")
+
+        timestamps = columns["timestamps_us"]
+        outside = (timestamps < self.window_start_us) | (
+            timestamps > self.window_end_us
+        )
+        if outside.any():
+            raise ValueError(
+                f"Signal timestamp {from_epoch_us(timestamps[outside][0])} "
+                f"outside batch window [{from_epoch_us(self.window_start_us)}, "
+                f"{from_epoch_us(self.window_end_us)}]"
+            )
+
+        object.__setattr__(self, "names", normalized)
+        object.__setattr__(self, "window_start_us", int(self.window_start_us))
+        object.__setattr__(self, "window_end_us", int(self.window_end_us))
+        for name, column in columns.items():
+            object.__setattr__(self, name, column)
+
+    def __len__(self) -> int:
+        return self.codes.shape[0]
+
+    # -----------------------------
+    # Construction
+    # -----------------------------
+
+    @classmethod
+    def from_records(
+        cls,
+        names: Iterable[str],
+        values: Sequence[float],
+        confidences: Sequence[float],
+        timestamps_us: Sequence[int],
+        window_start_us: int,
+        window_end_us: int,
+    ) -> "SignalColumns":
+        """
+        Interns a per-signal name column into codes.
+        """
+
+        vocabulary: Dict[str, int] = {}
+        intern = vocabulary.setdefault
+        codes = np.fromiter(
+            (intern(name, len(vocabulary)) for name in names),
+            dtype=np.int32,
+        )
+
+        return cls(
+            names=tuple(vocabulary),
+            codes=codes,
+            values=values,
+            confidences=confidences,
+            timestamps_us=timestamps_us,
+            window_start_us=window_start_us,
+            window_end_us=window_end_us,
+        )
+
+    @classmethod
+    def from_codes(
+        cls,
+        codes: Sequence[int],
+        values: Sequence[float],
+        confidences: Sequence[float],
+        timestamps_us: Sequence[int],
+        window_start_us: int,
+        window_end_us: int,
+    ) -> "SignalColumns":
+        """
+        Batch whose codes are signal registry codes.
+        """
+        return cls(
+            names=SIGNAL_NAMES,
+            codes=codes,
+            values=values,
+            confidences=confidences,
+            timestamps_us=timestamps_us,
+            window_start_us=window_start_us,
+            window_end_us=window_end_us,
+        )
+
+    @classmethod
+    def from_batch(cls, batch: SignalBatch) -> "SignalColumns":
+        signals = batch.signals
+        return cls.from_records(
+            names=[s.name for s in signals],
+            values=[s.value for s in signals],
+            confidences=[s.confidence for s in signals],
+            timestamps_us=[epoch_us(s.timestamp) for s in signals],
+            window_start_us=epoch_us(batch.window_start),
+            window_end_us=epoch_us(batch.window_end),
+        )
+
+    @classmethod
+    def from_wire(cls, data) -> "SignalColumns":
+        """
+        Decodes a wire_format buffer. Records are viewed in
+        place and copied once, column by column.
+        """
+
+        count, start_us, end_us = decode_header(data)
+        records = np.frombuffer(
+            data, dtype=WIRE_RECORD_DTYPE, count=count, offset=HEADER.size
+        )
+        return cls.from_codes(
+            codes=records["code"],
+            values=records["value"],
+            confidences=records["confidence"],
+            timestamps_us=records["timestamp_us"],
+            window_start_us=start_us,
+            window_end_us=end_us,
+        )
+
+    def to_wire(self) -> bytes:
+        """
+        Encodes the batch in wire_format. Raises ValueError
+        for signal names the registry does not know.
+        """
+
+        codes = self.registry_codes()
+        if (codes == UNREGISTERED_CODE).any():
+            raise ValueError(
+                "SignalColumns contains unregistered signal names; "
+                "they have no wire code"
+            )
+
+        records = np.empty(len(self), dtype=WIRE_RECORD_DTYPE)
+        records["code"] = codes
+        records["value"] = self.values
+        records["confidence"] = self.confidences
+        records["timestamp_us"] = self.timestamps_us
+
+        header = HEADER.pack(
+            WIRE_MAGIC, len(self), self.window_start_us, self.window_end_us
+        )
+        return header + records.tobytes()
+
+    def to_batch(self) -> SignalBatch:
+        """
+        Expands the columns into a SignalBatch of naive
+        UTC-timestamped Signals.
+        """
+
+        names = self.names
+        signals: List[Signal] = [
+            Signal(names[code], value, confidence, from_epoch_us(timestamp))
+            for code, value, confidence, timestamp in zip(
+                self.codes.tolist(),
+                self.values.tolist(),
+                self.confidences.tolist(),
+                self.timestamps_us.tolist(),
+            )
+        ]
+        return SignalBatch(
+            signals=signals,
+            window_start=from_epoch_us(self.window_start_us),
+            window_end=from_epoch_us(self.window_end_us),
+        )
+
+    def registry_codes(self) -> np.ndarray:
+        """
+        Signal registry code per signal (UNREGISTERED_CODE
+        for names the registry does not know).
+        """
+
+        if self.names is SIGNAL_NAMES:
+            return self.codes
+
+        translate = np.array(
+            [SIGNAL_CODES.get(name, UNREGISTERED_CODE) for name in self.names],
+            dtype=np.int32,
+        )
+        return translate[self.codes]
+
+    # -----------------------------
+    # State Update Support
+    # -----------------------------
+
+    def accumulate_effects(
+        self, start: Tuple[float, ...]
+    ) -> Tuple[float, ...]:
+        """
+        Adds each signal's SIGNAL_EFFECTS delta (scaled by its
+        confidence) to start, ordered as STATE_DIMENSIONS.
+
+        Accumulation is sequential in signal order, matching
+        the scalar loop in update_state bit for bit.
+        """
+
+        if not len(self):
+            return tuple(start)
+
+        if self.names is SIGNAL_NAMES:
+            effects = REGISTRY_EFFECTS
+        else:
+            no_effect = (NO_EFFECT,) * len(STATE_DIMENSIONS)
+            effects = np.array(
+                [SIGNAL_EFFECTS.get(name, no_effect) for name in self.names],
+                dtype=np.float64,
+            )
+
+        terms = np.empty((len(self) + 1, len(STATE_DIMENSIONS)))
+        terms[0] = start
+        np.multiply(
+            effects[self.codes], self.confidences[:, None], out=terms[1:]
+        )
+
+        # add.accumulate is strictly left-to-right, unlike sum()
+        return tuple(np.add.accumulate(terms, axis=0)[-1].tolist())
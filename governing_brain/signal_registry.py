@@ -0,0 +1,168 @@
+"""
+signal_registry.py
+
+Central registry of known behavioral signal names.
+
+Every name gets a stable small-integer code and a bitmask
+of the state_model categories it belongs to, so telemetry,
+logs and the state updater can carry and dispatch on
+integers instead of strings.
+
+Design guarantees:
+- Codes are append-only: never reorder or reuse entries
+- Category membership comes from state_model (single source)
+- Every signal with a state effect is registered
+"""
+
+from enum import IntFlag
+from typing import Dict, Optional, Tuple
+
+from governing_brain.state_model import (
+    AVOIDANCE_SIGNALS,
+    COMPLIANCE_SIGNALS,
+    DISCIPLINE_NEGATIVE,
+    DISCIPLINE_POSITIVE,
+    FAILURE_SIGNALS,
+    FATIGUE_SIGNALS,
+    HIGH_STAKES_CONTEXT,
+    LOW_STAKES_CONTEXT,
+    MOMENTUM_NEGATIVE,
+    MOMENTUM_POSITIVE,
+    NO_EFFECT,
+    RECOVERY_SIGNALS,
+    SIGNAL_EFFECTS,
+    STATE_DIMENSIONS,
+    SUCCESS_SIGNALS,
+)
+
+
+# =========================================================
+# Signal Categories
+# =========================================================
+
+class SignalCategory(IntFlag):
+    """
+    One bit per state_model signal category.
+    """
+
+    FAILURE = 1 << 0
+    SUCCESS = 1 << 1
+    FATIGUE = 1 << 2
+    RECOVERY = 1 << 3
+    AVOIDANCE = 1 << 4
+    COMPLIANCE = 1 << 5
+    DISCIPLINE_POSITIVE = 1 << 6
+    DISCIPLINE_NEGATIVE = 1 << 7
+    MOMENTUM_POSITIVE = 1 << 8
+    MOMENTUM_NEGATIVE = 1 << 9
+    HIGH_STAKES_CONTEXT = 1 << 10
+    LOW_STAKES_CONTEXT = 1 << 11
+
+
+CATEGORY_MEMBERS = {
+    SignalCategory.FAILURE: FAILURE_SIGNALS,
+    SignalCategory.SUCCESS: SUCCESS_SIGNALS,
+    SignalCategory.FATIGUE: FATIGUE_SIGNALS,
+    SignalCategory.RECOVERY: RECOVERY_SIGNALS,
+    SignalCategory.AVOIDANCE: AVOIDANCE_SIGNALS,
+    SignalCategory.COMPLIANCE: COMPLIANCE_SIGNALS,
+    SignalCategory.DISCIPLINE_POSITIVE: DISCIPLINE_POSITIVE,
+    SignalCategory.DISCIPLINE_NEGATIVE: DISCIPLINE_NEGATIVE,
+    SignalCategory.MOMENTUM_POSITIVE: MOMENTUM_POSITIVE,
+    SignalCategory.MOMENTUM_NEGATIVE: MOMENTUM_NEGATIVE,
+    SignalCategory.HIGH_STAKES_CONTEXT: HIGH_STAKES_CONTEXT,
+    SignalCategory.LOW_STAKES_CONTEXT: LOW_STAKES_CONTEXT,
+}
+
+
+# =========================================================
+# Registered Names (append-only)
+# =========================================================
+
+SIGNAL_NAMES: Tuple[str, ...] = (
+    # Alarm outcomes
+    "alarm_failure",
+    "excessive_snooze",
+    "clean_alarm_dismissal",
+    "early_wake_success",
+    # Sleep and fatigue
+    "late_night_usage",
+    "sleep_debt",
+    "short_sleep_duration",
+    "repeated_enforcement",
+    "adequate_sleep",
+    "recovery_day",
+    "low_enforcement_day",
+    # Avoidance and compliance
+    "volume_evasion",
+    "power_off_attempt",
+    "fake_dismissal",
+    "dismissal_latency_spike",
+    "clean_compliance_streak",
+    "no_avoidance_detected",
+    # Routine
+    "consistent_sleep_routine",
+    "routine_break",
+    # Context
+    "exam_day",
+    "important_meeting",
+    "deadline_day",
+    "travel_day",
+    "weekend",
+    "holiday",
+)
+
+SIGNAL_CODES: Dict[str, int] = {
+    name: code for code, name in enumerate(SIGNAL_NAMES)
+}
+
+
+def _build_category_masks() -> Tuple[int, ...]:
+    if len(SIGNAL_CODES) != len(SIGNAL_NAMES):
+        raise ValueError("Signal registry contains duplicate names")
+
+    unregistered = set(SIGNAL_EFFECTS) - set(SIGNAL_CODES)
+    if unregistered:
+        raise ValueError(
+            f"Signals missing from the registry: {sorted(unregistered)}"
+        )
+
+    masks = [0] * len(SIGNAL_NAMES)
+    for category, members in CATEGORY_MEMBERS.items():
+        for name in members:
+            masks[SIGNAL_CODES[name]] |= category
+    return tuple(masks)
+
+
+# Category bitmask per code (plain ints for fast bit tests)
+SIGNAL_CATEGORY_MASKS: Tuple[int, ...] = _build_category_masks()
+
+# SIGNAL_EFFECTS delta vector per code (STATE_DIMENSIONS order)
+EFFECTS_BY_CODE: Tuple[Tuple[float, ...], ...] = tuple(
+    SIGNAL_EFFECTS.get(name, (NO_EFFECT,) * len(STATE_DIMENSIONS))
+    for name in SIGNAL_NAMES
+)
+
+
+# =========================================================
+# Lookup
+# =========================================================
+
+def code_of(name: str) -> Optional[int]:
+    """
+    Code of a (possibly unnormalized) signal name,
+    or None if it is not registered.
+    """
+    return SIGNAL_CODES.get(name.strip().lower())
+
+
+def name_of(code: int) -> str:
+    return SIGNAL_NAMES[code]
+
+
+def categories_of(code: int) -> SignalCategory:
+    return SignalCategory(SIGNAL_CATEGORY_MASKS[code])
+
+
+def has_category(code: int, category: SignalCategory) -> bool:
+    return bool(SIGNAL_CATEGORY_MASKS[code] & category)
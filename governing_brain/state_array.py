@@ -0,0 +1,193 @@
+"""
+state_array.py
+
+Struct-of-arrays representation of BehavioralState
+for population-scale state evolution.
+
+Design guarantees:
+- Same coefficients, precedence and bounds as update_state
+- One vectorized step for N users
+- No per-user Python objects on the hot path
+
+Requires NumPy. The scalar core does not import this module.
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from governing_brain.inputs import SignalBatch
+from governing_brain.state_model import (
+    BehavioralState,
+    MOMENTUM_DECAY,
+    SIGNAL_EFFECTS,
+    STATE_DIMENSIONS,
+)
+
+
+# =========================================================
+# Signal Columns
+# =========================================================
+
+# Column order of signal matrices consumed by update_state_batch.
+SIGNAL_COLUMNS: Tuple[str, ...] = tuple(SIGNAL_EFFECTS)
+
+SIGNAL_COLUMN_INDEX = {name: i for i, name in enumerate(SIGNAL_COLUMNS)}
+
+# (signals x dimensions) coefficients, ordered as STATE_DIMENSIONS.
+EFFECT_MATRIX = np.array(
+    [SIGNAL_EFFECTS[name] for name in SIGNAL_COLUMNS], dtype=np.float64
+)
+
+
+# =========================================================
+# Behavioral State Array
+# =========================================================
+
+@dataclass
+class BehavioralStateArray:
+    """
+    Behavioral state of N users, one float64 column
+    per BehavioralState field.
+    """
+
+    discipline_level: np.ndarray
+    failure_risk: np.ndarray
+    avoidance_tendency: np.ndarray
+    fatigue_index: np.ndarray
+    context_importance: np.ndarray
+    momentum_trend: np.ndarray
+
+    def __post_init__(self):
+        size = None
+        for name in STATE_DIMENSIONS:
+            column = np.ascontiguousarray(
+                getattr(self, name), dtype=np.float64
+            )
+            if column.ndim != 1:
+                raise ValueError(f"{name} must be a 1-D array")
+            if size is None:
+                size = column.shape[0]
+            elif column.shape[0] != size:
+                raise ValueError(
+                    "BehavioralStateArray columns must have equal length"
+                )
+            object.__setattr__(self, name, column)
+
+    def __len__(self) -> int:
+        return self.discipline_level.shape[0]
+
+    # -----------------------------
+    # Construction
+    # -----------------------------
+
+    @classmethod
+    def cold_start(cls, size: int) -> "BehavioralStateArray":
+        """
+        N users in the update_state cold-start state.
+        """
+        return cls(
+            discipline_level=np.full(size, 0.5),
+            failure_risk=np.full(size, 0.5),
+            avoidance_tendency=np.full(size, 0.3),
+            fatigue_index=np.full(size, 0.5),
+            context_importance=np.full(size, 0.5),
+            momentum_trend=np.zeros(size),
+        )
+
+    @classmethod
+    def from_states(
+        cls, states: Sequence[BehavioralState]
+    ) -> "BehavioralStateArray":
+        return cls(**{
+            name: np.fromiter(
+                (getattr(s, name) for s in states),
+                dtype=np.float64,
+                count=len(states),
+            )
+            for name in STATE_DIMENSIONS
+        })
+
+    # -----------------------------
+    # Access
+    # -----------------------------
+
+    def state_at(self, index: int) -> BehavioralState:
+        return BehavioralState(**{
+            name: float(getattr(self, name)[index])
+            for name in STATE_DIMENSIONS
+        })
+
+    def to_states(self) -> List[BehavioralState]:
+        columns = [getattr(self, name).tolist() for name in STATE_DIMENSIONS]
+        return [BehavioralState(*row) for row in zip(*columns)]
+
+
+# =========================================================
+# Signal Matrix Construction
+# =========================================================
+
+def signal_matrix_from_batches(batches: Sequence[SignalBatch]) -> np.ndarray:
+    """
+    Builds an (N x len(SIGNAL_COLUMNS)) matrix of summed
+    signal confidences, one row per user batch.
+
+    Unknown signal names have no effect and are skipped,
+    as in update_state.
+    """
+
+    matrix = np.zeros((len(batches), len(SIGNAL_COLUMNS)), dtype=np.float64)
+    index = SIGNAL_COLUMN_INDEX
+
+    for row, batch in enumerate(batches):
+        for signal in batch.signals:
+            column = index.get(signal.name)
+            if column is not None:
+                matrix[row, column] += signal.confidence
+
+    return matrix
+
+
+# =========================================================
+# Vectorized State Update
+# =========================================================
+
+def update_state_batch(
+    states: BehavioralStateArray,
+    signal_matrix: np.ndarray,
+) -> BehavioralStateArray:
+    """
+    Evolves N users by one step.
+
+    signal_matrix holds the summed confidence of each
+    SIGNAL_COLUMNS signal per user. Row i matches
+    update_state(states.state_at(i), batch_i) up to
+    floating-point summation order.
+
+    Cold start is explicit: use BehavioralStateArray.cold_start.
+    """
+
+    signal_matrix = np.asarray(signal_matrix, dtype=np.float64)
+    if signal_matrix.shape != (len(states), len(SIGNAL_COLUMNS)):
+        raise ValueError(
+            f"signal_matrix must have shape "
+            f"({len(states)}, {len(SIGNAL_COLUMNS)}), "
+            f"got {signal_matrix.shape}"
+        )
+
+    deltas = signal_matrix @ EFFECT_MATRIX
+
+    columns = {}
+    for j, name in enumerate(STATE_DIMENSIONS):
+        column = getattr(states, name) + deltas[:, j]
+
+        if name == "momentum_trend":
+            column *= MOMENTUM_DECAY
+            np.clip(column, -1.0, 1.0, out=column)
+        else:
+            np.clip(column, 0.0, 1.0, out=column)
+
+        columns[name] = column
+
+    return BehavioralStateArray(**columns)
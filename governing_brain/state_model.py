@@ -14,11 +14,15 @@ Design guarantees:
 No policy decisions are made here.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+import sys
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
 
 from governing_brain.inputs import SignalBatch
 
+if TYPE_CHECKING:
+    from governing_brain.signal_columns import SignalColumns
+
 
 # =========================================================
 # Behavioral State Definition
@@ -141,13 +145,101 @@ LOW_STAKES_CONTEXT = {
 }
 
 
+# =========================================================
+# Signal Effect Table (Precompiled)
+# =========================================================
+
+# Dimension order follows the BehavioralState field order.
+STATE_DIMENSIONS: Tuple[str, ...] = tuple(
+    f.name for f in fields(BehavioralState)
+)
+
+# One rule per dimension: (increasing signals, decreasing signals,
+# increment, decrement). Increasing signals take precedence when a
+# name belongs to both sets, mirroring the per-dimension if/elif.
+DIMENSION_RULES: Dict[str, Tuple[Set[str], Set[str], float, float]] = {
+    "discipline_level": (
+        DISCIPLINE_POSITIVE, DISCIPLINE_NEGATIVE,
+        DISCIPLINE_INC, DISCIPLINE_DEC,
+    ),
+    "failure_risk": (
+        FAILURE_SIGNALS, SUCCESS_SIGNALS,
+        FAILURE_RISK_INC, FAILURE_RISK_DEC,
+    ),
+    "avoidance_tendency": (
+        AVOIDANCE_SIGNALS, COMPLIANCE_SIGNALS,
+        AVOIDANCE_INC, AVOIDANCE_DEC,
+    ),
+    "fatigue_index": (
+        FATIGUE_SIGNALS, RECOVERY_SIGNALS,
+        FATIGUE_INC, FATIGUE_DEC,
+    ),
+    "context_importance": (
+        HIGH_STAKES_CONTEXT, LOW_STAKES_CONTEXT,
+        CONTEXT_STRONG_SHIFT, CONTEXT_STRONG_SHIFT,
+    ),
+    "momentum_trend": (
+        MOMENTUM_POSITIVE, MOMENTUM_NEGATIVE,
+        MOMENTUM_STEP, MOMENTUM_STEP,
+    ),
+}
+
+# Unaffected dimensions carry -0.0: it is the exact additive identity
+# in IEEE 754 (x + -0.0 == x for every x, including -0.0), so adding
+# the full vector is bit-identical to skipping the dimension.
+NO_EFFECT = -0.0
+
+
+def build_signal_effect_table() -> Dict[str, Tuple[float, ...]]:
+    """
+    Compiles the signal categories into one delta vector per
+    signal name, ordered as STATE_DIMENSIONS.
+
+    Each entry is the coefficient multiplied by the signal
+    confidence and added to the matching dimension.
+    """
+
+    names: Set[str] = set()
+    for positive, negative, _, _ in DIMENSION_RULES.values():
+        names |= positive | negative
+
+    table: Dict[str, Tuple[float, ...]] = {}
+    for name in sorted(names):
+        deltas = []
+        for dimension in STATE_DIMENSIONS:
+            positive, negative, inc, dec = DIMENSION_RULES[dimension]
+            if name in positive:
+                deltas.append(inc)
+            elif name in negative:
+                deltas.append(-dec)
+            else:
+                deltas.append(NO_EFFECT)
+        table[name] = tuple(deltas)
+
+    return table
+
+
+SIGNAL_EFFECTS: Dict[str, Tuple[float, ...]] = build_signal_effect_table()
+
+
 # =========================================================
 # State Update Function (Single Mutation Path)
 # =========================================================
 
+def _cold_start_state() -> BehavioralState:
+    return BehavioralState(
+        discipline_level=0.5,
+        failure_risk=0.5,
+        avoidance_tendency=0.3,
+        fatigue_index=0.5,
+        context_importance=0.5,
+        momentum_trend=0.0,
+    )
+
+
 def update_state(
     previous_state: Optional[BehavioralState],
-    signals: SignalBatch
+    signals: "SignalBatch | SignalColumns"
 ) -> BehavioralState:
     """
     Updates the BehavioralState based on a batch of observed signals.
@@ -160,18 +252,101 @@ def update_state(
 
     This function is the ONLY allowed entry
     point for state evolution.
+
+    Signals are applied in a single pass through SIGNAL_EFFECTS.
+    Results are bit-identical to the per-dimension reference
+    implementation (_update_state_multipass).
+
+    Columnar batches (signal_columns.SignalColumns) accumulate
+    the same deltas vectorized, in the same order. Any other
+    batch-like object with a `signals` sequence takes the
+    per-signal path.
+    """
+
+    # ----- Cold start -----
+    if previous_state is None:
+        return _cold_start_state()
+
+    # ----- Initialize from previous state -----
+    discipline_level = previous_state.discipline_level
+    failure_risk = previous_state.failure_risk
+    avoidance_tendency = previous_state.avoidance_tendency
+    fatigue_index = previous_state.fatigue_index
+    context_importance = previous_state.context_importance
+    momentum_trend = previous_state.momentum_trend
+
+    # ----- Columnar batch: vectorized accumulation -----
+    if _is_signal_columns(signals):
+        (
+            discipline_level, failure_risk, avoidance_tendency,
+            fatigue_index, context_importance, momentum_trend,
+        ) = signals.accumulate_effects((
+            discipline_level, failure_risk, avoidance_tendency,
+            fatigue_index, context_importance, momentum_trend,
+        ))
+
+    # ----- Single pass over the batch -----
+    else:
+        effects = SIGNAL_EFFECTS
+        for signal in signals.signals:
+            deltas = effects.get(signal.name)
+            if deltas is None:
+                continue
+
+            (
+                d_discipline, d_failure, d_avoidance,
+                d_fatigue, d_context, d_momentum,
+            ) = deltas
+            confidence = signal.confidence
+            discipline_level += d_discipline * confidence
+            failure_risk += d_failure * confidence
+            avoidance_tendency += d_avoidance * confidence
+            fatigue_index += d_fatigue * confidence
+            context_importance += d_context * confidence
+            momentum_trend += d_momentum * confidence
+
+    # ----- Momentum decay and bounds -----
+    momentum_trend *= MOMENTUM_DECAY
+
+    return BehavioralState(
+        discipline_level=max(0.0, min(1.0, discipline_level)),
+        failure_risk=max(0.0, min(1.0, failure_risk)),
+        avoidance_tendency=max(0.0, min(1.0, avoidance_tendency)),
+        fatigue_index=max(0.0, min(1.0, fatigue_index)),
+        context_importance=max(0.0, min(1.0, context_importance)),
+        momentum_trend=max(-1.0, min(1.0, momentum_trend)),
+    )
+
+
+def _is_signal_columns(signals) -> bool:
+    """
+    isinstance check against SignalColumns that does not import
+    signal_columns (and so NumPy): if the module was never
+    imported, no SignalColumns instance can exist.
+    """
+    module = sys.modules.get("governing_brain.signal_columns")
+    return module is not None and isinstance(signals, module.SignalColumns)
+
+
+# =========================================================
+# Reference Implementation (Per-Dimension Passes)
+# =========================================================
+
+
+def _update_state_multipass(
+    previous_state: Optional[BehavioralState],
+    signals: SignalBatch
+) -> BehavioralState:
+    """
+    Original per-dimension implementation of update_state.
+
+    Kept as the behavioral reference for equivalence tests
+    and benchmarks. Not a mutation entry point.
     """
 
     # ----- Cold start -----
     if previous_state is None:
-        return BehavioralState(
-            discipline_level=0.5,
-            failure_risk=0.5,
-            avoidance_tendency=0.3,
-            fatigue_index=0.5,
-            context_importance=0.5,
-            momentum_trend=0.0,
-        )
+        return _cold_start_state()
 
     # ----- Initialize from previous state -----
     failure_risk = previous_state.failure_risk
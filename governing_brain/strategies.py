@@ -8,6 +8,7 @@ Strategies are immutable and self-describing.
 """
 
 from enum import Enum
+from typing import Dict, Tuple
 
 
 class Strategy(Enum):
@@ -44,3 +45,14 @@ class Strategy(Enum):
             Strategy.COMPENSATION,
             Strategy.STRATEGIC_PAUSE,
         }
+
+
+# -------------------------------------------------
+# Stable integer codes (array / columnar representations)
+# -------------------------------------------------
+
+STRATEGIES_BY_CODE: Tuple[Strategy, ...] = tuple(Strategy)
+
+STRATEGY_CODES: Dict[Strategy, int] = {
+    strategy: code for code, strategy in enumerate(STRATEGIES_BY_CODE)
+}
@@ -0,0 +1,140 @@
+"""
+wire_format.py
+
+Packed binary encoding of SignalBatch for ingestion.
+
+Layout (little-endian):
+    header  magic "ASB1", uint32 signal count,
+            int64 window_start_us, int64 window_end_us
+    records uint16 registry code, float64 value,
+            float64 confidence, int64 timestamp_us
+
+Timestamps are microseconds since the epoch (UTC) and decode
+to naive UTC datetimes. Signal.source is not encoded.
+
+Design guarantees:
+- Fixed-width records (random access, no parsing)
+- Decoding reads the buffer in place (memoryview, iter_unpack)
+- Only registry names are encodable: codes are stable
+"""
+
+import struct
+from typing import Iterator, Tuple
+
+from governing_brain.inputs import (
+    Signal,
+    SignalBatch,
+    epoch_us,
+    from_epoch_us,
+)
+from governing_brain.signal_registry import SIGNAL_CODES, SIGNAL_NAMES
+
+
+# =========================================================
+# Layout
+# =========================================================
+
+WIRE_MAGIC = b"ASB1"
+
+HEADER = struct.Struct("<4sIqq")
+RECORD = struct.Struct("<Hddq")
+
+# (registry code, value, confidence, timestamp_us)
+WireRecord = Tuple[int, float, float, int]
+
+
+# =========================================================
+# Encoding
+# =========================================================
+
+def encode_signal_batch(batch: SignalBatch) -> bytes:
+    """
+    Packs a batch. Raises ValueError for signal names
+    the registry does not know.
+    """
+
+    signals = batch.signals
+    buffer = bytearray(HEADER.size + RECORD.size * len(signals))
+    HEADER.pack_into(
+        buffer, 0,
+        WIRE_MAGIC,
+        len(signals),
+        epoch_us(batch.window_start),
+        epoch_us(batch.window_end),
+    )
+
+    codes = SIGNAL_CODES
+    pack_into = RECORD.pack_into
+    offset = HEADER.size
+    for signal in signals:
+        code = codes.get(signal.name)
+        if code is None:
+            raise ValueError(
+                f"Signal {signal.name!r} is not registered; "
+                f"it has no wire code"
+            )
+        pack_into(
+            buffer, offset,
+            code, signal.value, signal.confidence,
+            epoch_us(signal.timestamp),
+        )
+        offset += RECORD.size
+
+    return bytes(buffer)
+
+
+# =========================================================
+# Decoding
+# =========================================================
+
+def decode_header(data) -> Tuple[int, int, int]:
+    """
+    Returns (signal count, window_start_us, window_end_us)
+    and checks that the buffer holds exactly that many records.
+    """
+
+    view = memoryview(data)
+    if len(view) < HEADER.size:
+        raise ValueError("Truncated signal batch header")
+
+    magic, count, start_us, end_us = HEADER.unpack_from(view, 0)
+    if magic != WIRE_MAGIC:
+        raise ValueError("Not a binary signal batch")
+    if len(view) != HEADER.size + count * RECORD.size:
+        raise ValueError(
+            f"Signal batch declares {count} records but carries "
+            f"{len(view) - HEADER.size} record bytes"
+        )
+
+    return count, start_us, end_us
+
+
+def iter_records(data) -> Iterator[WireRecord]:
+    """
+    Yields raw records straight from the buffer, without
+    copying it or building Signal objects.
+    """
+
+    decode_header(data)
+    return RECORD.iter_unpack(memoryview(data)[HEADER.size:])
+
+
+def decode_signal_batch(data) -> SignalBatch:
+    _, start_us, end_us = decode_header(data)
+
+    names = SIGNAL_NAMES
+    try:
+        signals = [
+            Signal(names[code], value, confidence, from_epoch_us(timestamp))
+            for code, value, confidence, timestamp in RECORD.iter_unpack(
+                memoryview(data)[HEADER.size:]
+            )
+        ]
+    except IndexError as exc:
+        raise ValueError("Signal batch carries an unknown name code") from exc
+
+    return SignalBatch(
+        signals=signals,
+        window_start=from_epoch_us(start_us),
+        window_end=from_epoch_us(end_us),
+    )
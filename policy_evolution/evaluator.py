@@ -11,76 +11,159 @@ This module is READ-ONLY:
 - No side effects
 """
 
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List, Optional
 from collections import Counter
 
 from simulation.metrics import SimulationLog
 from policy_evolution.evaluation import PolicyEvaluation
 from governing_brain.strategies import Strategy
 
+if TYPE_CHECKING:
+    from simulation.log_table import SimulationLogTable
 
-class PolicyEvaluator:
+
+# Every float is a whole number of 2**-1074, so trust deltas are
+# summed exactly as integers in those units: totals do not depend
+# on summation order, merges or window splits. Converting back
+# rounds once, to the float nearest the true sum (math.fsum).
+TRUST_UNIT_BITS = 1074
+
+# Net trust within this of zero is flat, not degrading
+TRUST_TOLERANCE = 1e-9
+
+
+def trust_unit_bits(trust_delta: float) -> int:
     """
-    Evaluates governance performance over a window
-    of simulation logs.
+    Fewest bits b such that trust_delta is a whole number of 2**-b.
     """
+    return trust_delta.as_integer_ratio()[1].bit_length() - 1
 
-    def __init__(self, logs: List[SimulationLog]):
-        if not logs:
-            raise ValueError("PolicyEvaluator requires non-empty logs")
-        self.logs = logs
+
+def trust_units(trust_delta: float, bits: int = TRUST_UNIT_BITS) -> int:
+    """
+    A trust delta as an exact integer number of 2**-bits.
+    """
+    numerator, denominator = trust_delta.as_integer_ratio()
+    return numerator << (bits - denominator.bit_length() + 1)
+
+
+def trust_from_units(units: int, bits: int = TRUST_UNIT_BITS) -> float:
+    # int / int true division is correctly rounded
+    return units / (1 << bits)
+
+
+def governance_health(false_alarm_rate: float, trust_delta: float) -> str:
+    """
+    Governance health heuristic shared by every evaluator.
+    """
+    if false_alarm_rate > 0.3:
+        return "risky"
+    if trust_delta < -TRUST_TOLERANCE:
+        return "degrading"
+    return "healthy"
+
+
+class PolicyEvaluationAccumulator:
+    """
+    Online PolicyEvaluator: absorbs one log at a time in
+    constant memory.
+
+    merge() concatenates two accumulators (self's logs first,
+    then other's), so windows or users can be reduced across
+    workers. Trust is kept in exact trust_units, so merging
+    is exact.
+    """
+
+    def __init__(self):
+        self.days = 0
+        self.alarms = 0
+        self.successes = 0
+        self.false_alarms = 0
+        self.trust_units = 0
+        self.first_fatigue: Optional[float] = None
+        self.last_fatigue: Optional[float] = None
+        self.strategy_counts: Counter = Counter()
+
+    def add(self, log: SimulationLog):
+        fatigue = log.fatigue
+        if self.first_fatigue is None:
+            self.first_fatigue = fatigue
+        self.last_fatigue = fatigue
+
+        self.days += 1
+        if log.alarm_triggered:
+            self.alarms += 1
+            if log.outcome_success is True:
+                self.successes += 1
+            elif log.outcome_success is False:
+                self.false_alarms += 1
+        self.trust_units += trust_units(log.trust_delta)
+        self.strategy_counts[log.strategy] += 1
+
+    def extend(
+        self, logs: Iterable[SimulationLog]
+    ) -> "PolicyEvaluationAccumulator":
+        for log in logs:
+            self.add(log)
+        return self
+
+    def merge(
+        self, other: "PolicyEvaluationAccumulator"
+    ) -> "PolicyEvaluationAccumulator":
+        merged = PolicyEvaluationAccumulator()
+        merged.days = self.days + other.days
+        merged.alarms = self.alarms + other.alarms
+        merged.successes = self.successes + other.successes
+        merged.false_alarms = self.false_alarms + other.false_alarms
+        merged.trust_units = self.trust_units + other.trust_units
+        merged.first_fatigue = (
+            self.first_fatigue if self.days else other.first_fatigue
+        )
+        merged.last_fatigue = (
+            other.last_fatigue if other.days else self.last_fatigue
+        )
+        merged.strategy_counts = self.strategy_counts + other.strategy_counts
+        return merged
+
+    __add__ = merge
+
+    @property
+    def trust_delta(self) -> float:
+        return trust_from_units(self.trust_units)
+
+    def __len__(self) -> int:
+        return self.days
 
     def evaluate(self) -> PolicyEvaluation:
-        days = len(self.logs)
+        if self.days == 0:
+            raise ValueError("PolicyEvaluator requires non-empty logs")
+
+        days = self.days
+        total_alarms = self.alarms
 
         # -----------------------------
         # Alarm & outcome statistics
         # -----------------------------
-        total_alarms = sum(1 for log in self.logs if log.alarm_triggered)
-        successful_outcomes = sum(
-            1 for log in self.logs
-            if log.alarm_triggered and log.outcome_success is True
-        )
-        false_alarms = sum(
-            1 for log in self.logs
-            if log.alarm_triggered and log.outcome_success is False
-        )
-
         alarm_trigger_rate = total_alarms / days
         success_rate = (
-            successful_outcomes / total_alarms
+            self.successes / total_alarms
             if total_alarms > 0 else 0.0
         )
         false_alarm_rate = (
-            false_alarms / total_alarms
+            self.false_alarms / total_alarms
             if total_alarms > 0 else 0.0
         )
 
         # -----------------------------
         # Human impact
         # -----------------------------
-        trust_delta = sum(log.trust_delta for log in self.logs)
-        fatigue_delta = self.logs[-1].fatigue - self.logs[0].fatigue
+        trust_delta = self.trust_delta
+        fatigue_delta = self.last_fatigue - self.first_fatigue
 
         # -----------------------------
         # Strategy usage ratios
         # -----------------------------
-        strategies = [log.strategy for log in self.logs]
-        counts = Counter(strategies)
-
-        enforcement_ratio = counts.get(Strategy.ENFORCEMENT, 0) / days
-        support_ratio = counts.get(Strategy.SUPPORT, 0) / days
-        stabilization_ratio = counts.get(Strategy.STABILIZATION, 0) / days
-
-        # -----------------------------
-        # Governance health heuristic
-        # -----------------------------
-        if false_alarm_rate > 0.3:
-            governance_health = "risky"
-        elif trust_delta < 0:
-            governance_health = "degrading"
-        else:
-            governance_health = "healthy"
+        counts = self.strategy_counts
 
         return PolicyEvaluation(
             window_days=days,
@@ -89,8 +172,29 @@ class PolicyEvaluator:
             false_alarm_rate=false_alarm_rate,
             trust_delta=trust_delta,
             fatigue_delta=fatigue_delta,
-            enforcement_ratio=enforcement_ratio,
-            support_ratio=support_ratio,
-            stabilization_ratio=stabilization_ratio,
-            governance_health=governance_health,
+            enforcement_ratio=counts.get(Strategy.ENFORCEMENT, 0) / days,
+            support_ratio=counts.get(Strategy.SUPPORT, 0) / days,
+            stabilization_ratio=counts.get(Strategy.STABILIZATION, 0) / days,
+            governance_health=governance_health(false_alarm_rate, trust_delta),
         )
+
+
+class PolicyEvaluator:
+    """
+    Evaluates governance performance over a window
+    of simulation logs.
+    """
+
+    def __init__(self, logs: "List[SimulationLog] | SimulationLogTable"):
+        if not logs:
+            raise ValueError("PolicyEvaluator requires non-empty logs")
+        self.logs = logs
+
+    def evaluate(self) -> PolicyEvaluation:
+        # Columnar tables build their totals column-wise
+        columnar = getattr(self.logs, "accumulator", None)
+        if columnar is not None:
+            return columnar().evaluate()
+
+        # Single pass through the online accumulator
+        return PolicyEvaluationAccumulator().extend(self.logs).evaluate()
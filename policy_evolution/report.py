@@ -10,7 +10,7 @@ Produces a human-readable summary of:
 - Proposed policy versions
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from policy_evolution.evaluation import PolicyEvaluation
 from policy_evolution.signals import EvolutionSignal
@@ -30,7 +30,13 @@ class PolicyEvolutionReport:
         signals: List[EvolutionSignal],
         recommendation: Optional[PolicyRecommendation],
         proposed_version: Optional[PolicyVersion],
+        run_metadata: Optional[Dict[str, object]] = None,
     ) -> str:
+        """
+        run_metadata (e.g. LogSegment.metadata()) describes the
+        evaluated run in the header.
+        """
+
         lines: List[str] = []
 
         # -----------------------------
@@ -41,6 +47,12 @@ class PolicyEvolutionReport:
         lines.append("=" * 80)
         lines.append("")
 
+        if run_metadata:
+            for key, value in run_metadata.items():
+                label = key.replace("_", " ").title()
+                lines.append(f"{label:<21}: {value}")
+            lines.append("")
+
         # -----------------------------
         # Evaluation Summary
         # -----------------------------
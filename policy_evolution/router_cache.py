@@ -0,0 +1,43 @@
+"""
+policy_evolution/router_cache.py
+
+Compiles policy versions into decision routers
+on demand and caches one router per version.
+
+PolicyVersion parameters whose keys match rule
+parameter names (see governing_brain.policies.rules)
+override the default thresholds. Other parameters
+are ignored by the router.
+"""
+
+from typing import Dict
+
+from governing_brain.policies.compiler import CompiledRouter, compile_router
+from governing_brain.policies.rules import DEFAULT_RULES
+from policy_evolution.versioning import PolicyVersion
+
+
+class PolicyRouterCache:
+    """
+    Cache of compiled routers keyed by policy version id.
+    """
+
+    def __init__(self):
+        self._routers: Dict[str, CompiledRouter] = {}
+
+    def router_for(self, version: PolicyVersion) -> CompiledRouter:
+        """
+        Return the compiled router for a policy version,
+        compiling it on first use.
+        """
+        router = self._routers.get(version.version_id)
+        if router is None:
+            router = compile_router(DEFAULT_RULES, version.parameters)
+            self._routers[version.version_id] = router
+        return router
+
+    def __len__(self) -> int:
+        return len(self._routers)
+
+    def clear(self):
+        self._routers.clear()
@@ -9,10 +9,12 @@ high-level evolution signals.
 NO policy mutation occurs here.
 """
 
-from typing import Set
+from typing import Dict, Iterable, List, Set
 
 from policy_evolution.evaluation import PolicyEvaluation
+from policy_evolution.evaluator import TRUST_TOLERANCE
 from policy_evolution.signals import EvolutionSignal
+from policy_evolution.windowed import WINDOW_SIZES, WindowedEvaluator
 
 
 class EvolutionSignalEngine:
@@ -46,15 +48,15 @@ class EvolutionSignalEngine:
             signals.add(EvolutionSignal.ALARM_FATIGUE)
 
         # Trust collapse
-        if evaluation.trust_delta < 0:
+        if evaluation.trust_delta < -TRUST_TOLERANCE:
             signals.add(EvolutionSignal.TRUST_COLLAPSE)
 
         # Enforcement imbalance
         if evaluation.enforcement_ratio > 0.6:
             signals.add(EvolutionSignal.OVER_ENFORCEMENT)
 
-        if evaluation.enforcement_ratio < 0.1 and evaluation.failure_risk > 0.7:
-            signals.add(EvolutionSignal.UNDER_ENFORCEMENT)
+        # UNDER_ENFORCEMENT is retired here: its rule needed a
+        # failure-risk metric that PolicyEvaluation does not have.
 
         # Strategy stagnation
         if (
@@ -65,3 +67,26 @@ class EvolutionSignalEngine:
             signals.add(EvolutionSignal.STRATEGY_STAGNATION)
 
         return signals
+
+    # -----------------------------
+    # Windowed signals
+    # -----------------------------
+
+    def derive_series(
+        self, evaluations: Iterable[PolicyEvaluation]
+    ) -> List[Set[EvolutionSignal]]:
+        return [self.derive(evaluation) for evaluation in evaluations]
+
+    def derive_windows(
+        self,
+        windowed: WindowedEvaluator,
+        windows: Iterable[int] = WINDOW_SIZES,
+    ) -> Dict[int, List[Set[EvolutionSignal]]]:
+        """
+        Signals for every rolling window of each size
+        (entry i covers logs[i:i + window]).
+        """
+        return {
+            window: self.derive_series(windowed.series(window))
+            for window in windows
+        }
@@ -22,5 +22,7 @@ class EvolutionSignal(Enum):
     ALARM_FATIGUE = "alarm_fatigue"
     TRUST_COLLAPSE = "trust_collapse"
     OVER_ENFORCEMENT = "over_enforcement"
+    # Not derived by EvolutionSignalEngine (no failure-risk metric);
+    # still honoured by PolicyUpdater when supplied
     UNDER_ENFORCEMENT = "under_enforcement"
     STRATEGY_STAGNATION = "strategy_stagnation"
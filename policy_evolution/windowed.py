@@ -0,0 +1,233 @@
+"""
+policy_evolution/windowed.py
+
+Phase 3.1 — Sliding-Window Policy Evaluation
+
+Evaluates every rolling window of a long simulation run
+from cumulative (prefix) arrays, so each window costs O(1)
+instead of a PolicyEvaluator pass over its logs.
+
+Trust deltas are summed exactly (integer trust_units, as in
+PolicyEvaluator), so every window matches PolicyEvaluator over
+the same logs bit for bit.
+
+This module is READ-ONLY:
+- No policy mutation
+- No side effects
+"""
+
+from itertools import accumulate
+from typing import (
+    TYPE_CHECKING, Dict, Iterable, Iterator, List, Sequence, Tuple,
+)
+
+from governing_brain.strategies import STRATEGY_CODES, Strategy
+from policy_evolution.evaluation import PolicyEvaluation
+from policy_evolution.evaluator import (
+    governance_health,
+    trust_from_units,
+    trust_unit_bits,
+    trust_units,
+)
+from simulation.metrics import SimulationLog
+
+if TYPE_CHECKING:
+    from simulation.log_table import SimulationLogTable
+
+
+WINDOW_SIZES: Tuple[int, ...] = (7, 30, 90)
+
+
+_RATIO_STRATEGIES = (
+    Strategy.ENFORCEMENT,
+    Strategy.SUPPORT,
+    Strategy.STABILIZATION,
+)
+
+# Rows converted to Python floats at a time from a column
+_COLUMN_CHUNK_ROWS = 65_536
+
+
+def _prefix(values: Iterable) -> List:
+    return list(accumulate(values, initial=0))
+
+
+def _floats(values) -> Iterator[float]:
+    if not hasattr(values, "tolist"):
+        yield from values
+        return
+    # Columns (possibly memory-mapped) are read in chunks
+    for start in range(0, len(values), _COLUMN_CHUNK_ROWS):
+        yield from values[start:start + _COLUMN_CHUNK_ROWS].tolist()
+
+
+def _trust_prefix(deltas) -> Tuple[List[int], int]:
+    """
+    Exact prefix sums of trust deltas, in units of 2**-bits
+    for the fewest bits that hold every delta exactly (small
+    ints rather than full TRUST_UNIT_BITS ones).
+    """
+
+    bits = max(map(trust_unit_bits, _floats(deltas)))
+    return _prefix(
+        trust_units(delta, bits) for delta in _floats(deltas)
+    ), bits
+
+
+def _column_prefix(values):
+    """
+    int64 prefix sums of a column, with a leading 0.
+    """
+
+    # Columns only exist when NumPy is installed
+    import numpy as np
+
+    prefix = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(values, dtype=np.int64, out=prefix[1:])
+    return prefix
+
+
+class WindowedEvaluator:
+    """
+    O(1) PolicyEvaluation for any contiguous range of logs.
+
+    Columnar input (SimulationLogTable, LogSegment or a slice)
+    is read column-wise into int64 prefix arrays. Only trust is
+    converted to Python ints (exact prefix sums), a chunk at a
+    time.
+    """
+
+    def __init__(self, logs: "Sequence[SimulationLog] | SimulationLogTable"):
+        if not logs:
+            raise ValueError("WindowedEvaluator requires non-empty logs")
+
+        self.days = len(logs)
+
+        columns = getattr(logs, "columns", None)
+        if columns is not None:
+            self._init_columns(columns)
+        else:
+            self._init_logs(logs)
+
+    def _init_logs(self, logs: Sequence[SimulationLog]):
+        alarms = [log.alarm_triggered for log in logs]
+        outcomes = [log.outcome_success for log in logs]
+        strategies = [log.strategy for log in logs]
+
+        self._alarms = _prefix(alarms)
+        self._successes = _prefix(
+            a and o is True for a, o in zip(alarms, outcomes)
+        )
+        self._false_alarms = _prefix(
+            a and o is False for a, o in zip(alarms, outcomes)
+        )
+        self._trust, self._trust_bits = _trust_prefix(
+            [log.trust_delta for log in logs]
+        )
+        self._fatigue = [log.fatigue for log in logs]
+        self._strategies = {
+            strategy: _prefix(s is strategy for s in strategies)
+            for strategy in _RATIO_STRATEGIES
+        }
+
+    def _init_columns(self, columns):
+        alarms = columns["alarm_triggered"]
+        outcome = columns["outcome_success"]
+        strategies = columns["strategy"]
+
+        self._alarms = _column_prefix(alarms)
+        self._successes = _column_prefix(alarms & (outcome == 1))
+        self._false_alarms = _column_prefix(alarms & (outcome == 0))
+        self._trust, self._trust_bits = _trust_prefix(columns["trust_delta"])
+        # Read per window; a memory-mapped column stays on disk
+        self._fatigue = columns["fatigue_index"]
+        self._strategies = {
+            strategy: _column_prefix(strategies == STRATEGY_CODES[strategy])
+            for strategy in _RATIO_STRATEGIES
+        }
+
+    # -----------------------------
+    # Single window
+    # -----------------------------
+
+    def evaluate(self, start: int, end: int) -> PolicyEvaluation:
+        """
+        Evaluation of logs[start:end].
+        """
+
+        if not 0 <= start < end <= self.days:
+            raise ValueError(
+                f"Invalid window [{start}, {end}) for {self.days} logs"
+            )
+
+        days = end - start
+        total_alarms = int(self._alarms[end] - self._alarms[start])
+        successes = int(self._successes[end] - self._successes[start])
+        false_alarms = int(
+            self._false_alarms[end] - self._false_alarms[start]
+        )
+
+        false_alarm_rate = (
+            false_alarms / total_alarms if total_alarms > 0 else 0.0
+        )
+        trust_delta = trust_from_units(
+            self._trust[end] - self._trust[start], self._trust_bits
+        )
+
+        def ratio(strategy: Strategy) -> float:
+            counts = self._strategies[strategy]
+            return int(counts[end] - counts[start]) / days
+
+        return PolicyEvaluation(
+            window_days=days,
+            alarm_trigger_rate=total_alarms / days,
+            success_rate=(
+                successes / total_alarms if total_alarms > 0 else 0.0
+            ),
+            false_alarm_rate=false_alarm_rate,
+            trust_delta=trust_delta,
+            fatigue_delta=(
+                float(self._fatigue[end - 1]) - float(self._fatigue[start])
+            ),
+            enforcement_ratio=ratio(Strategy.ENFORCEMENT),
+            support_ratio=ratio(Strategy.SUPPORT),
+            stabilization_ratio=ratio(Strategy.STABILIZATION),
+            governance_health=governance_health(false_alarm_rate, trust_delta),
+        )
+
+    # -----------------------------
+    # Rolling series
+    # -----------------------------
+
+    def series(self, window: int) -> List[PolicyEvaluation]:
+        """
+        Evaluations of every full window: entry i covers
+        logs[i:i + window]. Empty if the run is shorter.
+        """
+
+        if window <= 0:
+            raise ValueError("window must be positive")
+        return [
+            self.evaluate(start, start + window)
+            for start in range(self.days - window + 1)
+        ]
+
+    def all_series(
+        self, windows: Iterable[int] = WINDOW_SIZES
+    ) -> Dict[int, List[PolicyEvaluation]]:
+        return {window: self.series(window) for window in windows}
+
+    def health_flips(self, window: int) -> List[Tuple[int, str, str]]:
+        """
+        (window start index, previous health, new health)
+        wherever consecutive windows disagree.
+        """
+
+        series = self.series(window)
+        return [
+            (i, before.governance_health, after.governance_health)
+            for i, (before, after) in enumerate(
+                zip(series, series[1:]), start=1
+            )
+            if before.governance_health != after.governance_health
+        ]
@@ -0,0 +1,275 @@
+"""
+service/decision_service.py
+
+Long-running asyncio decision service.
+
+Accepts signal batches for many users over a local TCP or
+Unix socket, groups them into micro-batches (by size or
+deadline) and applies update_state + GoverningBrain.decide.
+
+Design principles:
+- Per-user state is owned by the service
+- Requests for one user are applied in arrival order
+- The governance core is called unchanged
+- The request queue is bounded: a slow apply loop makes
+  submitters wait
+- Each connection has at most max_in_flight requests pending;
+  its reader stops reading until one completes
+- A failed request gets an error line; it never takes down
+  the connection or other users' requests
+
+Run:
+    python -m service.decision_service --tcp 127.0.0.1:8765
+    python -m service.decision_service --unix /tmp/alarmsm.sock
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.inputs import SignalBatch
+from governing_brain.outputs import GovernanceDirective
+from governing_brain.state_model import BehavioralState, update_state
+from service.metrics import ServiceMetrics
+from service.protocol import (
+    RequestError,
+    decode_request,
+    encode_error,
+    encode_response,
+)
+
+
+# (user id, batch, result future, receive time)
+PendingRequest = Tuple[str, SignalBatch, asyncio.Future, float]
+
+
+class DecisionService:
+    """
+    Micro-batching governance decision service.
+    """
+
+    def __init__(
+        self,
+        brain: Optional[GoverningBrain] = None,
+        max_batch_size: int = 256,
+        max_batch_delay: float = 0.002,
+        max_queue_size: int = 4096,
+        max_in_flight: int = 256,
+    ):
+        self.brain = brain or GoverningBrain(
+            margin_cache=True, lazy_explanations=True
+        )
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.max_queue_size = max_queue_size
+        self.max_in_flight = max_in_flight
+
+        self.states: Dict[str, BehavioralState] = {}
+        self.metrics = ServiceMetrics()
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    # -----------------------------
+    # Lifecycle
+    # -----------------------------
+
+    async def start(self):
+        if self._batcher is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._batcher = asyncio.create_task(self._run_batcher())
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 8765):
+        await self.start()
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port
+        )
+        return self._server
+
+    async def start_unix(self, path: str):
+        await self.start()
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path
+        )
+        return self._server
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+
+    # -----------------------------
+    # In-process entry point
+    # -----------------------------
+
+    async def submit(
+        self, user_id: str, batch: SignalBatch
+    ) -> Tuple[BehavioralState, GovernanceDirective]:
+        """
+        Queues one user's signal batch and waits for the decision.
+
+        Waits for queue space when max_queue_size requests are
+        already pending. Errors from update_state / decide are
+        raised here.
+        """
+
+        if self._queue is None:
+            raise RuntimeError("service not started")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((user_id, batch, future, time.perf_counter()))
+        return await future
+
+    # -----------------------------
+    # Micro-batching
+    # -----------------------------
+
+    async def _run_batcher(self):
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+
+        while True:
+            pending: List[PendingRequest] = [await queue.get()]
+            deadline = loop.time() + self.max_batch_delay
+
+            while len(pending) < self.max_batch_size:
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        pending.append(
+                            await asyncio.wait_for(queue.get(), timeout)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    pending.append(queue.get_nowait())
+
+            self._apply(pending)
+
+    def _apply(self, pending: List[PendingRequest]):
+        states = self.states
+        brain = self.brain
+        metrics = self.metrics
+
+        for user_id, batch, future, _ in pending:
+            if future.done():
+                continue
+            try:
+                state = update_state(states.get(user_id), batch)
+                directive, _ = brain.decide(state, cache_key=user_id)
+            except Exception as exc:
+                future.set_exception(exc)
+                continue
+            states[user_id] = state
+            future.set_result((state, directive))
+
+        now = time.perf_counter()
+        metrics.record_batch(len(pending))
+        for _, _, _, received in pending:
+            metrics.record_latency(now - received)
+
+    # -----------------------------
+    # Socket handling
+    # -----------------------------
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        tasks = set()
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        def finished(task: asyncio.Task):
+            tasks.discard(task)
+            in_flight.release()
+
+        try:
+            while line := await reader.readline():
+                await in_flight.acquire()
+                task = asyncio.create_task(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(finished)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter):
+        try:
+            request_id, user_id, batch = decode_request(line)
+        except RequestError as exc:
+            self.metrics.errors += 1
+            writer.write(encode_error(exc.request_id, str(exc)))
+        else:
+            try:
+                state, directive = await self.submit(user_id, batch)
+            except Exception as exc:
+                self.metrics.errors += 1
+                writer.write(encode_error(request_id, str(exc)))
+            else:
+                writer.write(
+                    encode_response(request_id, user_id, state, directive)
+                )
+        await writer.drain()
+
+
+async def _serve(args):
+    service = DecisionService(
+        max_batch_size=args.max_batch_size,
+        max_batch_delay=args.max_batch_delay_ms / 1e3,
+        max_queue_size=args.max_queue_size,
+        max_in_flight=args.max_in_flight,
+    )
+
+    if args.unix:
+        server = await service.start_unix(args.unix)
+    else:
+        host, _, port = args.tcp.rpartition(":")
+        server = await service.start_tcp(host, int(port))
+
+    print(f"AlarmSM decision service listening on {args.unix or args.tcp}")
+    try:
+        async with server:
+            while True:
+                await asyncio.sleep(args.report_every)
+                print(service.metrics.snapshot())
+    finally:
+        await service.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--tcp", default="127.0.0.1:8765")
+    parser.add_argument("--unix")
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-batch-delay-ms", type=float, default=2.0)
+    parser.add_argument("--max-queue-size", type=int, default=4096)
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--report-every", type=float, default=10.0)
+
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+service/load_client.py
+
+Stand-in client for load-testing the decision service.
+
+Opens one connection per simulated ingestion worker and
+pipelines signal batches for many users over it.
+
+Run (starts an in-process service on a free port):
+    python -m service.load_client --users 1000 --requests 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.state_model import SIGNAL_EFFECTS
+from service.decision_service import DecisionService
+from service.protocol import encode_batch
+
+
+def make_request_batch(rng: random.Random, day: int) -> SignalBatch:
+    end = datetime(2025, 1, 1) + timedelta(days=day)
+    names = sorted(SIGNAL_EFFECTS)
+    return SignalBatch(
+        signals=[
+            Signal(rng.choice(names), 1.0, rng.random(), end)
+            for _ in range(rng.randint(1, 4))
+        ],
+        window_start=end - timedelta(hours=8),
+        window_end=end,
+    )
+
+
+async def _connection_worker(
+    host: str,
+    port: int,
+    user_ids: List[str],
+    requests_per_user: int,
+    latencies: List[float],
+    seed: int,
+):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    sent: Dict[int, float] = {}
+
+    async def read_responses(expected: int):
+        for _ in range(expected):
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent.pop(response["id"]))
+
+    total = len(user_ids) * requests_per_user
+    reading = asyncio.create_task(read_responses(total))
+
+    request_id = 0
+    for day in range(requests_per_user):
+        for user_id in user_ids:
+            sent[request_id] = time.perf_counter()
+            writer.write(
+                encode_batch(user_id, make_request_batch(rng, day), request_id)
+            )
+            request_id += 1
+        await writer.drain()
+
+    await reading
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load_test(
+    users: int = 1_000,
+    requests_per_user: int = 20,
+    connections: int = 4,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> Dict[str, float]:
+    """
+    Drives a service (started in-process when port is 0) and
+    returns client-side latency and throughput figures,
+    merged with the service's own metrics.
+    """
+
+    service = None
+    if port == 0:
+        service = DecisionService()
+        server = await service.start_tcp(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    user_ids = [f"user-{i}" for i in range(users)]
+    latencies: List[float] = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _connection_worker(
+            host, port, user_ids[c::connections],
+            requests_per_user, latencies, seed=c,
+        )
+        for c in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    result = {
+        "client_requests": len(ordered),
+        "client_throughput_rps": len(ordered) / elapsed,
+        "client_p50_ms": ordered[len(ordered) // 2] * 1e3,
+        "client_p99_ms": ordered[int(0.99 * (len(ordered) - 1))] * 1e3,
+    }
+
+    if service is not None:
+        result.update(service.metrics.snapshot())
+        await service.stop()
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decision service load test")
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load_test(
+        args.users, args.requests, args.connections, args.host, args.port
+    ))
+    for key, value in result.items():
+        print(f"{key:>22} : {value:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
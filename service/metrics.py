@@ -0,0 +1,53 @@
+"""
+service/metrics.py
+
+Latency and throughput metrics for the decision service.
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict
+
+
+class ServiceMetrics:
+    """
+    Rolling request latency sample plus lifetime counters.
+    """
+
+    def __init__(self, sample_size: int = 100_000):
+        self.latencies: Deque[float] = deque(maxlen=sample_size)
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self.started = time.perf_counter()
+
+    def record_batch(self, size: int):
+        self.batches += 1
+        self.requests += size
+
+    def record_latency(self, seconds: float):
+        self.latencies.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        """
+        Latency percentile in seconds (q in [0, 100]).
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = min(len(ordered) - 1, int(q / 100 * len(ordered)))
+        return ordered[rank]
+
+    def snapshot(self) -> Dict[str, float]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "errors": self.errors,
+            "mean_batch_size": (
+                self.requests / self.batches if self.batches else 0.0
+            ),
+            "p50_ms": self.percentile(50) * 1e3,
+            "p99_ms": self.percentile(99) * 1e3,
+            "throughput_rps": self.requests / elapsed if elapsed else 0.0,
+        }
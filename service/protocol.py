@@ -0,0 +1,112 @@
+"""
+service/protocol.py
+
+Newline-delimited JSON protocol for the decision service.
+
+Request:
+    {"id": 1, "user_id": "u-17",
+     "window_start": "<iso>", "window_end": "<iso>",
+     "signals": [{"name": "...", "value": 1.0,
+                  "confidence": 0.8, "timestamp": "<iso>"}]}
+
+Response:
+    {"id": 1, "user_id": "u-17", "strategy": "support",
+     "required_strictness": 0.3, "state": {...}}
+    or {"id": 1, "error": "<message>"}
+"""
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.outputs import GovernanceDirective
+from governing_brain.state_model import BehavioralState
+
+
+class RequestError(ValueError):
+    """
+    Malformed request; carries the request id when it was readable.
+    """
+
+    def __init__(self, message: str, request_id: Any = None):
+        super().__init__(message)
+        self.request_id = request_id
+
+
+def decode_request(line: bytes) -> Tuple[Any, str, SignalBatch]:
+    """
+    Parses one request line into (request id, user id, batch).
+    Raises RequestError on malformed input.
+    """
+
+    message: Any = None
+    try:
+        message = json.loads(line)
+        signals = [
+            Signal(
+                name=s["name"],
+                value=s.get("value", 1.0),
+                confidence=s["confidence"],
+                timestamp=datetime.fromisoformat(s["timestamp"]),
+                source=s.get("source"),
+            )
+            for s in message.get("signals", [])
+        ]
+        batch = SignalBatch(
+            signals=signals,
+            window_start=datetime.fromisoformat(message["window_start"]),
+            window_end=datetime.fromisoformat(message["window_end"]),
+        )
+        return message.get("id"), str(message["user_id"]), batch
+    except (KeyError, TypeError, AttributeError, ValueError) as exc:
+        request_id = message.get("id") if isinstance(message, dict) else None
+        raise RequestError(f"Malformed request: {exc!r}", request_id) from exc
+
+
+def encode_batch(
+    user_id: str, batch: SignalBatch, request_id: Any = None
+) -> bytes:
+    """
+    Encodes a request line (used by clients and tests).
+    """
+
+    message = {
+        "id": request_id,
+        "user_id": user_id,
+        "window_start": batch.window_start.isoformat(),
+        "window_end": batch.window_end.isoformat(),
+        "signals": [
+            {
+                "name": s.name,
+                "value": s.value,
+                "confidence": s.confidence,
+                "timestamp": s.timestamp.isoformat(),
+            }
+            for s in batch.signals
+        ],
+    }
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def encode_response(
+    request_id: Any,
+    user_id: str,
+    state: BehavioralState,
+    directive: GovernanceDirective,
+) -> bytes:
+    message: Dict[str, Any] = {
+        "id": request_id,
+        "user_id": user_id,
+        "strategy": directive.strategy.value,
+        "required_strictness": directive.required_strictness,
+        "state": asdict(state),
+    }
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def encode_error(request_id: Any, message: str) -> bytes:
+    return json.dumps({"id": request_id, "error": message}).encode(
+        "utf-8"
+    ) + b"\n"
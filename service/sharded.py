@@ -0,0 +1,248 @@
+"""
+service/sharded.py
+
+Multi-process sharded brain runtime.
+
+A coordinator hashes user ids onto N worker processes.
+Each worker owns the BehavioralState of its users and runs
+update_state + GoverningBrain.decide locally; results are
+merged back in request order.
+
+Design principles:
+- Stable sharding (crc32), independent of PYTHONHASHSEED
+- Requests for one user always reach the same worker, in order
+- Results come back as compact tuples; requests are sent as
+  pickled SignalBatch objects
+- A failing update_state / decide fails only its own request:
+  it comes back as a ShardError in that request's slot, the
+  user's state is left as it was before the request, and every
+  other request is applied
+"""
+
+import multiprocessing
+import os
+import pickle
+import zlib
+from dataclasses import astuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from governing_brain.brain import DIRECTIVES, GoverningBrain
+from governing_brain.inputs import SignalBatch
+from governing_brain.outputs import GovernanceDirective
+from governing_brain.state_model import BehavioralState, update_state
+from governing_brain.strategies import STRATEGIES_BY_CODE, STRATEGY_CODES
+
+
+Request = Tuple[str, SignalBatch]
+
+# (state values in BehavioralState field order, strategy code),
+# or (None, error description, picklable exception or None)
+ShardResult = Tuple[Optional[Tuple[float, ...]], object]
+
+
+class ShardError(RuntimeError):
+    """
+    A request or command that failed in a worker. The worker's
+    exception is chained as __cause__ when it could be pickled.
+    """
+
+
+def _shard_error(shard: int, description: str, cause) -> ShardError:
+    error = ShardError(f"shard {shard}: {description}")
+    error.__cause__ = cause
+    return error
+
+
+Decision = Tuple[BehavioralState, GovernanceDirective]
+
+
+# =========================================================
+# Worker
+# =========================================================
+
+def _worker_main(connection):
+    """
+    Worker loop: owns per-user state for one shard.
+    """
+
+    brain = GoverningBrain(margin_cache=True, lazy_explanations=True)
+    states: Dict[str, BehavioralState] = {}
+    codes = STRATEGY_CODES
+
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+
+        command, payload = message
+
+        try:
+            if command == "process":
+                results: List[ShardResult] = []
+                for user_id, batch in payload:
+                    try:
+                        state = update_state(states.get(user_id), batch)
+                        directive, _ = brain.decide(state, cache_key=user_id)
+                    except Exception as exc:
+                        results.append(
+                            (None, _describe(exc), _picklable(exc))
+                        )
+                        continue
+                    states[user_id] = state
+                    results.append((astuple(state), codes[directive.strategy]))
+                reply = results
+
+            elif command == "states":
+                reply = {
+                    user_id: astuple(state)
+                    for user_id, state in states.items()
+                }
+
+            else:
+                raise ValueError(f"Unknown shard command: {command!r}")
+
+        except Exception as exc:
+            connection.send(("error", _describe(exc), _picklable(exc)))
+        else:
+            connection.send(("ok", reply))
+
+    connection.close()
+
+
+def _describe(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _picklable(exc: BaseException) -> Optional[BaseException]:
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return None
+    return exc
+
+
+# =========================================================
+# Coordinator
+# =========================================================
+
+class ShardedBrain:
+    """
+    Coordinator for N brain worker processes.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.worker_count = workers or os.cpu_count() or 1
+        if self.worker_count < 1:
+            raise ValueError("ShardedBrain requires at least one worker")
+
+        self._connections = []
+        self._processes = []
+        for _ in range(self.worker_count):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker_main, args=(child,), daemon=True
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    # -----------------------------
+    # Routing
+    # -----------------------------
+
+    def shard_of(self, user_id: str) -> int:
+        return zlib.crc32(user_id.encode("utf-8")) % self.worker_count
+
+    def _receive(self, shards: Sequence[int]) -> List:
+        """
+        Reads one reply from each shard, then raises ShardError
+        for the first failed one. Every reply is read first so
+        the pipes stay in step.
+        """
+
+        replies = [self._connections[i].recv() for i in shards]
+        for shard, reply in zip(shards, replies):
+            if reply[0] == "error":
+                raise _shard_error(shard, reply[1], reply[2])
+        return [reply[1] for reply in replies]
+
+    def process(
+        self, requests: Sequence[Request]
+    ) -> List[Union[Decision, ShardError]]:
+        """
+        Applies one signal batch per request and returns
+        (state, directive) pairs in request order.
+
+        A request whose update_state / decide failed gets a
+        ShardError in its slot instead; nothing is raised.
+        Its user's state is unchanged by it, and every other
+        request (including later ones for the same user,
+        applied on top of the unchanged state) took effect.
+        Resubmitting only the failed requests therefore never
+        applies a batch twice.
+        """
+
+        shards: List[List[Request]] = [[] for _ in self._connections]
+        positions: List[List[int]] = [[] for _ in self._connections]
+
+        for index, request in enumerate(requests):
+            shard = self.shard_of(request[0])
+            shards[shard].append(request)
+            positions[shard].append(index)
+
+        # Fan out first so workers run concurrently
+        active = [i for i, items in enumerate(shards) if items]
+        for i in active:
+            self._connections[i].send(("process", shards[i]))
+
+        merged: List[Optional[Union[Decision, ShardError]]]
+        merged = [None] * len(requests)
+        for i, results in zip(active, self._receive(active)):
+            for index, result in zip(positions[i], results):
+                values = result[0]
+                if values is None:
+                    merged[index] = _shard_error(i, result[1], result[2])
+                else:
+                    merged[index] = (
+                        BehavioralState(*values),
+                        DIRECTIVES[STRATEGIES_BY_CODE[result[1]]],
+                    )
+
+        return merged
+
+    def states(self) -> Dict[str, BehavioralState]:
+        """
+        Collects every worker's user states.
+        """
+
+        for connection in self._connections:
+            connection.send(("states", None))
+
+        collected: Dict[str, BehavioralState] = {}
+        for states in self._receive(range(len(self._connections))):
+            for user_id, values in states.items():
+                collected[user_id] = BehavioralState(*values)
+        return collected
+
+    # -----------------------------
+    # Lifecycle
+    # -----------------------------
+
+    def close(self):
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join(timeout=5)
+        self._connections = []
+        self._processes = []
+
+    def __enter__(self) -> "ShardedBrain":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
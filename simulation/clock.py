@@ -0,0 +1,84 @@
+"""
+simulation/clock.py
+
+Simulated time for the simulation engines.
+
+Timestamps are a pure function of the simulated day, so a
+run produces the same SignalBatch windows whenever (and
+however often) it is replayed. No wall-clock calls.
+
+Day d (1-based, as in TimeEngine) "now" is:
+    start + (d - 1) * seconds_per_day
+
+Two views of the same instant:
+- now(day): naive UTC datetime (what Signal / SignalBatch use)
+- epoch_seconds(day) / epoch_us(day): integer fast path for
+  columnar consumers (SignalColumns, wire format) that never
+  need a datetime
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from governing_brain.inputs import NAIVE_EPOCH, epoch_us
+
+
+# Simulated wake-up time of day 1 (naive UTC)
+SIMULATION_START = datetime(2024, 1, 1, 7, 0)
+
+SECONDS_PER_DAY = 86_400
+
+
+@dataclass(frozen=True)
+class SimulatedClock:
+    """
+    Maps simulated day indices to timestamps.
+    """
+
+    start: datetime = SIMULATION_START
+    seconds_per_day: int = SECONDS_PER_DAY
+
+    _start_seconds: int = field(init=False, repr=False, compare=False)
+    _day: timedelta = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.start.tzinfo is not None:
+            raise ValueError("SimulatedClock start must be a naive UTC datetime")
+        if self.start.microsecond:
+            raise ValueError("SimulatedClock start must be a whole second")
+        if self.seconds_per_day <= 0:
+            raise ValueError("seconds_per_day must be positive")
+
+        object.__setattr__(
+            self, "_start_seconds", epoch_us(self.start) // 1_000_000
+        )
+        object.__setattr__(self, "_day", timedelta(seconds=self.seconds_per_day))
+
+    @classmethod
+    def from_epoch_seconds(
+        cls, start_seconds: int, seconds_per_day: int = SECONDS_PER_DAY
+    ) -> "SimulatedClock":
+        return cls(
+            start=NAIVE_EPOCH + timedelta(seconds=start_seconds),
+            seconds_per_day=seconds_per_day,
+        )
+
+    # -----------------------------
+    # datetime view
+    # -----------------------------
+
+    def now(self, day: int) -> datetime:
+        return self.start + (day - 1) * self._day
+
+    # -----------------------------
+    # Integer fast path
+    # -----------------------------
+
+    def epoch_seconds(self, day: int) -> int:
+        return self._start_seconds + (day - 1) * self.seconds_per_day
+
+    def epoch_us(self, day: int) -> int:
+        return self.epoch_seconds(day) * 1_000_000
+
+
+DEFAULT_CLOCK = SimulatedClock()
@@ -0,0 +1,298 @@
+"""
+simulation/log_segment.py
+
+Fixed-width binary log segments, opened with numpy.memmap.
+
+A segment stores one simulation run in the SimulationLogTable
+layout, on disk. Opening it maps the file instead of reading
+it, so PolicyEvaluator, WindowedEvaluator and the report can
+work on any slice of a run larger than RAM.
+
+Layout (little-endian):
+    prefix (see _PREFIX): magic, header length, rows,
+        signal codes, trailer length
+    header: JSON {schema, policy_version, seed}, space-padded
+        so that the records start on a 64-byte boundary
+    records: rows x RECORD_DTYPE (packed)
+    signal offsets: rows + 1 x int64 (8-byte aligned)
+    signal codes: uint16
+    trailer: JSON list of signal names (the code vocabulary)
+
+Design guarantees:
+- Rows are never deserialized up front
+- Writes are atomic (temp file + rename)
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, IO, Optional, Tuple
+
+import numpy as np
+
+from simulation.log_table import (
+    LogTableSink,
+    ROW_COLUMNS,
+    SimulationLogTable,
+)
+from simulation.metrics import SimulationLog
+from simulation.sinks import LogSink
+
+
+SEGMENT_MAGIC = b"ASMSEG1\n"
+
+# magic, header length, rows, signal codes, trailer length
+_PREFIX = struct.Struct("<8sIQQI")
+
+_ALIGNMENT = 64
+
+RECORD_DTYPE = np.dtype(
+    [(name, dtype.newbyteorder("<")) for name, dtype in ROW_COLUMNS.items()]
+)
+_OFFSET_DTYPE = np.dtype("<i8")
+_CODE_DTYPE = np.dtype("<u2")
+
+
+def _align(position: int, alignment: int) -> int:
+    return -(-position // alignment) * alignment
+
+
+def _schema() -> list:
+    return [[name, RECORD_DTYPE[name].str] for name in RECORD_DTYPE.names]
+
+
+def _layout(header_length: int, rows: int) -> Tuple[int, int, int]:
+    """
+    Byte positions of the records, signal offsets and codes.
+    """
+    records = _PREFIX.size + header_length
+    offsets = _align(records + rows * RECORD_DTYPE.itemsize, 8)
+    return records, offsets, offsets + (rows + 1) * _OFFSET_DTYPE.itemsize
+
+
+# =========================================================
+# Writing
+# =========================================================
+
+class LogSegmentWriter(LogSink):
+    """
+    Streams logs into a segment file, chunk by chunk.
+
+    Rows go to disk every chunk_size logs; only the signal
+    offsets and codes (about 10 bytes per day) stay in memory
+    until close().
+    """
+
+    def __init__(
+        self,
+        path: str,
+        policy_version: str,
+        seed: Optional[int] = None,
+        chunk_size: int = 65_536,
+    ):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self.path = Path(path)
+        self.policy_version = policy_version
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+        self._temporary = self.path.with_name(self.path.name + ".tmp")
+        self._sink = LogTableSink()
+        self._pending = 0
+        self._rows = 0
+        self._file: Optional[IO[bytes]] = self._temporary.open("wb")
+
+        header = json.dumps({
+            "schema": _schema(),
+            "policy_version": policy_version,
+            "seed": seed,
+        }).encode("utf-8")
+        self._header = header + b" " * (
+            _align(_PREFIX.size + len(header), _ALIGNMENT)
+            - _PREFIX.size - len(header)
+        )
+        self._file.write(_PREFIX.pack(SEGMENT_MAGIC, len(self._header), 0, 0, 0))
+        self._file.write(self._header)
+
+    def __len__(self) -> int:
+        return self._rows + self._pending
+
+    def write(self, log: SimulationLog):
+        self._sink.write(log)
+        self._pending += 1
+        if self._pending >= self.chunk_size:
+            self._flush()
+
+    def write_table(self, table: SimulationLogTable):
+        """
+        Appends every row of a SimulationLogTable.
+        """
+
+        self._flush()
+        if not len(table):
+            return
+
+        self._sink.append_signals(table)
+        self._write_records(table.columns)
+
+    def _flush(self):
+        if self._pending:
+            self._write_records(self._sink.take_rows())
+            self._pending = 0
+
+    def _write_records(self, columns: Dict[str, np.ndarray]):
+        size = len(columns["day"])
+        records = np.empty(size, dtype=RECORD_DTYPE)
+        for name in RECORD_DTYPE.names:
+            records[name] = columns[name]
+        self._file.write(records.tobytes())
+        self._rows += size
+
+    def close(self):
+        if self._file is None:
+            return
+
+        self._flush()
+        f = self._file
+        offsets, codes, names = self._sink.signals()
+        records_at, offsets_at, _ = _layout(len(self._header), self._rows)
+
+        f.write(b"\0" * (
+            offsets_at - records_at - self._rows * RECORD_DTYPE.itemsize
+        ))
+        f.write(offsets.astype(_OFFSET_DTYPE).tobytes())
+        f.write(codes.astype(_CODE_DTYPE).tobytes())
+        trailer = json.dumps(list(names)).encode("utf-8")
+        f.write(trailer)
+
+        f.seek(0)
+        f.write(_PREFIX.pack(
+            SEGMENT_MAGIC, len(self._header), self._rows,
+            len(codes), len(trailer),
+        ))
+        f.close()
+        self._file = None
+        os.replace(self._temporary, self.path)
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            # Leave no partial segment behind
+            self._file.close()
+            self._file = None
+            self._temporary.unlink()
+
+
+def save_segment(
+    table: SimulationLogTable,
+    path: str,
+    policy_version: str,
+    seed: Optional[int] = None,
+):
+    with LogSegmentWriter(path, policy_version, seed) as writer:
+        writer.write_table(table)
+
+
+# =========================================================
+# Reading
+# =========================================================
+
+class LogSegment:
+    """
+    A memory-mapped segment. Slicing returns a
+    SimulationLogTable whose columns are views of the file.
+
+    close() (or leaving a `with` block) drops the segment's
+    mappings; slices taken earlier keep theirs until they are
+    released.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+        with self.path.open("rb") as f:
+            prefix = f.read(_PREFIX.size)
+            if len(prefix) != _PREFIX.size or prefix[:8] != SEGMENT_MAGIC:
+                raise ValueError("Not a simulation log segment")
+            _, header_length, rows, codes, trailer_length = _PREFIX.unpack(prefix)
+            header = json.loads(f.read(header_length))
+
+            records_at, offsets_at, codes_at = _layout(header_length, rows)
+            trailer_at = codes_at + codes * _CODE_DTYPE.itemsize
+            f.seek(trailer_at)
+            trailer = f.read(trailer_length)
+            if len(trailer) != trailer_length or f.read(1):
+                raise ValueError("Truncated or corrupt simulation log segment")
+
+        if header["schema"] != _schema():
+            raise ValueError("Unsupported simulation log segment schema")
+
+        self.policy_version: str = header["policy_version"]
+        self.seed: Optional[int] = header["seed"]
+
+        def mapped(dtype: np.dtype, offset: int, count: int) -> np.ndarray:
+            if count == 0:
+                return np.empty(0, dtype=dtype)
+            return np.memmap(
+                self.path, dtype=dtype, mode="r", offset=offset, shape=(count,)
+            )
+
+        records = mapped(RECORD_DTYPE, records_at, rows)
+        self._table: Optional[SimulationLogTable] = SimulationLogTable(
+            columns={name: records[name] for name in RECORD_DTYPE.names},
+            signal_offsets=mapped(_OFFSET_DTYPE, offsets_at, rows + 1),
+            signal_codes=mapped(_CODE_DTYPE, codes_at, codes),
+            signal_names=tuple(json.loads(trailer)),
+        )
+
+    @property
+    def table(self) -> SimulationLogTable:
+        if self._table is None:
+            raise ValueError("Simulation log segment is closed")
+        return self._table
+
+    def close(self):
+        self._table = None
+
+    def __enter__(self) -> "LogSegment":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __getitem__(self, index: slice) -> SimulationLogTable:
+        return self.table[index]
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        return self.table.columns
+
+    def accumulator(self):
+        """
+        Lets PolicyEvaluator(segment) evaluate the whole run.
+        """
+        return self.table.accumulator()
+
+    def metadata(self, start: int = 0, stop: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run description for reports on rows [start, stop).
+        """
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        days = self.table.columns["day"]
+        return {
+            "segment": self.path.name,
+            "policy_version": self.policy_version,
+            "seed": self.seed,
+            "days": (
+                f"{int(days[start])}-{int(days[stop - 1])}"
+                if stop > start else "none"
+            ),
+        }
@@ -0,0 +1,460 @@
+"""
+simulation/log_table.py
+
+Columnar storage for simulation logs.
+
+A SimulationLogTable holds many simulated days as typed
+columns instead of one SimulationLog object per day.
+Signal names use a flattened layout: signal_codes holds
+every day's codes back to back, and day i's codes are
+signal_codes[signal_offsets[i]:signal_offsets[i + 1]].
+Codes index signal_names, which starts with the signal
+registry (stable codes) and is extended for unknown names.
+
+Explanations are not stored; every other SimulationLog.to_dict
+field can be exported (recovery_allowed follows the strategy).
+
+Requires NumPy.
+"""
+
+import csv
+import json
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from governing_brain.brain import DIRECTIVES
+from governing_brain.signal_registry import SIGNAL_NAMES
+from governing_brain.state_model import STATE_DIMENSIONS
+from governing_brain.strategies import STRATEGIES_BY_CODE, STRATEGY_CODES
+from policy_evolution.evaluator import (
+    PolicyEvaluationAccumulator,
+    TRUST_UNIT_BITS,
+)
+from simulation.metrics import SimulationLog
+from simulation.sinks import LogSink
+
+
+# =========================================================
+# Schema
+# =========================================================
+
+# outcome_success: -1 = None, 0 = False, 1 = True
+OUTCOME_NONE = -1
+
+ROW_COLUMNS: Dict[str, np.dtype] = {
+    "day": np.dtype(np.int32),
+    "strategy": np.dtype(np.uint8),
+    **{name: np.dtype(np.float64) for name in STATE_DIMENSIONS},
+    "required_strictness": np.dtype(np.float64),
+    "alarm_triggered": np.dtype(np.bool_),
+    "outcome_success": np.dtype(np.int8),
+    "trust_delta": np.dtype(np.float64),
+}
+
+# Export field names, matching SimulationLog.to_dict
+EXPORT_FIELDS = (
+    "day", "strategy", "discipline", "failure_risk", "fatigue",
+    "avoidance", "context", "momentum", "signal_names",
+    "required_strictness", "recovery_allowed", "alarm_triggered",
+    "outcome_success", "trust_delta",
+)
+
+# Rows per step when accumulating evaluation totals
+ACCUMULATE_CHUNK_ROWS = 65_536
+
+_RECOVERY_ALLOWED = np.array(
+    [DIRECTIVES[s].recovery_allowed for s in STRATEGIES_BY_CODE]
+)
+
+
+def _trust_units(trust: np.ndarray) -> int:
+    """
+    Exact sum of a trust_delta chunk in trust_units.
+
+    Each value is a 53-bit integer mantissa times a power of
+    two; mantissas are summed per exponent in 32-bit halves
+    (no int64 overflow below 2**31 rows) and shifted into
+    place as Python ints.
+    """
+
+    if not np.isfinite(trust).all():
+        raise ValueError("trust_delta values must be finite")
+
+    mantissa, exponent = np.frexp(trust)
+    mantissa = np.ldexp(mantissa, 53).astype(np.int64)
+
+    total = 0
+    for power in np.unique(exponent).tolist():
+        group = mantissa[exponent == power]
+        units = (int((group >> 32).sum()) << 32) + int(
+            (group & 0xFFFFFFFF).sum()
+        )
+        shift = TRUST_UNIT_BITS + power - 53
+        # Subnormal mantissas carry trailing zeros, so >> is exact
+        total += units << shift if shift >= 0 else units >> -shift
+    return total
+
+
+# =========================================================
+# Table
+# =========================================================
+
+@dataclass(frozen=True)
+class SimulationLogTable:
+    """
+    Simulated days as typed columns (see ROW_COLUMNS),
+    plus flattened signal names.
+    """
+
+    columns: Dict[str, np.ndarray]
+    signal_offsets: np.ndarray      # int64, len(table) + 1
+    signal_codes: np.ndarray        # uint16 indexes into signal_names
+    signal_names: Tuple[str, ...]
+
+    def __post_init__(self):
+        size = None
+        for name, dtype in ROW_COLUMNS.items():
+            column = self.columns[name]
+            if column.dtype != dtype or column.ndim != 1:
+                raise ValueError(f"Column {name} must be a 1-D {dtype} array")
+            if size is None:
+                size = column.shape[0]
+            elif column.shape[0] != size:
+                raise ValueError("SimulationLogTable columns must have equal length")
+
+        if self.signal_offsets.shape != (size + 1,):
+            raise ValueError("signal_offsets must have len(table) + 1 entries")
+
+    def __len__(self) -> int:
+        return self.signal_offsets.shape[0] - 1
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    # -----------------------------
+    # Construction
+    # -----------------------------
+
+    @classmethod
+    def from_logs(cls, logs: Iterable[SimulationLog]) -> "SimulationLogTable":
+        """
+        Builds a table from a log list or a TimeEngine.stream().
+        """
+        sink = LogTableSink()
+        for log in logs:
+            sink.write(log)
+        return sink.table()
+
+    @classmethod
+    def concat(
+        cls, tables: Iterable["SimulationLogTable"]
+    ) -> "SimulationLogTable":
+        tables = list(tables)
+        if not tables:
+            return LogTableSink().table()
+
+        names = max((t.signal_names for t in tables), key=len)
+        for table in tables:
+            if names[:len(table.signal_names)] != table.signal_names:
+                raise ValueError("Tables have incompatible signal vocabularies")
+
+        offsets = [np.zeros(1, dtype=np.int64)]
+        base = 0
+        for table in tables:
+            offsets.append(table.signal_offsets[1:] - table.signal_offsets[0] + base)
+            base += int(table.signal_offsets[-1] - table.signal_offsets[0])
+
+        return cls(
+            columns={
+                name: np.concatenate([t.columns[name] for t in tables])
+                for name in ROW_COLUMNS
+            },
+            signal_offsets=np.concatenate(offsets),
+            signal_codes=np.concatenate([
+                t.signal_codes[t.signal_offsets[0]:t.signal_offsets[-1]]
+                for t in tables
+            ]),
+            signal_names=names,
+        )
+
+    # -----------------------------
+    # Access
+    # -----------------------------
+
+    def __getitem__(self, index: slice) -> "SimulationLogTable":
+        """
+        Row slice (views of the columns; offsets are shared,
+        not rebased, so codes are sliced lazily by offset).
+        """
+
+        if not isinstance(index, slice):
+            raise TypeError("SimulationLogTable supports slicing only; use row()")
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            raise ValueError("SimulationLogTable slices must be contiguous")
+        stop = max(start, stop)
+
+        return SimulationLogTable(
+            columns={
+                name: column[start:stop]
+                for name, column in self.columns.items()
+            },
+            signal_offsets=self.signal_offsets[start:stop + 1],
+            signal_codes=self.signal_codes,
+            signal_names=self.signal_names,
+        )
+
+    def signal_names_at(self, index: int) -> List[str]:
+        names = self.signal_names
+        codes = self.signal_codes[
+            self.signal_offsets[index]:self.signal_offsets[index + 1]
+        ]
+        return [names[code] for code in codes.tolist()]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        One day as SimulationLog.to_dict() (without explanation).
+        """
+        return next(self._export_rows(index, index + 1, as_list=True))
+
+    # -----------------------------
+    # Evaluation
+    # -----------------------------
+
+    def accumulator(self) -> PolicyEvaluationAccumulator:
+        """
+        PolicyEvaluator totals computed column-wise.
+        PolicyEvaluator(table).evaluate() uses this.
+        """
+
+        accumulator = PolicyEvaluationAccumulator()
+        if not len(self):
+            return accumulator
+
+        fatigue = self.columns["fatigue_index"]
+        accumulator.days = len(self)
+
+        # Chunked, so temporaries stay bounded for memory-mapped
+        # runs; trust is summed exactly, like the accumulator.
+        for start in range(0, len(self), ACCUMULATE_CHUNK_ROWS):
+            stop = start + ACCUMULATE_CHUNK_ROWS
+            alarms = self.columns["alarm_triggered"][start:stop]
+            outcome = self.columns["outcome_success"][start:stop]
+            trust = self.columns["trust_delta"][start:stop]
+
+            accumulator.alarms += int(np.count_nonzero(alarms))
+            accumulator.successes += int(
+                np.count_nonzero(alarms & (outcome == 1))
+            )
+            accumulator.false_alarms += int(
+                np.count_nonzero(alarms & (outcome == 0))
+            )
+            accumulator.trust_units += _trust_units(trust)
+
+        accumulator.first_fatigue = float(fatigue[0])
+        accumulator.last_fatigue = float(fatigue[-1])
+
+        counts = np.bincount(
+            self.columns["strategy"], minlength=len(STRATEGIES_BY_CODE)
+        )
+        for code, count in enumerate(counts.tolist()):
+            if count:
+                accumulator.strategy_counts[STRATEGIES_BY_CODE[code]] = count
+        return accumulator
+
+    # -----------------------------
+    # Bulk export
+    # -----------------------------
+
+    def _export_columns(self, start: int, stop: int, as_list: bool):
+        c = {name: column[start:stop] for name, column in self.columns.items()}
+        strategy_values = [s.value for s in STRATEGIES_BY_CODE]
+        names = self.signal_names
+        codes = self.signal_codes
+        offsets = self.signal_offsets[start:stop + 1].tolist()
+
+        signal_names = [
+            [names[code] for code in codes[a:b].tolist()]
+            for a, b in zip(offsets, offsets[1:])
+        ]
+        if not as_list:
+            signal_names = [";".join(day) for day in signal_names]
+
+        outcome = [
+            None if value == OUTCOME_NONE else bool(value)
+            for value in c["outcome_success"].tolist()
+        ]
+
+        return (
+            c["day"].tolist(),
+            [strategy_values[code] for code in c["strategy"].tolist()],
+            c["discipline_level"].tolist(),
+            c["failure_risk"].tolist(),
+            c["fatigue_index"].tolist(),
+            c["avoidance_tendency"].tolist(),
+            c["context_importance"].tolist(),
+            c["momentum_trend"].tolist(),
+            signal_names,
+            c["required_strictness"].tolist(),
+            _RECOVERY_ALLOWED[c["strategy"]].tolist(),
+            c["alarm_triggered"].tolist(),
+            outcome,
+            c["trust_delta"].tolist(),
+        )
+
+    def _export_rows(self, start: int, stop: int, as_list: bool):
+        for values in zip(*self._export_columns(start, stop, as_list)):
+            yield dict(zip(EXPORT_FIELDS, values))
+
+    def to_jsonl(self, path: str, chunk_size: int = 65_536):
+        """
+        Writes one JSON object per day, converting columns
+        chunk by chunk.
+        """
+
+        dumps = json.dumps
+        with Path(path).open("w", encoding="utf-8") as f:
+            for start in range(0, len(self), chunk_size):
+                stop = min(start + chunk_size, len(self))
+                f.write("".join(
+                    dumps(row) + "\n"
+                    for row in self._export_rows(start, stop, as_list=True)
+                ))
+
+    def to_csv(self, path: str, chunk_size: int = 65_536):
+        """
+        Writes a header and one row per day; signal names
+        are joined with ';'.
+        """
+
+        with Path(path).open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_FIELDS)
+            for start in range(0, len(self), chunk_size):
+                stop = min(start + chunk_size, len(self))
+                writer.writerows(
+                    zip(*self._export_columns(start, stop, as_list=False))
+                )
+
+
+# =========================================================
+# Builder
+# =========================================================
+
+class LogTableSink(LogSink):
+    """
+    Log sink that appends into typed column buffers.
+    """
+
+    def __init__(self):
+        self._rows = {
+            name: array(dtype.char if name != "alarm_triggered" else "b")
+            for name, dtype in ROW_COLUMNS.items()
+        }
+        self._offsets = array("q", [0])
+        self._codes = array("H")
+        self._names: List[str] = list(SIGNAL_NAMES)
+        self._index = {name: code for code, name in enumerate(SIGNAL_NAMES)}
+
+    def write(self, log: SimulationLog):
+        rows = self._rows
+        state = log.state
+        directive = log.directive
+
+        rows["day"].append(log.day)
+        rows["strategy"].append(STRATEGY_CODES[directive.strategy])
+        rows["discipline_level"].append(state.discipline_level)
+        rows["failure_risk"].append(state.failure_risk)
+        rows["avoidance_tendency"].append(state.avoidance_tendency)
+        rows["fatigue_index"].append(state.fatigue_index)
+        rows["context_importance"].append(state.context_importance)
+        rows["momentum_trend"].append(state.momentum_trend)
+        rows["required_strictness"].append(directive.required_strictness)
+        rows["alarm_triggered"].append(bool(log.alarm_triggered))
+        rows["outcome_success"].append(
+            OUTCOME_NONE if log.outcome_success is None
+            else int(log.outcome_success)
+        )
+        rows["trust_delta"].append(log.trust_delta)
+
+        index = self._index
+        for name in log.signal_names:
+            code = index.get(name)
+            self._codes.append(code if code is not None else self.code_of(name))
+        self._offsets.append(len(self._codes))
+
+    def code_of(self, name: str) -> int:
+        """
+        Vocabulary code of a signal name, appending new names.
+        """
+        code = self._index.get(name)
+        if code is None:
+            code = self._index[name] = len(self._names)
+            self._names.append(name)
+        return code
+
+    def append_signals(self, table: SimulationLogTable):
+        """
+        Appends the signal names of every row of table (its
+        codes remapped to this sink's vocabulary), without rows.
+        """
+
+        if not len(table):
+            return
+        vocabulary = np.array(
+            [self.code_of(name) for name in table.signal_names],
+            dtype=np.uint16,
+        )
+        first = int(table.signal_offsets[0])
+        base = len(self._codes)
+        self._codes.extend(
+            vocabulary[table.signal_codes[first:table.signal_offsets[-1]]].tolist()
+        )
+        self._offsets.extend((table.signal_offsets[1:] - first + base).tolist())
+
+    def signals(self) -> Tuple[np.ndarray, np.ndarray, Tuple[str, ...]]:
+        """
+        (signal_offsets, signal_codes, signal_names) so far.
+        """
+        return (
+            np.array(self._offsets, dtype=np.int64),
+            np.array(self._codes, dtype=np.uint16),
+            tuple(self._names),
+        )
+
+    def take_rows(self) -> Dict[str, np.ndarray]:
+        """
+        Returns the row columns buffered so far and clears them.
+        Signal offsets and codes are kept (they stay cumulative),
+        so a sink drained this way cannot build a table().
+        """
+
+        columns = {
+            name: np.array(self._rows[name], dtype=dtype)
+            for name, dtype in ROW_COLUMNS.items()
+        }
+        for buffer in self._rows.values():
+            del buffer[:]
+        return columns
+
+    def table(self) -> SimulationLogTable:
+        offsets, codes, names = self.signals()
+        return SimulationLogTable(
+            columns={
+                name: np.array(self._rows[name], dtype=dtype)
+                for name, dtype in ROW_COLUMNS.items()
+            },
+            signal_offsets=offsets,
+            signal_codes=codes,
+            signal_names=names,
+        )
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from governing_brain.state_model import BehavioralState
 from governing_brain.inputs import SignalBatch
@@ -7,6 +7,9 @@ from governing_brain.outputs import GovernanceDirective
 from governing_brain.explanations import ExplanationRecord
 from governing_brain.strategies import Strategy
 
+if TYPE_CHECKING:
+    from governing_brain.signal_columns import SignalColumns
+
 
 @dataclass(frozen=True)
 class SimulationLog:
@@ -16,7 +19,7 @@ class SimulationLog:
 
     day: int
     state: BehavioralState
-    signals: SignalBatch
+    signals: "SignalBatch | SignalColumns"
     directive: GovernanceDirective
     explanation: ExplanationRecord
 
@@ -29,6 +32,15 @@ class SimulationLog:
     # Convenience accessors
     # -------------------------------------------------
 
+    @property
+    def signal_names(self) -> List[str]:
+        signals = self.signals
+        if isinstance(signals, SignalBatch):
+            return [s.name for s in signals.signals]
+        # SignalColumns (TimeEngine columnar_signals=True)
+        names = signals.names
+        return [names[code] for code in signals.codes.tolist()]
+
     @property
     def strategy(self) -> Strategy:
         return self.directive.strategy
@@ -71,7 +83,7 @@ class SimulationLog:
             "avoidance": self.avoidance,
             "context": self.context,
             "momentum": self.momentum,
-            "signal_names": [s.name for s in self.signals.signals],
+            "signal_names": self.signal_names,
             "required_strictness": self.directive.required_strictness,
             "recovery_allowed": self.directive.recovery_allowed,
             "alarm_triggered": self.alarm_triggered,
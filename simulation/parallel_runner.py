@@ -0,0 +1,291 @@
+"""
+simulation/parallel_runner.py
+
+Runs many SyntheticUser simulations over a process pool.
+
+Each user configuration gets a seed derived from a root
+seed and its position in the list (seed-sequence style),
+so a user's trajectory never depends on which worker ran
+it. Workers reduce their users to a mergeable
+SimulationAggregate instead of shipping SimulationLogs.
+
+Design guarantees:
+- Identical results for any worker count (fixed chunking,
+  chunks merged in configuration order)
+- Per-user seeds are stable across runs and platforms
+- TimeEngine and SyntheticUser are used unchanged
+"""
+
+import hashlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.strategies import Strategy
+from policy_evolution.evaluation import PolicyEvaluation
+from policy_evolution.evaluator import (
+    PolicyEvaluationAccumulator,
+    governance_health,
+)
+from simulation.metrics import SimulationLog
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+# =========================================================
+# User Configuration & Seeding
+# =========================================================
+
+@dataclass(frozen=True)
+class SyntheticUserConfig:
+    """
+    Picklable SyntheticUser parameters. seed=None means
+    "derive from the runner's root seed".
+    """
+
+    name: str
+    compliance_bias: float = 0.6
+    fatigue_sensitivity: float = 0.5
+    avoidance_tendency: float = 0.3
+    seed: Optional[int] = None
+
+    def build(self, seed: int) -> SyntheticUser:
+        return SyntheticUser(
+            name=self.name,
+            compliance_bias=self.compliance_bias,
+            fatigue_sensitivity=self.fatigue_sensitivity,
+            avoidance_tendency=self.avoidance_tendency,
+            seed=seed,
+        )
+
+
+def derive_seed(root_seed: int, index: int) -> int:
+    """
+    64-bit seed for the index-th configuration, hashed from
+    (root_seed, index) so neighbouring streams are unrelated.
+    """
+    digest = hashlib.blake2b(
+        f"{root_seed}:{index}".encode("ascii"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
+# =========================================================
+# Mergeable Aggregate
+# =========================================================
+
+@dataclass
+class SimulationAggregate:
+    """
+    Sums of PolicyEvaluator inputs over any number of
+    simulated users. Merging is concatenation-ordered: merge
+    aggregates in configuration order for reproducible floats.
+    """
+
+    users: int = 0
+    user_days: int = 0
+    alarms: int = 0
+    successes: int = 0
+    false_alarms: int = 0
+    trust_delta: float = 0.0
+    fatigue_delta: float = 0.0
+    strategy_counts: Counter = field(default_factory=Counter)
+    health_counts: Counter = field(default_factory=Counter)
+
+    def add_user(self, logs: Iterable[SimulationLog]):
+        """
+        Absorbs one user's simulation logs (a list or a
+        TimeEngine.stream()).
+        """
+
+        user = PolicyEvaluationAccumulator().extend(logs)
+        evaluation = user.evaluate()
+
+        self.users += 1
+        self.user_days += user.days
+        self.alarms += user.alarms
+        self.successes += user.successes
+        self.false_alarms += user.false_alarms
+        for strategy, count in user.strategy_counts.items():
+            self.strategy_counts[strategy.value] += count
+        self.trust_delta += evaluation.trust_delta
+        self.fatigue_delta += evaluation.fatigue_delta
+        self.health_counts[evaluation.governance_health] += 1
+
+    def merge(self, other: "SimulationAggregate") -> "SimulationAggregate":
+        return SimulationAggregate(
+            users=self.users + other.users,
+            user_days=self.user_days + other.user_days,
+            alarms=self.alarms + other.alarms,
+            successes=self.successes + other.successes,
+            false_alarms=self.false_alarms + other.false_alarms,
+            trust_delta=self.trust_delta + other.trust_delta,
+            fatigue_delta=self.fatigue_delta + other.fatigue_delta,
+            strategy_counts=self.strategy_counts + other.strategy_counts,
+            health_counts=self.health_counts + other.health_counts,
+        )
+
+    __add__ = merge
+
+    def evaluate(self) -> PolicyEvaluation:
+        """
+        Population-level evaluation: rates pooled over all
+        user-days, trust and fatigue deltas averaged per user.
+        window_days is the mean simulated days per user.
+        """
+
+        if self.users == 0:
+            raise ValueError("SimulationAggregate contains no users")
+
+        days = self.user_days
+        false_alarm_rate = (
+            self.false_alarms / self.alarms if self.alarms else 0.0
+        )
+        trust_delta = self.trust_delta / self.users
+
+        return PolicyEvaluation(
+            window_days=days // self.users,
+            alarm_trigger_rate=self.alarms / days,
+            success_rate=self.successes / self.alarms if self.alarms else 0.0,
+            false_alarm_rate=false_alarm_rate,
+            trust_delta=trust_delta,
+            fatigue_delta=self.fatigue_delta / self.users,
+            enforcement_ratio=(
+                self.strategy_counts[Strategy.ENFORCEMENT.value] / days
+            ),
+            support_ratio=self.strategy_counts[Strategy.SUPPORT.value] / days,
+            stabilization_ratio=(
+                self.strategy_counts[Strategy.STABILIZATION.value] / days
+            ),
+            governance_health=governance_health(
+                false_alarm_rate, trust_delta
+            ),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "users": self.users,
+            "user_days": self.user_days,
+            "alarms": self.alarms,
+            "successes": self.successes,
+            "false_alarms": self.false_alarms,
+            "trust_delta": self.trust_delta,
+            "fatigue_delta": self.fatigue_delta,
+            "strategy_counts": dict(self.strategy_counts),
+            "health_counts": dict(self.health_counts),
+        }
+
+
+# =========================================================
+# Chunked Dispatch
+# =========================================================
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(items: Sequence[T], chunk_size: int) -> List[Tuple[T, ...]]:
+    """
+    Consecutive chunks of chunk_size items (the last may be
+    shorter).
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    items = tuple(items)
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def map_chunks(
+    function: Callable[..., R],
+    chunks: Sequence[Tuple[T, ...]],
+    *args: Any,
+    workers: Optional[int] = None,
+) -> Iterator[R]:
+    """
+    Yields function(chunk, *args) for every chunk, in chunk
+    order, as results arrive.
+
+    workers=1 (or a single chunk) runs in-process; otherwise
+    chunks go to a ProcessPoolExecutor, so function, chunks
+    and args must be picklable.
+    """
+
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield function(chunk, *args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            function, chunks, *([arg] * len(chunks) for arg in args)
+        )
+
+
+# =========================================================
+# Runner
+# =========================================================
+
+# (index, config) pairs of one unit of work
+Chunk = Tuple[Tuple[int, SyntheticUserConfig], ...]
+
+
+def simulate_chunk(
+    chunk: Chunk, days: int, root_seed: int
+) -> SimulationAggregate:
+    """
+    Simulates every configuration of a chunk, in order.
+    """
+
+    aggregate = SimulationAggregate()
+    for index, config in chunk:
+        seed = (
+            config.seed if config.seed is not None
+            else derive_seed(root_seed, index)
+        )
+        engine = TimeEngine(
+            brain=GoverningBrain(lazy_explanations=True),
+            user=config.build(seed),
+            total_days=days,
+        )
+        aggregate.add_user(engine.stream())
+    return aggregate
+
+
+def run_parallel_simulation(
+    configs: Sequence[SyntheticUserConfig],
+    days: int = 30,
+    root_seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: int = 16,
+) -> SimulationAggregate:
+    """
+    Simulates every configuration for `days` days and returns
+    the merged aggregate.
+
+    workers=1 runs in-process. chunk_size (not the worker
+    count) fixes how users are grouped, so it is part of the
+    reproducibility contract.
+    """
+
+    chunks: List[Chunk] = chunked(tuple(enumerate(configs)), chunk_size)
+
+    total = SimulationAggregate()
+    for result in map_chunks(
+        simulate_chunk, chunks, days, root_seed, workers=workers
+    ):
+        total = total.merge(result)
+    return total
@@ -0,0 +1,430 @@
+"""
+population.py
+
+Population-scale vectorized counterpart of TimeEngine.
+
+Simulates N synthetic users at once: user parameters,
+behavioral state and strategies are arrays, and each day's
+SyntheticUser.generate_signals / react probabilities are
+evaluated for the whole population with a NumPy Generator.
+
+Design guarantees:
+- Same behavior model as SyntheticUser (same probabilities,
+  signals, confidences and reaction rules)
+- Same four uniform draws per user and day, in the same order,
+  so replaying them through TimeEngine reproduces every log
+- Bit-identical state updates (signals added in batch order)
+- Outcomes kept as per-user accumulators, not logs
+
+Requires NumPy.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from governing_brain.brain import DIRECTIVES
+from governing_brain.policies.batch_router import select_strategy_batch
+from governing_brain.signal_registry import EFFECTS_BY_CODE, SIGNAL_CODES
+from governing_brain.state_array import BehavioralStateArray
+from governing_brain.state_model import (
+    MOMENTUM_DECAY,
+    NO_EFFECT,
+    STATE_DIMENSIONS,
+)
+from governing_brain.strategies import (
+    Strategy,
+    STRATEGIES_BY_CODE,
+    STRATEGY_CODES,
+)
+from policy_evolution.evaluation import PolicyEvaluation
+from policy_evolution.evaluator import governance_health
+from simulation.synthetic_users import SyntheticUser
+
+
+# =========================================================
+# Behavior Model Tables
+# =========================================================
+
+ENFORCEMENT = STRATEGY_CODES[Strategy.ENFORCEMENT]
+SUPPORT = STRATEGY_CODES[Strategy.SUPPORT]
+STABILIZATION = STRATEGY_CODES[Strategy.STABILIZATION]
+
+# Sentinel for "no directive yet" (SyntheticUser.last_directive is None)
+NO_DIRECTIVE = 255
+
+# Strictness per strategy code, from the interned directives
+REQUIRED_STRICTNESS = np.array(
+    [DIRECTIVES[s].required_strictness for s in STRATEGIES_BY_CODE]
+)
+
+# Registry effects plus one trailing "no signal" entry of -0.0
+# (the exact additive identity, see state_model.NO_EFFECT),
+# stored dimensions x codes so per-day deltas are row-contiguous
+_EFFECTS = np.ascontiguousarray(np.array(
+    EFFECTS_BY_CODE + ((NO_EFFECT,) * len(STATE_DIMENSIONS),)
+).T)
+_NO_SIGNAL = len(EFFECTS_BY_CODE)
+
+_CLEAN_DISMISSAL = SIGNAL_CODES["clean_alarm_dismissal"]
+_EARLY_WAKE = SIGNAL_CODES["early_wake_success"]
+_ALARM_FAILURE = SIGNAL_CODES["alarm_failure"]
+_EXCESSIVE_SNOOZE = SIGNAL_CODES["excessive_snooze"]
+_LATE_NIGHT = SIGNAL_CODES["late_night_usage"]
+
+StrategyBatchRouter = Callable[[BehavioralStateArray], np.ndarray]
+
+
+# =========================================================
+# Population Parameters
+# =========================================================
+
+@dataclass
+class SyntheticPopulation:
+    """
+    SyntheticUser parameters of N users, one array each.
+    """
+
+    compliance_bias: np.ndarray
+    fatigue_sensitivity: np.ndarray
+    avoidance_tendency: np.ndarray
+
+    def __post_init__(self):
+        for name in ("compliance_bias", "fatigue_sensitivity",
+                     "avoidance_tendency"):
+            column = np.ascontiguousarray(getattr(self, name), dtype=np.float64)
+            if column.shape != np.shape(self.compliance_bias):
+                raise ValueError(
+                    "SyntheticPopulation columns must have equal length"
+                )
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        return self.compliance_bias.shape[0]
+
+    @classmethod
+    def from_users(
+        cls, users: Sequence[SyntheticUser]
+    ) -> "SyntheticPopulation":
+        return cls(
+            compliance_bias=[u.compliance_bias for u in users],
+            fatigue_sensitivity=[u.fatigue_sensitivity for u in users],
+            avoidance_tendency=[u.avoidance_tendency for u in users],
+        )
+
+    @classmethod
+    def uniform(
+        cls,
+        size: int,
+        seed: int = 0,
+        compliance_bias: Tuple[float, float] = (0.4, 0.8),
+        fatigue_sensitivity: Tuple[float, float] = (0.3, 0.7),
+        avoidance_tendency: Tuple[float, float] = (0.1, 0.5),
+    ) -> "SyntheticPopulation":
+        """
+        N users with parameters drawn uniformly from the given ranges.
+        """
+        rng = np.random.default_rng(seed)
+        return cls(
+            compliance_bias=rng.uniform(*compliance_bias, size),
+            fatigue_sensitivity=rng.uniform(*fatigue_sensitivity, size),
+            avoidance_tendency=rng.uniform(*avoidance_tendency, size),
+        )
+
+
+# =========================================================
+# Per-Day Results
+# =========================================================
+
+@dataclass(frozen=True)
+class PopulationDay:
+    """
+    One simulated day for every user (SimulationLog columns).
+    """
+
+    day: int
+    states: BehavioralStateArray
+    strategies: np.ndarray          # uint8 strategy codes
+    alarm_triggered: np.ndarray     # bool
+    outcome_success: np.ndarray     # bool
+    trust_delta: np.ndarray         # float64
+
+
+@dataclass
+class PopulationOutcome:
+    """
+    Per-user accumulators of the PolicyEvaluator metrics.
+    """
+
+    days: int
+    alarms: np.ndarray
+    successes: np.ndarray
+    trust_delta: np.ndarray
+    first_fatigue: np.ndarray
+    last_fatigue: np.ndarray
+    strategy_counts: np.ndarray     # (users x strategies)
+
+    @classmethod
+    def empty(cls, size: int) -> "PopulationOutcome":
+        return cls(
+            days=0,
+            alarms=np.zeros(size, dtype=np.int64),
+            successes=np.zeros(size, dtype=np.int64),
+            trust_delta=np.zeros(size),
+            first_fatigue=np.full(size, np.nan),
+            last_fatigue=np.full(size, np.nan),
+            strategy_counts=np.zeros(
+                (size, len(STRATEGIES_BY_CODE)), dtype=np.int64
+            ),
+        )
+
+    def __len__(self) -> int:
+        return self.alarms.shape[0]
+
+    def add_day(self, day: PopulationDay):
+        if self.days == 0:
+            self.first_fatigue = day.states.fatigue_index.copy()
+        self.days += 1
+        self.alarms += day.alarm_triggered
+        self.successes += day.outcome_success
+        self.trust_delta += day.trust_delta
+        self.last_fatigue = day.states.fatigue_index.copy()
+        self.strategy_counts[
+            np.arange(len(self)), day.strategies
+        ] += 1
+
+    # -----------------------------
+    # Evaluation
+    # -----------------------------
+
+    def metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Per-user PolicyEvaluation metrics as arrays.
+        """
+
+        if self.days == 0:
+            raise ValueError("PopulationOutcome has no simulated days")
+
+        alarms = self.alarms
+        has_alarms = alarms > 0
+        safe_alarms = np.where(has_alarms, alarms, 1)
+        ratios = self.strategy_counts / self.days
+
+        return {
+            "alarm_trigger_rate": alarms / self.days,
+            "success_rate": np.where(
+                has_alarms, self.successes / safe_alarms, 0.0
+            ),
+            "false_alarm_rate": np.where(
+                has_alarms, (alarms - self.successes) / safe_alarms, 0.0
+            ),
+            "trust_delta": self.trust_delta,
+            "fatigue_delta": self.last_fatigue - self.first_fatigue,
+            "enforcement_ratio": ratios[:, ENFORCEMENT],
+            "support_ratio": ratios[:, SUPPORT],
+            "stabilization_ratio": ratios[:, STABILIZATION],
+        }
+
+    def evaluate_user(self, index: int) -> PolicyEvaluation:
+        """
+        What PolicyEvaluator returns for this user's logs, except
+        that trust is a running float64 sum, which can differ
+        from PolicyEvaluator's exact sum in the last bits.
+        """
+
+        values = {
+            name: float(column[index])
+            for name, column in self.metrics().items()
+        }
+        return PolicyEvaluation(
+            window_days=self.days,
+            governance_health=governance_health(
+                values["false_alarm_rate"], values["trust_delta"]
+            ),
+            **values,
+        )
+
+    def evaluate(self) -> PolicyEvaluation:
+        """
+        Population-level evaluation: rates pooled over all
+        user-days, trust and fatigue deltas averaged per user.
+        """
+
+        if self.days == 0:
+            raise ValueError("PopulationOutcome has no simulated days")
+
+        user_days = len(self) * self.days
+        alarms = int(self.alarms.sum())
+        successes = int(self.successes.sum())
+        counts = self.strategy_counts.sum(axis=0)
+
+        false_alarm_rate = (alarms - successes) / alarms if alarms else 0.0
+        trust_delta = float(self.trust_delta.mean())
+
+        return PolicyEvaluation(
+            window_days=self.days,
+            alarm_trigger_rate=alarms / user_days,
+            success_rate=successes / alarms if alarms else 0.0,
+            false_alarm_rate=false_alarm_rate,
+            trust_delta=trust_delta,
+            fatigue_delta=float(
+                (self.last_fatigue - self.first_fatigue).mean()
+            ),
+            enforcement_ratio=int(counts[ENFORCEMENT]) / user_days,
+            support_ratio=int(counts[SUPPORT]) / user_days,
+            stabilization_ratio=int(counts[STABILIZATION]) / user_days,
+            governance_health=governance_health(
+                false_alarm_rate, trust_delta
+            ),
+        )
+
+
+# =========================================================
+# Population Time Engine
+# =========================================================
+
+class PopulationTimeEngine:
+    """
+    Advances N synthetic users through daily governance
+    cycles, one vectorized step per day.
+    """
+
+    def __init__(
+        self,
+        population: SyntheticPopulation,
+        total_days: int = 30,
+        seed: int = 0,
+        router: StrategyBatchRouter = select_strategy_batch,
+        rng: Optional[np.random.Generator] = None,
+    ):
+        self.population = population
+        self.total_days = total_days
+        self.router = router
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+
+        self.current_day: int = 0
+        self.states: Optional[BehavioralStateArray] = None
+        self.last_strategies = np.full(
+            len(population), NO_DIRECTIVE, dtype=np.uint8
+        )
+
+    def run(self) -> PopulationOutcome:
+        outcome = PopulationOutcome.empty(len(self.population))
+        for _ in range(self.total_days):
+            outcome.add_day(self.step())
+        return outcome
+
+    # -----------------------------
+    # One day
+    # -----------------------------
+
+    def draw(self) -> np.ndarray:
+        """
+        Uniform draws for one day, shape (4, users), in
+        SyntheticUser consumption order: success, secondary
+        signal, late-night usage, reaction compliance.
+        """
+        return self.rng.random((4, len(self.population)))
+
+    def step(self, draws: Optional[np.ndarray] = None) -> PopulationDay:
+        users = self.population
+        self.current_day += 1
+        if draws is None:
+            draws = self.draw()
+        u_success, u_secondary, u_late, u_react = draws
+
+        # ----- 1. Generate signals (SyntheticUser.generate_signals) -----
+        fatigue = (
+            self.states.fatigue_index if self.states is not None
+            else np.full(len(users), 0.5)
+        )
+
+        compliance = users.compliance_bias - fatigue * users.fatigue_sensitivity
+        compliance = compliance + 0.15 * (self.last_strategies == ENFORCEMENT)
+        np.clip(compliance, 0.0, 1.0, out=compliance)
+
+        success = u_success < compliance
+        secondary = np.where(
+            success, u_secondary < 0.4, u_secondary < users.avoidance_tendency
+        )
+        late_night = u_late < fatigue
+
+        # ----- 2. Update behavioral state -----
+        if self.states is None:
+            self.states = BehavioralStateArray.cold_start(len(users))
+        else:
+            self.states = self._apply_signals(
+                self.states, success, secondary, late_night
+            )
+
+        # ----- 3. Governance decision -----
+        strategies = np.asarray(self.router(self.states), dtype=np.uint8)
+
+        # ----- 4. User reaction (SyntheticUser.react) -----
+        alarm_triggered = REQUIRED_STRICTNESS[strategies] > 0.3
+
+        react_prob = (
+            users.compliance_bias
+            + 0.10 * (strategies == ENFORCEMENT)
+            + 0.05 * (strategies == SUPPORT)
+        )
+        np.clip(react_prob, 0.0, 1.0, out=react_prob)
+        complied = u_react < react_prob
+
+        outcome_success = alarm_triggered & complied
+        trust_delta = np.where(
+            alarm_triggered, np.where(complied, 0.02, -0.05), 0.01
+        )
+
+        self.last_strategies = strategies
+
+        return PopulationDay(
+            day=self.current_day,
+            states=self.states,
+            strategies=strategies,
+            alarm_triggered=alarm_triggered,
+            outcome_success=outcome_success,
+            trust_delta=trust_delta,
+        )
+
+    @staticmethod
+    def _apply_signals(
+        states: BehavioralStateArray,
+        success: np.ndarray,
+        secondary: np.ndarray,
+        late_night: np.ndarray,
+    ) -> BehavioralStateArray:
+        """
+        update_state for the generated batches, adding the
+        signals in the order SyntheticUser emits them.
+        """
+
+        slots = (
+            (np.where(success, _CLEAN_DISMISSAL, _ALARM_FAILURE), 1.0),
+            (
+                np.where(
+                    secondary,
+                    np.where(success, _EARLY_WAKE, _EXCESSIVE_SNOOZE),
+                    _NO_SIGNAL,
+                ),
+                np.where(success, 0.8, 0.7),
+            ),
+            (np.where(late_night, _LATE_NIGHT, _NO_SIGNAL), 0.8),
+        )
+
+        columns = [getattr(states, name).copy() for name in STATE_DIMENSIONS]
+        for codes, confidence in slots:
+            deltas = np.take(_EFFECTS, codes, axis=1)
+            deltas *= confidence
+            for column, delta in zip(columns, deltas):
+                column += delta
+
+        for name, column in zip(STATE_DIMENSIONS, columns):
+            if name == "momentum_trend":
+                column *= MOMENTUM_DECAY
+                np.clip(column, -1.0, 1.0, out=column)
+            else:
+                np.clip(column, 0.0, 1.0, out=column)
+
+        return BehavioralStateArray(*columns)
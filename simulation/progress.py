@@ -0,0 +1,62 @@
+"""
+simulation/progress.py
+
+Fixed-rate progress indicator for long simulations.
+
+update() is called once per simulated day but only redraws
+when `interval` seconds have passed, so terminal I/O stays
+constant no matter how many days are simulated.
+"""
+
+import sys
+import time
+from typing import Callable, Optional, TextIO
+
+
+class ProgressReporter:
+    """
+    Single-line "label: done/total (pct)" indicator.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        label: str = "Simulating",
+        interval: float = 0.5,
+        stream: Optional[TextIO] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.total = total
+        self.label = label
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stderr
+        self.clock = clock
+
+        self.done = 0
+        self.redraws = 0
+        self._next_redraw = clock()
+
+    def update(self, done: int):
+        self.done = done
+        if self.clock() >= self._next_redraw:
+            self._draw()
+
+    def close(self):
+        self._draw()
+        self.stream.write("\n")
+        self.stream.flush()
+
+    def _draw(self):
+        percent = 100 * self.done / self.total if self.total else 100.0
+        self.stream.write(
+            f"\r{self.label}: {self.done}/{self.total} ({percent:5.1f}%)"
+        )
+        self.stream.flush()
+        self.redraws += 1
+        self._next_redraw = self.clock() + self.interval
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -5,32 +5,92 @@ Entry point for running AlarmSM behavioral simulations.
 
 Phase 2:
 - Executes closed-loop governance simulation
-- Prints interpretable daily output
+- Prints interpretable daily output (or a summary, nothing,
+  or buffered JSONL / CSV for long runs; see OutputMode)
 
 Phase 3+:
 - RETURNS simulation logs for analysis and policy evolution
 """
 
+from enum import Enum
+from typing import List, Optional
+
 from governing_brain.brain import GoverningBrain
+from simulation.metrics import SimulationLog
+from simulation.progress import ProgressReporter
+from simulation.sinks import LARGE_BUFFER, CsvSink, FileSink, LogSink
 from simulation.time_engine import TimeEngine
 from simulation.synthetic_users import SyntheticUser
 
 
-def run_basic_simulation(days: int = 7):
+class OutputMode(str, Enum):
+    """
+    What run_basic_simulation writes while it runs.
+    """
+
+    VERBOSE = "verbose"    # every day, then the summary (Phase 2)
+    SUMMARY = "summary"    # summary only
+    SILENT = "silent"      # nothing
+    JSONL = "jsonl"        # SimulationLog.to_dict() lines to a file
+    CSV = "csv"            # SimulationLog.to_dict() rows to a file
+
+
+def _print_day(log: SimulationLog):
+    print("\n" + "-" * 70)
+    print(f"Day {log.day}")
+    print("-" * 70)
+    print(f"Strategy           : {log.strategy.value}")
+    print(f"Discipline Level   : {log.discipline:.2f}")
+    print(f"Failure Risk       : {log.failure_risk:.2f}")
+    print(f"Fatigue Index      : {log.fatigue:.2f}")
+    print(f"Avoidance Tendency : {log.avoidance:.2f}")
+    print(f"Momentum Trend     : {log.momentum:.2f}")
+    print(f"Signals Observed   : {log.signal_names}")
+
+    # Explainability
+    print(f"Decision Rationale : {log.explanation.summary}")
+
+    # Outcome tracking — pulled from SimulationLog (NOT directive)
+    print(f"Alarm Triggered    : {bool(getattr(log, 'alarm_triggered', False))}")
+
+    if log.outcome_success is not None:
+        print(f"Outcome Success   : {log.outcome_success}")
+
+
+def run_basic_simulation(
+    days: int = 7,
+    output: "OutputMode | str" = OutputMode.VERBOSE,
+    path: Optional[str] = None,
+    progress: bool = False,
+) -> List[SimulationLog]:
     """
     Runs a basic simulation with a single synthetic user.
 
     IMPORTANT:
-    - Prints human-readable output (Phase 2)
+    - Prints human-readable output (Phase 2) in VERBOSE mode;
+      see OutputMode for quieter and file-based modes
+    - progress=True shows a fixed-rate indicator on stderr
     - Returns simulation logs for analysis (Phase 3+)
     """
 
-    print("\n" + "=" * 80)
-    print(f"Running AlarmSM Behavioral Simulation ({days} days)")
-    print("=" * 80)
+    output = OutputMode(output)
+    verbose = output is OutputMode.VERBOSE
 
-    # 1. Initialize governing brain
-    brain = GoverningBrain()
+    sink: Optional[LogSink] = None
+    if output in (OutputMode.JSONL, OutputMode.CSV):
+        if path is None:
+            raise ValueError(f"Output mode {output.value} requires a path")
+        sink_type = FileSink if output is OutputMode.JSONL else CsvSink
+        sink = sink_type(path, buffer_size=LARGE_BUFFER, append=False)
+
+    if verbose:
+        print("\n" + "=" * 80)
+        print(f"Running AlarmSM Behavioral Simulation ({days} days)")
+        print("=" * 80)
+
+    # 1. Initialize governing brain (explanations render lazily
+    #    unless they are printed)
+    brain = GoverningBrain(lazy_explanations=not verbose)
 
     # 2. Create a synthetic user profile
     user = SyntheticUser(
@@ -48,51 +108,47 @@ def run_basic_simulation(days: int = 7):
         total_days=days,
     )
 
-    # 4. Run simulation
-    logs = engine.run()
-
+    logs: List[SimulationLog] = []
     total_trust = 0.0
     alarms_triggered = 0
     successful_outcomes = 0
 
-    # 5. Print daily summary
-    for log in logs:
-        print("\n" + "-" * 70)
-        print(f"Day {log.day}")
-        print("-" * 70)
-        print(f"Strategy           : {log.strategy.value}")
-        print(f"Discipline Level   : {log.discipline:.2f}")
-        print(f"Failure Risk       : {log.failure_risk:.2f}")
-        print(f"Fatigue Index      : {log.fatigue:.2f}")
-        print(f"Avoidance Tendency : {log.avoidance:.2f}")
-        print(f"Momentum Trend     : {log.momentum:.2f}")
-        print(f"Signals Observed   : {[s.name for s in log.signals.signals]}")
-
-        # Explainability
-        print(f"Decision Rationale : {log.explanation.summary}")
-
-        # Outcome tracking — pulled from SimulationLog (NOT directive)
-        if getattr(log, "alarm_triggered", False):
-            print("Alarm Triggered    : True")
-            alarms_triggered += 1
-        else:
-            print("Alarm Triggered    : False")
-
-        if log.outcome_success is not None:
-            print(f"Outcome Success   : {log.outcome_success}")
-            successful_outcomes += int(log.outcome_success)
-
-        total_trust += log.trust_delta
+    reporter = ProgressReporter(days) if progress else None
+
+    # 4. Run simulation, writing each day as it completes
+    try:
+        for log in engine.stream():
+            logs.append(log)
+
+            if log.alarm_triggered:
+                alarms_triggered += 1
+            if log.outcome_success is not None:
+                successful_outcomes += int(log.outcome_success)
+            total_trust += log.trust_delta
+
+            # 5. Daily output
+            if verbose:
+                _print_day(log)
+            elif sink is not None:
+                sink.write(log)
+            if reporter is not None:
+                reporter.update(log.day)
+    finally:
+        if sink is not None:
+            sink.close()
+        if reporter is not None:
+            reporter.close()
 
     # 6. Simulation-level summary
-    print("\n" + "=" * 80)
-    print("Simulation Summary")
-    print("=" * 80)
-    print(f"Total Days Simulated : {len(logs)}")
-    print(f"Alarms Triggered     : {alarms_triggered}")
-    print(f"Successful Outcomes : {successful_outcomes}")
-    print(f"Net Trust Change    : {total_trust:.2f}")
-    print("=" * 80)
+    if output in (OutputMode.VERBOSE, OutputMode.SUMMARY):
+        print("\n" + "=" * 80)
+        print("Simulation Summary")
+        print("=" * 80)
+        print(f"Total Days Simulated : {len(logs)}")
+        print(f"Alarms Triggered     : {alarms_triggered}")
+        print(f"Successful Outcomes : {successful_outcomes}")
+        print(f"Net Trust Change    : {total_trust:.2f}")
+        print("=" * 80)
 
     # 🔑 Critical for Phase 3+
     return logs
@@ -0,0 +1,132 @@
+"""
+simulation/sinks.py
+
+Destinations for streamed simulation logs.
+
+TimeEngine.stream() yields one SimulationLog per day; a sink
+decides what is kept. Only MemorySink grows with the number
+of simulated days.
+
+Sinks:
+- MemorySink: keeps every log (what TimeEngine.run returns)
+- FileSink: writes SimulationLog.to_dict() as JSON lines
+- CsvSink: writes SimulationLog.to_dict() as CSV rows
+- AggregateSink: keeps running PolicyEvaluator totals only
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import IO, List, Optional
+
+from policy_evolution.evaluation import PolicyEvaluation
+from policy_evolution.evaluator import PolicyEvaluationAccumulator
+from simulation.metrics import SimulationLog
+
+
+class LogSink:
+    """
+    Base sink: receives logs in day order, then close().
+    """
+
+    def write(self, log: SimulationLog):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MemorySink(LogSink):
+    """
+    Keeps every log in a list.
+    """
+
+    def __init__(self, logs: Optional[List[SimulationLog]] = None):
+        self.logs: List[SimulationLog] = logs if logs is not None else []
+
+    def write(self, log: SimulationLog):
+        self.logs.append(log)
+
+
+# Write buffer for bulk simulation output
+LARGE_BUFFER = 1 << 20
+
+
+class FileSink(LogSink):
+    """
+    Appends one JSON object per log to a file
+    (append=False truncates it first).
+    """
+
+    def __init__(
+        self, path: str, buffer_size: int = -1, append: bool = True
+    ):
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+        self.append = append
+        self.count = 0
+        self._file: Optional[IO[str]] = None
+
+    def _open(self) -> IO[str]:
+        return self.path.open(
+            "a" if self.append else "w",
+            encoding="utf-8",
+            newline="",
+            buffering=self.buffer_size,
+        )
+
+    def write(self, log: SimulationLog):
+        if self._file is None:
+            self._file = self._open()
+        self._file.write(json.dumps(log.to_dict()) + "\n")
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class CsvSink(FileSink):
+    """
+    One CSV row per log, in SimulationLog.to_dict() field
+    order; signal names are joined with ';'. A header row is
+    written when the file is new or truncated.
+    """
+
+    def write(self, log: SimulationLog):
+        row = log.to_dict()
+        if self._file is None:
+            new = not self.append or not self.path.exists()
+            self._file = self._open()
+            self._writer = csv.writer(self._file)
+            if new:
+                self._writer.writerow(row)
+
+        row["signal_names"] = ";".join(row["signal_names"])
+        self._writer.writerow(row.values())
+        self.count += 1
+
+
+class AggregateSink(LogSink):
+    """
+    Running PolicyEvaluator totals only, in constant memory.
+    """
+
+    def __init__(self):
+        self.accumulator = PolicyEvaluationAccumulator()
+
+    def write(self, log: SimulationLog):
+        self.accumulator.add(log)
+
+    def evaluate(self) -> PolicyEvaluation:
+        """
+        Same result as PolicyEvaluator over the written logs.
+        """
+        return self.accumulator.evaluate()
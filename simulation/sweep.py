@@ -0,0 +1,535 @@
+"""
+simulation/sweep.py
+
+Parameter sweeps over synthetic user types.
+
+A sweep runs one simulation per cell of
+    compliance_bias x fatigue_sensitivity x avoidance_tendency
+    x days x seeds
+under one policy, and evaluates each run with the
+PolicyEvaluator metrics. Cells run in parallel through
+simulation.parallel_runner's chunked dispatch.
+
+Each cell's PolicyEvaluation is cached on disk, so re-running
+a sweep only simulates cells that are new or invalidated.
+A cached evaluation is reused when:
+- the cell's own parameters match (SweepCell.key)
+- the code version matches: the rule structure (fields,
+  operators, strategies, priority order) and the normalized
+  code of every module that shapes a run (POLICY_CODE_MODULES;
+  AST dumps, so comments, docstrings and formatting do not
+  count, nor do DEFAULT_RULES' threshold literals)
+- every threshold lies within the bounds recorded for that
+  cell: between the nearest values the cell's states took
+  on either side of it, so every decision of the run, and
+  therefore the whole trajectory, is unchanged
+
+Run:
+    python -m simulation.sweep --compliance 0.4 0.6 0.8 --days 90 \\
+        --seeds 1 2 3 --cache .sweep-cache
+"""
+
+import argparse
+import ast
+import hashlib
+import importlib
+import json
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from itertools import product
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.policies.compiler import compile_router
+from governing_brain.policies.rules import (
+    DEFAULT_RULES,
+    FALLBACK_STRATEGY,
+    Condition,
+    Rule,
+    resolve_rules,
+)
+from policy_evolution.evaluation import PolicyEvaluation
+from simulation.metrics import SimulationLog
+from simulation.parallel_runner import chunked, map_chunks
+from simulation.progress import ProgressReporter
+from simulation.sinks import AggregateSink
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+# Modules whose code decides what a cell evaluates to
+POLICY_CODE_MODULES: Tuple[str, ...] = (
+    "governing_brain.brain",
+    "governing_brain.decision_cache",
+    "governing_brain.explanations",
+    "governing_brain.inputs",
+    "governing_brain.outputs",
+    "governing_brain.state_model",
+    "governing_brain.strategies",
+    "governing_brain.policies.compiler",
+    "governing_brain.policies.rules",
+    "policy_evolution.evaluation",
+    "policy_evolution.evaluator",
+    "simulation.clock",
+    "simulation.metrics",
+    "simulation.sinks",
+    "simulation.synthetic_users",
+    "simulation.time_engine",
+)
+
+# Top-level assignments left out of a module's normalized code.
+# DEFAULT_RULES is covered by the rule structure and the cached
+# threshold bounds, so editing a default threshold does not
+# change the code version.
+CODE_VERSION_EXCLUDES: Dict[str, Tuple[str, ...]] = {
+    "governing_brain.policies.rules": ("DEFAULT_RULES",),
+}
+
+# (lower, upper) bounds of one threshold; None = unbounded
+ThresholdBounds = Tuple[Optional[float], Optional[float]]
+
+
+def normalize_code(source: str, exclude: Sequence[str] = ()) -> str:
+    """
+    AST dump of source without docstrings or positions:
+    comment, docstring and formatting edits leave it unchanged.
+    Top-level assignments to names in exclude are dropped.
+    """
+
+    tree = ast.parse(source)
+    tree.body = [
+        node for node in tree.body
+        if not (
+            isinstance(node, (ast.Assign, ast.AnnAssign))
+            and any(
+                isinstance(target, ast.Name) and target.id in exclude
+                for target in (
+                    node.targets if isinstance(node, ast.Assign)
+                    else [node.target]
+                )
+            )
+        )
+    ]
+    for node in ast.walk(tree):
+        if not isinstance(node, (
+            ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef
+        )):
+            continue
+        body = node.body
+        if (
+            body
+            and isinstance(body[0], ast.Expr)
+            and isinstance(body[0].value, ast.Constant)
+            and isinstance(body[0].value.value, str)
+        ):
+            node.body = body[1:] or [ast.Pass()]
+    return ast.dump(tree)
+
+
+def policy_code_version(rules: Tuple[Rule, ...] = DEFAULT_RULES) -> str:
+    """
+    Hash of the rule structure (thresholds excluded), the
+    fallback strategy and the normalized simulation code.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([
+        FALLBACK_STRATEGY.value,
+        [
+            [rule.name, rule.strategy.value,
+             [[condition.field, condition.op]
+              for condition in rule.conditions]]
+            for rule in rules
+        ],
+    ]).encode())
+    for name in POLICY_CODE_MODULES:
+        path = Path(importlib.import_module(name).__file__)
+        digest.update(name.encode())
+        digest.update(_module_code(
+            str(path), path.stat().st_mtime_ns,
+            CODE_VERSION_EXCLUDES.get(name, ()),
+        ))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _module_code(path: str, mtime_ns: int, exclude: Tuple[str, ...]) -> bytes:
+    # Parsed once per file version, not once per sweep
+    source = Path(path).read_text(encoding="utf-8")
+    return normalize_code(source, exclude).encode()
+
+
+def _conditions(rules: Tuple[Rule, ...]) -> List[Condition]:
+    return [condition for rule in rules for condition in rule.conditions]
+
+
+# =========================================================
+# Threshold Bounds
+# =========================================================
+
+def threshold_bounds(
+    condition: Condition, visited: Sequence[float]
+) -> ThresholdBounds:
+    """
+    Nearest visited values below and above the threshold
+    (visited sorted, distinct). Any threshold strictly
+    between them gives every visited value the same outcome;
+    bounds_hold() adds the inclusive end the operator allows.
+    """
+
+    if condition.op in (">=", "<"):
+        # outcome flips between v < t and v >= t
+        index = bisect_left(visited, condition.threshold)
+    else:
+        # outcome flips between v <= t and v > t
+        index = bisect_right(visited, condition.threshold)
+    return (
+        visited[index - 1] if index > 0 else None,
+        visited[index] if index < len(visited) else None,
+    )
+
+
+def bounds_hold(condition: Condition, bounds: ThresholdBounds) -> bool:
+    """
+    Whether condition's threshold gives every value the run
+    visited the same outcome as when bounds were recorded.
+    """
+
+    lower, upper = bounds
+    threshold = condition.threshold
+    if condition.op in (">=", "<"):
+        return (
+            (lower is None or lower < threshold)
+            and (upper is None or threshold <= upper)
+        )
+    return (
+        (lower is None or lower <= threshold)
+        and (upper is None or threshold < upper)
+    )
+
+
+class _CellSink(AggregateSink):
+    """
+    AggregateSink that also keeps the decided states' values
+    of the fields the rules compare.
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        super().__init__()
+        self.visited = {name: array("d") for name in fields}
+
+    def write(self, log: SimulationLog):
+        super().write(log)
+        state = log.state
+        for name, values in self.visited.items():
+            values.append(getattr(state, name))
+
+    def bounds(self, conditions: Sequence[Condition]) -> List[ThresholdBounds]:
+        visited = {
+            name: sorted(set(values)) for name, values in self.visited.items()
+        }
+        return [
+            threshold_bounds(condition, visited[condition.field])
+            for condition in conditions
+        ]
+
+
+# =========================================================
+# Cells
+# =========================================================
+
+@dataclass(frozen=True)
+class SweepCell:
+    """
+    One synthetic user type, run length and seed.
+    """
+
+    compliance_bias: float
+    fatigue_sensitivity: float
+    avoidance_tendency: float
+    days: int
+    seed: int
+
+    def key(self, code_version: str) -> str:
+        payload = json.dumps(
+            {"cell": asdict(self), "code_version": code_version},
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def build_user(self) -> SyntheticUser:
+        return SyntheticUser(
+            name=(
+                f"sweep-{self.compliance_bias}-{self.fatigue_sensitivity}"
+                f"-{self.avoidance_tendency}"
+            ),
+            compliance_bias=self.compliance_bias,
+            fatigue_sensitivity=self.fatigue_sensitivity,
+            avoidance_tendency=self.avoidance_tendency,
+            seed=self.seed,
+        )
+
+
+def sweep_cells(
+    compliance_bias: Sequence[float],
+    fatigue_sensitivity: Sequence[float],
+    avoidance_tendency: Sequence[float],
+    days: Sequence[int],
+    seeds: Sequence[int],
+) -> List[SweepCell]:
+    """
+    Every combination, in row-major order of the arguments.
+    """
+    return [
+        SweepCell(float(c), float(f), float(a), int(d), int(s))
+        for c, f, a, d, s in product(
+            compliance_bias, fatigue_sensitivity, avoidance_tendency,
+            days, seeds,
+        )
+    ]
+
+
+def simulate_cells(
+    cells: Tuple[SweepCell, ...],
+    rules: Tuple[Rule, ...],
+    parameters: Optional[Mapping[str, float]],
+) -> List[Tuple[PolicyEvaluation, List[ThresholdBounds]]]:
+    """
+    Runs cells in order under one compiled policy. Returns
+    each evaluation with its threshold bounds (one per
+    condition, in rule order).
+    """
+
+    router = compile_router(rules, parameters)
+    conditions = _conditions(resolve_rules(rules, parameters))
+    fields = sorted({condition.field for condition in conditions})
+
+    results = []
+    for cell in cells:
+        sink = TimeEngine(
+            brain=GoverningBrain(router=router, lazy_explanations=True),
+            user=cell.build_user(),
+            total_days=cell.days,
+        ).run_to(_CellSink(fields))
+        results.append((sink.evaluate(), sink.bounds(conditions)))
+    return results
+
+
+# =========================================================
+# Cache
+# =========================================================
+
+class SweepCache:
+    """
+    One JSON file per cell and code version:
+    <directory>/<cell key>.json, holding the evaluations
+    computed for that cell, each with its threshold bounds
+    (at most max_entries, newest last). Unreadable or
+    mismatching files count as misses.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 8):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _entries(self, cell: SweepCell, code_version: str) -> List[Dict]:
+        try:
+            record = json.loads(self._path(cell.key(code_version)).read_text())
+        except (OSError, ValueError):
+            return []
+
+        if (
+            not isinstance(record, dict)
+            or record.get("cell") != asdict(cell)
+            or record.get("code_version") != code_version
+            or not isinstance(record.get("entries"), list)
+        ):
+            return []
+        return record["entries"]
+
+    def get(
+        self,
+        cell: SweepCell,
+        code_version: str,
+        conditions: Sequence[Condition],
+    ) -> Optional[PolicyEvaluation]:
+        """
+        The newest evaluation whose bounds hold for conditions
+        (the resolved rules' conditions, in rule order).
+        """
+
+        for entry in reversed(self._entries(cell, code_version)):
+            try:
+                bounds = entry["bounds"]
+                if len(bounds) != len(conditions) or not all(
+                    bounds_hold(condition, tuple(pair))
+                    for condition, pair in zip(conditions, bounds)
+                ):
+                    continue
+                return PolicyEvaluation(**entry["evaluation"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        return None
+
+    def put(
+        self,
+        cell: SweepCell,
+        code_version: str,
+        evaluation: PolicyEvaluation,
+        bounds: Sequence[ThresholdBounds],
+    ):
+        entries = self._entries(cell, code_version)
+        entries.append({
+            "bounds": [list(pair) for pair in bounds],
+            "evaluation": asdict(evaluation),
+        })
+
+        path = self._path(cell.key(code_version))
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_text(json.dumps({
+            "cell": asdict(cell),
+            "code_version": code_version,
+            "entries": entries[-self.max_entries:],
+        }))
+        os.replace(temporary, path)
+
+
+# =========================================================
+# Runner
+# =========================================================
+
+@dataclass
+class SweepResult:
+    policy_version: str
+    evaluations: Dict[SweepCell, PolicyEvaluation] = field(default_factory=dict)
+    computed: int = 0
+    cached: int = 0
+
+    def rows(self) -> List[Dict]:
+        """
+        One flat dict per cell (cell fields + evaluation).
+        """
+        return [
+            {**asdict(cell), **asdict(evaluation)}
+            for cell, evaluation in self.evaluations.items()
+        ]
+
+
+def run_sweep(
+    compliance_bias: Sequence[float],
+    fatigue_sensitivity: Sequence[float] = (0.5,),
+    avoidance_tendency: Sequence[float] = (0.3,),
+    days: Sequence[int] = (30,),
+    seeds: Sequence[int] = (42,),
+    cache_dir: Optional[str] = None,
+    rules: Tuple[Rule, ...] = DEFAULT_RULES,
+    parameters: Optional[Mapping[str, float]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 8,
+    progress: bool = False,
+) -> SweepResult:
+    """
+    Evaluates every cell, reusing cached evaluations.
+
+    parameters overrides rule thresholds by name (e.g. a
+    PolicyVersion's parameters). workers=1 runs in-process.
+    """
+
+    cells = sweep_cells(
+        compliance_bias, fatigue_sensitivity, avoidance_tendency, days, seeds
+    )
+    version = policy_code_version(rules)
+    conditions = _conditions(resolve_rules(rules, parameters))
+    cache = SweepCache(cache_dir) if cache_dir is not None else None
+    result = SweepResult(policy_version=version)
+
+    found: Dict[SweepCell, PolicyEvaluation] = {}
+    if cache is not None:
+        for cell in cells:
+            evaluation = cache.get(cell, version, conditions)
+            if evaluation is not None:
+                found[cell] = evaluation
+
+    pending = [cell for cell in dict.fromkeys(cells) if cell not in found]
+    chunks = chunked(pending, chunk_size)
+    reporter = (
+        ProgressReporter(len(pending), label="Sweeping") if progress else None
+    )
+
+    try:
+        for chunk, computed in zip(chunks, map_chunks(
+            simulate_cells, chunks, rules, parameters, workers=workers
+        )):
+            for cell, (evaluation, bounds) in zip(chunk, computed):
+                found[cell] = evaluation
+                if cache is not None:
+                    cache.put(cell, version, evaluation, bounds)
+            result.computed += len(chunk)
+            if reporter is not None:
+                reporter.update(result.computed)
+    finally:
+        if reporter is not None:
+            reporter.close()
+
+    result.cached = len(found) - result.computed
+    result.evaluations = {cell: found[cell] for cell in cells}
+    return result
+
+
+# =========================================================
+# CLI
+# =========================================================
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Sweep synthetic user parameters and evaluate governance."
+    )
+    parser.add_argument("--compliance", type=float, nargs="+", default=[0.6])
+    parser.add_argument("--fatigue", type=float, nargs="+", default=[0.5])
+    parser.add_argument("--avoidance", type=float, nargs="+", default=[0.3])
+    parser.add_argument("--days", type=int, nargs="+", default=[30])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[42])
+    parser.add_argument("--cache", help="directory for cached evaluations")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--progress", action="store_true")
+    args = parser.parse_args(argv)
+
+    result = run_sweep(
+        compliance_bias=args.compliance,
+        fatigue_sensitivity=args.fatigue,
+        avoidance_tendency=args.avoidance,
+        days=args.days,
+        seeds=args.seeds,
+        cache_dir=args.cache,
+        workers=args.workers,
+        progress=args.progress,
+    )
+
+    print(
+        f"{'compliance':>10} {'fatigue':>8} {'avoidance':>9} {'days':>6} "
+        f"{'seed':>6} | {'health':>10} {'success':>7} {'trust':>7}"
+    )
+    print("-" * 74)
+    for cell, evaluation in result.evaluations.items():
+        print(
+            f"{cell.compliance_bias:>10.2f} {cell.fatigue_sensitivity:>8.2f} "
+            f"{cell.avoidance_tendency:>9.2f} {cell.days:>6} {cell.seed:>6} | "
+            f"{evaluation.governance_health:>10} "
+            f"{evaluation.success_rate:>7.2f} {evaluation.trust_delta:>7.2f}"
+        )
+    print(
+        f"\n{len(result.evaluations)} cells: {result.computed} computed, "
+        f"{result.cached} cached (policy version {result.policy_version})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,14 +12,36 @@ This module contains NO governance logic.
 """
 
 import random
-from typing import Optional, List
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional, List, Tuple
+from datetime import timedelta
 from dataclasses import dataclass
 
-from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.inputs import MICROSECOND, Signal, SignalBatch
 from governing_brain.outputs import GovernanceDirective
 from governing_brain.state_model import BehavioralState
 from governing_brain.strategies import Strategy
+from governing_brain.signal_registry import SIGNAL_CODES
+from simulation.clock import DEFAULT_CLOCK, SimulatedClock
+
+if TYPE_CHECKING:
+    from governing_brain.signal_columns import SignalColumns
+
+
+# Signal times relative to the simulated wake-up ("now")
+_WINDOW = timedelta(hours=8)
+_OFFSETS = {
+    "late_night_usage": timedelta(hours=6),
+    "early_wake_success": timedelta(minutes=10),
+    "clean_alarm_dismissal": timedelta(minutes=5),
+    "excessive_snooze": timedelta(minutes=2),
+    "alarm_failure": timedelta(minutes=1),
+}
+
+# The same offsets for the integer (epoch microsecond) path
+_WINDOW_US = _WINDOW // MICROSECOND
+_OFFSETS_US = {
+    name: offset // MICROSECOND for name, offset in _OFFSETS.items()
+}
 
 
 # -------------------------------------------------
@@ -73,13 +95,61 @@ class SyntheticUser:
         self,
         day: int,
         state: Optional[BehavioralState],
+        clock: SimulatedClock = DEFAULT_CLOCK,
     ) -> SignalBatch:
         """
         Generate a batch of behavioral signals for the current day.
+        Timestamps come from the simulated clock, not wall time.
+        """
+
+        now = clock.now(day)
+        return SignalBatch(
+            signals=[
+                Signal(
+                    name=name,
+                    value=1.0,
+                    confidence=confidence,
+                    timestamp=now - _OFFSETS[name],
+                )
+                for name, confidence in self._draw_signals(state)
+            ],
+            window_start=now - _WINDOW,
+            window_end=now,
+        )
+
+    def generate_signal_columns(
+        self,
+        day: int,
+        state: Optional[BehavioralState],
+        clock: SimulatedClock = DEFAULT_CLOCK,
+    ) -> "SignalColumns":
+        """
+        Same draws as generate_signals, as a SignalColumns batch
+        timestamped from the clock's integer fast path (no
+        datetime objects). Requires NumPy.
+        """
+
+        from governing_brain.signal_columns import SignalColumns
+
+        now_us = clock.epoch_us(day)
+        drawn = self._draw_signals(state)
+        return SignalColumns.from_codes(
+            codes=[SIGNAL_CODES[name] for name, _ in drawn],
+            values=[1.0] * len(drawn),
+            confidences=[confidence for _, confidence in drawn],
+            timestamps_us=[now_us - _OFFSETS_US[name] for name, _ in drawn],
+            window_start_us=now_us - _WINDOW_US,
+            window_end_us=now_us,
+        )
+
+    def _draw_signals(
+        self, state: Optional[BehavioralState]
+    ) -> List[Tuple[str, float]]:
+        """
+        (signal name, confidence) for the day, in signal order.
         """
 
-        now = datetime.utcnow()
-        signals: List[Signal] = []
+        drawn: List[Tuple[str, float]] = []
 
         # Default assumptions
         fatigue = state.fatigue_index if state else 0.5
@@ -100,60 +170,21 @@ class SyntheticUser:
         success = self.random.random() < compliance_prob
 
         if success:
-            signals.append(
-                Signal(
-                    name="clean_alarm_dismissal",
-                    value=1.0,
-                    confidence=1.0,
-                    timestamp=now - timedelta(minutes=5),
-                )
-            )
+            drawn.append(("clean_alarm_dismissal", 1.0))
 
             if self.random.random() < 0.4:
-                signals.append(
-                    Signal(
-                        name="early_wake_success",
-                        value=1.0,
-                        confidence=0.8,
-                        timestamp=now - timedelta(minutes=10),
-                    )
-                )
+                drawn.append(("early_wake_success", 0.8))
         else:
-            signals.append(
-                Signal(
-                    name="alarm_failure",
-                    value=1.0,
-                    confidence=1.0,
-                    timestamp=now - timedelta(minutes=1),
-                )
-            )
+            drawn.append(("alarm_failure", 1.0))
 
             if self.random.random() < self.avoidance_tendency:
-                signals.append(
-                    Signal(
-                        name="excessive_snooze",
-                        value=1.0,
-                        confidence=0.7,
-                        timestamp=now - timedelta(minutes=2),
-                    )
-                )
+                drawn.append(("excessive_snooze", 0.7))
 
         # Late-night usage (fatigue driver)
         if self.random.random() < fatigue:
-            signals.append(
-                Signal(
-                    name="late_night_usage",
-                    value=1.0,
-                    confidence=0.8,
-                    timestamp=now - timedelta(hours=6),
-                )
-            )
+            drawn.append(("late_night_usage", 0.8))
 
-        return SignalBatch(
-            signals=signals,
-            window_start=now - timedelta(hours=8),
-            window_end=now,
-        )
+        return drawn
 
     # -------------------------------------------------
     # Reaction to governance (ground truth)
@@ -1,17 +1,33 @@
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional, TypeVar
 
 from governing_brain.brain import GoverningBrain
 from governing_brain.state_model import BehavioralState, update_state
 from governing_brain.inputs import SignalBatch
 
+from simulation.clock import DEFAULT_CLOCK, SimulatedClock
 from simulation.synthetic_users import SyntheticUser
 from simulation.metrics import SimulationLog
+from simulation.sinks import LogSink
+
+if TYPE_CHECKING:
+    from governing_brain.signal_columns import SignalColumns
+
+
+SinkT = TypeVar("SinkT", bound=LogSink)
 
 
 class TimeEngine:
     """
     Advances time in discrete steps (days) and
     orchestrates governance decision cycles.
+
+    columnar_signals=True takes the clock's integer fast path:
+    each day's signals are a SignalColumns batch with epoch
+    microsecond timestamps (no datetimes). States, decisions
+    and logged rows are identical; requires NumPy. Batches
+    of a few signals pay NumPy's per-array overhead, so this
+    is for consumers that want integer timestamps (wire
+    format, columnar stores), not for raw simulation speed.
     """
 
     def __init__(
@@ -19,26 +35,53 @@ class TimeEngine:
         brain: GoverningBrain,
         user: SyntheticUser,
         total_days: int = 30,
+        clock: SimulatedClock = DEFAULT_CLOCK,
+        columnar_signals: bool = False,
     ):
         self.brain = brain
         self.user = user
         self.total_days = total_days
+        self.clock = clock
+        self.columnar_signals = columnar_signals
 
         self.current_day: int = 0
         self.state: Optional[BehavioralState] = None
         self.logs: List[SimulationLog] = []
 
     def run(self) -> List[SimulationLog]:
-        for day in range(1, self.total_days + 1):
-            self.current_day = day
-            self._run_single_day()
+        self.logs.extend(self.stream())
         return self.logs
 
-    def _run_single_day(self):
+    def stream(self) -> Iterator[SimulationLog]:
+        """
+        Yields one SimulationLog per day without retaining it.
+        """
+        for day in range(self.current_day + 1, self.total_days + 1):
+            self.current_day = day
+            yield self._run_single_day()
+
+    def run_to(self, sink: SinkT) -> SinkT:
+        """
+        Streams every day into a sink (see simulation.sinks)
+        and closes it.
+        """
+        try:
+            for log in self.stream():
+                sink.write(log)
+        finally:
+            sink.close()
+        return sink
+
+    def _run_single_day(self) -> SimulationLog:
         # 1. Generate signals
-        signal_batch: SignalBatch = self.user.generate_signals(
+        generate = (
+            self.user.generate_signal_columns if self.columnar_signals
+            else self.user.generate_signals
+        )
+        signal_batch: "SignalBatch | SignalColumns" = generate(
             day=self.current_day,
             state=self.state,
+            clock=self.clock,
         )
 
         # 2. Update behavioral state
@@ -51,15 +94,13 @@ class TimeEngine:
         reaction = self.user.react(directive)
 
         # 5. Log full cycle
-        self.logs.append(
-            SimulationLog(
-                day=self.current_day,
-                state=self.state,
-                signals=signal_batch,
-                directive=directive,
-                explanation=explanation,
-                alarm_triggered=reaction.alarm_triggered,
-                outcome_success=reaction.outcome_success,
-                trust_delta=reaction.trust_delta,
-            )
+        return SimulationLog(
+            day=self.current_day,
+            state=self.state,
+            signals=signal_batch,
+            directive=directive,
+            explanation=explanation,
+            alarm_triggered=reaction.alarm_triggered,
+            outcome_success=reaction.outcome_success,
+            trust_delta=reaction.trust_delta,
         )
@@ -0,0 +1,63 @@
+"""
+tests/helpers.py
+
+Shared factories for the test modules.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.state_model import SIGNAL_EFFECTS
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+WINDOW_START = datetime(2025, 1, 1, 0, 0)
+WINDOW_END = datetime(2025, 1, 1, 8, 0)
+
+# Every known signal plus one update_state must ignore
+BATCH_SIGNAL_NAMES = tuple(sorted(SIGNAL_EFFECTS)) + ("unknown_signal",)
+
+
+def make_engine(days: int = 120, seed: int = 20) -> TimeEngine:
+    """
+    Fresh TimeEngine for one deterministic synthetic user;
+    engines built with the same arguments replay the same run.
+    """
+
+    user = SyntheticUser(
+        "Test User", compliance_bias=0.5, fatigue_sensitivity=0.7,
+        avoidance_tendency=0.4, seed=seed,
+    )
+    return TimeEngine(GoverningBrain(), user, total_days=days)
+
+
+def random_batch(
+    rng: random.Random,
+    size: Optional[int] = None,
+    names: Sequence[str] = BATCH_SIGNAL_NAMES,
+    random_values: bool = False,
+) -> SignalBatch:
+    """
+    Random signals over [WINDOW_START, WINDOW_END] with
+    microsecond timestamps. size defaults to 0-12 signals;
+    values are 1.0 unless random_values is set.
+    """
+
+    span_us = (WINDOW_END - WINDOW_START) // timedelta(microseconds=1)
+    return SignalBatch(
+        signals=[
+            Signal(
+                rng.choice(names),
+                rng.uniform(-5.0, 5.0) if random_values else 1.0,
+                rng.random(),
+                WINDOW_START + timedelta(microseconds=rng.randint(0, span_us)),
+            )
+            for _ in range(rng.randint(0, 12) if size is None else size)
+        ],
+        window_start=WINDOW_START,
+        window_end=WINDOW_END,
+    )
@@ -0,0 +1,51 @@
+"""
+tests/test_batch_router.py
+
+Ensures the vectorized router agrees with select_strategy,
+including states sitting exactly on policy thresholds.
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from governing_brain.policies.router import select_strategy
+from governing_brain.policies.batch_router import select_strategy_batch
+from governing_brain.state_array import BehavioralStateArray
+from governing_brain.state_model import BehavioralState
+from governing_brain.strategies import STRATEGIES_BY_CODE
+
+
+def _grid_value(rng: random.Random, low: float) -> float:
+    # Policy thresholds sit on a 0.05 grid
+    return round(rng.randint(int(low * 20), 20) * 0.05, 2)
+
+
+def _states(rng: random.Random, n: int):
+    states = []
+    for i in range(n):
+        if i % 2:
+            states.append(BehavioralState(
+                rng.random(), rng.random(), rng.random(),
+                rng.random(), rng.random(), rng.uniform(-1.0, 1.0),
+            ))
+        else:
+            states.append(BehavioralState(
+                _grid_value(rng, 0.0), _grid_value(rng, 0.0),
+                _grid_value(rng, 0.0), _grid_value(rng, 0.0),
+                _grid_value(rng, 0.0), _grid_value(rng, -1.0),
+            ))
+    return states
+
+
+def test_batch_router_matches_scalar_router():
+    states = _states(random.Random(11), 20_000)
+
+    codes = select_strategy_batch(BehavioralStateArray.from_states(states))
+
+    assert codes.dtype == np.uint8
+    assert [STRATEGIES_BY_CODE[c] for c in codes.tolist()] == [
+        select_strategy(s) for s in states
+    ]
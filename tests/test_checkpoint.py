@@ -0,0 +1,66 @@
+"""
+tests/test_checkpoint.py
+
+Checks that resuming from a checkpoint reproduces an
+uninterrupted TimeEngine run exactly.
+"""
+
+from itertools import islice
+
+import pytest
+
+from simulation.checkpoint import (
+    decode_checkpoint,
+    encode_checkpoint,
+    load_checkpoint,
+    resume_or_start,
+    stream_with_checkpoints,
+)
+from tests.helpers import make_engine
+
+
+def _trajectory(logs):
+    return [
+        (log.day, log.state, log.directive, log.alarm_triggered,
+         log.outcome_success, log.trust_delta,
+         [(s.name, s.confidence) for s in log.signals.signals])
+        for log in logs
+    ]
+
+
+@pytest.mark.parametrize("stop", [0, 1, 57, 119])
+def test_resume_reproduces_uninterrupted_run(stop):
+    expected = _trajectory(make_engine().run())
+
+    engine = make_engine()
+    head = list(islice(engine.stream(), stop))
+    resumed = decode_checkpoint(encode_checkpoint(engine))
+    tail = list(resumed.stream())
+
+    assert _trajectory(head + tail) == expected
+
+
+def test_periodic_checkpoints_and_resume(tmp_path):
+    path = tmp_path / "run.ckpt"
+    expected = _trajectory(make_engine().run())
+
+    engine = resume_or_start(str(path), make_engine)
+    head = []
+    for log in stream_with_checkpoints(engine, str(path), every=25):
+        head.append(log)
+        if log.day == 80:
+            break  # simulated crash: last checkpoint is day 75
+
+    resumed = resume_or_start(str(path), make_engine)
+    assert resumed.current_day == 75
+    tail = list(stream_with_checkpoints(resumed, str(path), every=25))
+
+    assert _trajectory(head[:75] + tail) == expected
+    assert load_checkpoint(str(path)).current_day == 120
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        decode_checkpoint(b"not a checkpoint")
+    with pytest.raises(ValueError):
+        decode_checkpoint(encode_checkpoint(make_engine())[:-4])
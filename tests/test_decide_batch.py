@@ -0,0 +1,41 @@
+"""
+tests/test_decide_batch.py
+
+Ensures batch decisions match single decisions and
+reuse the interned directives.
+"""
+
+import random
+
+from governing_brain.brain import DIRECTIVES, GoverningBrain
+from governing_brain.state_model import BehavioralState
+
+
+def test_decide_batch_matches_decide():
+    rng = random.Random(9)
+    states = [
+        BehavioralState(
+            rng.random(), rng.random(), rng.random(),
+            rng.random(), rng.random(), rng.uniform(-1.0, 1.0),
+        )
+        for _ in range(2_000)
+    ]
+    brain = GoverningBrain()
+
+    results = brain.decide_batch(states)
+
+    assert len(results) == len(states)
+    for state, (directive, explanation) in zip(states, results):
+        single, single_explanation = brain.decide(state)
+
+        assert directive is single
+        assert directive is DIRECTIVES[directive.strategy]
+        if directive.explanation_required:
+            assert explanation.state_summary == single_explanation.state_summary
+        else:
+            assert explanation is None
+
+
+def test_interned_directives_are_immutable():
+    for directive in DIRECTIVES.values():
+        assert isinstance(directive.allowed_capabilities, tuple)
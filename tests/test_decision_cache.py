@@ -0,0 +1,59 @@
+"""
+tests/test_decision_cache.py
+
+Ensures margin-cached decisions always equal
+a fresh select_strategy call.
+"""
+
+import random
+
+import pytest
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.policies.router import select_strategy
+from governing_brain.state_model import BehavioralState
+
+
+def _walk(rng: random.Random, state: BehavioralState, step: float):
+    return BehavioralState(*(
+        max(-1.0 if name == "momentum_trend" else 0.0,
+            min(1.0, value + rng.uniform(-step, step)))
+        for name, value in vars(state).items()
+    ))
+
+
+def test_cached_decisions_match_fresh_routing():
+    rng = random.Random(5)
+    brain = GoverningBrain(margin_cache=True, verify_cache=True)
+
+    for user in range(50):
+        state = BehavioralState(
+            rng.random(), rng.random(), rng.random(),
+            rng.random(), rng.random(), rng.uniform(-1.0, 1.0),
+        )
+        for _ in range(200):
+            state = _walk(rng, state, 0.02)
+            directive, explanation = brain.decide(state, cache_key=user)
+
+            assert directive.strategy == select_strategy(state)
+            assert explanation.strategy_selected == directive.strategy
+
+    cache = brain.decision_cache
+    assert cache.hits > 0
+    assert cache.hits + cache.misses == 50 * 200
+
+
+def test_state_on_threshold_never_hits():
+    brain = GoverningBrain(margin_cache=True)
+    state = BehavioralState(0.5, 0.6, 0.3, 0.6, 0.5, 0.0)
+
+    brain.decide(state)
+    brain.decide(state)
+
+    assert brain.decision_cache.hits == 0
+    assert brain.decision_cache.misses == 2
+
+
+def test_margin_cache_rejects_opaque_router():
+    with pytest.raises(ValueError):
+        GoverningBrain(router=select_strategy.__call__, margin_cache=True)
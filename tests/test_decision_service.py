@@ -0,0 +1,170 @@
+"""
+tests/test_decision_service.py
+
+Exercises the micro-batching decision service in-process
+and over a Unix socket.
+"""
+
+import asyncio
+import json
+import random
+
+import pytest
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.state_model import update_state
+from service.decision_service import DecisionService
+from service.load_client import make_request_batch, run_load_test
+from service.protocol import encode_batch
+
+
+def test_submissions_match_sequential_updates():
+    rng = random.Random(2)
+    batches = {
+        user: [make_request_batch(rng, day) for day in range(10)]
+        for user in ("a", "b", "c")
+    }
+
+    async def scenario():
+        service = DecisionService(max_batch_size=8)
+        await service.start()
+        results = await asyncio.gather(*(
+            service.submit(user, batch)
+            for day in range(10)
+            for user, user_batches in batches.items()
+            for batch in [user_batches[day]]
+        ))
+        await service.stop()
+        return service, results
+
+    service, results = asyncio.run(scenario())
+
+    brain = GoverningBrain()
+    for user, user_batches in batches.items():
+        state = None
+        for batch in user_batches:
+            state = update_state(state, batch)
+        assert service.states[user] == state
+        assert results[-3 + "abc".index(user)][1] == brain.decide(state)[0]
+
+    assert service.metrics.requests == 30
+    assert service.metrics.batches >= 4
+
+
+def test_unix_socket_round_trip(tmp_path):
+    path = str(tmp_path / "service.sock")
+    batch = make_request_batch(random.Random(0), 0)
+
+    async def scenario():
+        service = DecisionService()
+        await service.start_unix(path)
+        reader, writer = await asyncio.open_unix_connection(path)
+
+        writer.write(encode_batch("u-1", batch, request_id=7))
+        writer.write(b'{"id": 8, "user_id": "u-1"}\n')
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(2)]
+
+        writer.close()
+        await service.stop()
+        return responses
+
+    responses = {r["id"]: r for r in asyncio.run(scenario())}
+
+    assert responses[7]["user_id"] == "u-1"
+    assert responses[7]["strategy"]
+    assert "error" in responses[8]
+
+
+def test_load_client_reports_latency_and_throughput():
+    result = asyncio.run(run_load_test(users=20, requests_per_user=5))
+
+    assert result["client_requests"] == 100
+    assert result["requests"] == 100
+    assert result["p99_ms"] >= result["p50_ms"] >= 0.0
+    assert result["throughput_rps"] > 0
+
+
+class _FailingBrain(GoverningBrain):
+    def decide(self, state, cache_key=None):
+        if cache_key == "bad":
+            raise RuntimeError("decide failed")
+        return super().decide(state, cache_key=cache_key)
+
+
+def test_failed_request_gets_error_and_connection_survives(tmp_path):
+    path = str(tmp_path / "service.sock")
+    batch = make_request_batch(random.Random(1), 0)
+
+    async def scenario():
+        service = DecisionService(brain=_FailingBrain(), max_queue_size=4)
+        await service.start_unix(path)
+        reader, writer = await asyncio.open_unix_connection(path)
+
+        writer.write(encode_batch("bad", batch, request_id=1))
+        writer.write(encode_batch("good", batch, request_id=2))
+        await writer.drain()
+        first = [json.loads(await reader.readline()) for _ in range(2)]
+
+        writer.write(encode_batch("good", batch, request_id=3))
+        await writer.drain()
+        second = json.loads(await reader.readline())
+
+        writer.close()
+        await service.stop()
+        return service, first + [second]
+
+    service, responses = asyncio.run(scenario())
+    responses = {r["id"]: r for r in responses}
+
+    assert responses[1]["error"] == "decide failed"
+    assert responses[2]["strategy"] and responses[3]["strategy"]
+    assert "bad" not in service.states
+    assert service.metrics.errors == 1
+    assert service._queue.maxsize == 4
+
+
+class _SlowService(DecisionService):
+    active = 0
+    peak = 0
+
+    async def _respond(self, line, writer):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.005)
+        await super()._respond(line, writer)
+        self.active -= 1
+
+
+def test_connection_reader_waits_for_in_flight_requests(tmp_path):
+    path = str(tmp_path / "service.sock")
+    batch = make_request_batch(random.Random(3), 0)
+
+    async def scenario():
+        service = _SlowService(max_in_flight=2)
+        await service.start_unix(path)
+        reader, writer = await asyncio.open_unix_connection(path)
+
+        for request_id in range(10):
+            writer.write(encode_batch("u-1", batch, request_id=request_id))
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(10)]
+
+        writer.close()
+        await service.stop()
+        return service, responses
+
+    service, responses = asyncio.run(scenario())
+
+    assert sorted(r["id"] for r in responses) == list(range(10))
+    assert service.peak == 2
+
+
+def test_submit_before_start_raises():
+    batch = make_request_batch(random.Random(4), 0)
+
+    async def scenario():
+        await DecisionService().submit("u-1", batch)
+
+    with pytest.raises(RuntimeError, match="service not started"):
+        asyncio.run(scenario())
@@ -0,0 +1,89 @@
+"""
+tests/test_evaluation_accumulator.py
+
+Checks the online PolicyEvaluator accumulator against
+direct computation and split-and-merge reduction.
+"""
+
+import math
+from dataclasses import replace
+
+import pytest
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.strategies import Strategy
+from policy_evolution.evaluator import (
+    PolicyEvaluationAccumulator,
+    PolicyEvaluator,
+)
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+def _logs(days: int = 90, seed: int = 11):
+    user = SyntheticUser("Accumulated", compliance_bias=0.5, seed=seed)
+    return TimeEngine(GoverningBrain(), user, total_days=days).run()
+
+
+def test_accumulator_matches_direct_computation():
+    logs = _logs()
+    evaluation = PolicyEvaluationAccumulator().extend(logs).evaluate()
+
+    alarms = [log for log in logs if log.alarm_triggered]
+    assert evaluation.alarm_trigger_rate == len(alarms) / len(logs)
+    assert evaluation.false_alarm_rate == (
+        sum(log.outcome_success is False for log in alarms) / len(alarms)
+    )
+    assert evaluation.trust_delta == math.fsum(log.trust_delta for log in logs)
+    assert evaluation.fatigue_delta == logs[-1].fatigue - logs[0].fatigue
+    assert evaluation.support_ratio == (
+        sum(log.strategy == Strategy.SUPPORT for log in logs) / len(logs)
+    )
+    assert evaluation == PolicyEvaluator(logs).evaluate()
+
+
+@pytest.mark.parametrize("split", [0, 1, 45, 89, 90])
+def test_merged_accumulators_match_single_pass(split):
+    logs = _logs()
+    whole = PolicyEvaluationAccumulator().extend(logs).evaluate()
+
+    head = PolicyEvaluationAccumulator().extend(logs[:split])
+    tail = PolicyEvaluationAccumulator().extend(logs[split:])
+    merged = (head + tail).evaluate()
+
+    assert merged == whole
+
+
+@pytest.mark.parametrize("delta, total, health", [
+    (0.004, 0.08, "healthy"),
+    (-0.004, -0.08, "degrading"),
+])
+def test_trust_deltas_are_not_quantized(delta, total, health):
+    logs = [replace(log, trust_delta=delta) for log in _logs(20)]
+    logs = [replace(log, alarm_triggered=False) for log in logs]
+
+    evaluation = PolicyEvaluator(logs).evaluate()
+
+    assert evaluation.trust_delta == math.fsum([delta] * 20)
+    assert evaluation.trust_delta == pytest.approx(total)
+    assert evaluation.governance_health == health
+
+
+def test_near_zero_trust_is_not_degrading():
+    logs = _logs(3)
+    logs = [
+        replace(log, alarm_triggered=False, trust_delta=delta)
+        for log, delta in zip(logs, (0.3, -0.1, -0.2))
+    ]
+
+    evaluation = PolicyEvaluator(logs).evaluate()
+
+    assert -1e-15 < evaluation.trust_delta < 0
+    assert evaluation.governance_health == "healthy"
+
+
+def test_empty_accumulator_cannot_evaluate():
+    with pytest.raises(ValueError):
+        PolicyEvaluationAccumulator().evaluate()
+    empty = PolicyEvaluationAccumulator() + PolicyEvaluationAccumulator()
+    assert len(empty) == 0
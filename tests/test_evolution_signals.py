@@ -1,4 +1,5 @@
 from simulation.run_simulation import run_basic_simulation
+from policy_evolution.evaluation import PolicyEvaluation
 from policy_evolution.evaluator import PolicyEvaluator
 from policy_evolution.signal_engine import EvolutionSignalEngine
 from policy_evolution.signals import EvolutionSignal
@@ -14,3 +15,25 @@ def test_evolution_signals_generated():
     assert isinstance(signals, set)
     assert len(signals) >= 1
     assert all(isinstance(s, EvolutionSignal) for s in signals)
+
+
+def test_low_enforcement_does_not_derive_under_enforcement():
+    evaluation = PolicyEvaluation(
+        window_days=30,
+        alarm_trigger_rate=0.7,
+        success_rate=0.5,
+        false_alarm_rate=0.4,
+        trust_delta=-0.2,
+        fatigue_delta=0.1,
+        enforcement_ratio=0.0,
+        support_ratio=0.9,
+        stabilization_ratio=0.1,
+        governance_health="risky",
+    )
+
+    assert EvolutionSignalEngine().derive(evaluation) == {
+        EvolutionSignal.RISKY,
+        EvolutionSignal.ALARM_FATIGUE,
+        EvolutionSignal.TRUST_COLLAPSE,
+        EvolutionSignal.STRATEGY_STAGNATION,
+    }
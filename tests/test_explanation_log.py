@@ -0,0 +1,105 @@
+"""
+tests/test_explanation_log.py
+
+Validates the columnar explanation log: segmenting,
+queries by strategy and time range, and round trips.
+"""
+
+import random
+from dataclasses import replace
+from datetime import timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.explanation_log import ExplanationLog
+from governing_brain.state_model import BehavioralState
+from governing_brain.strategies import Strategy
+
+
+def _explanations(count: int, lazy: bool):
+    rng = random.Random(4)
+    brain = GoverningBrain(lazy_explanations=lazy)
+    return [
+        brain.decide(BehavioralState(
+            rng.random(), rng.random(), rng.random(),
+            rng.random(), rng.random(), rng.uniform(-1.0, 1.0),
+        ))[1]
+        for _ in range(count)
+    ]
+
+
+def test_log_round_trips_and_filters(tmp_path):
+    records = _explanations(250, lazy=False) + _explanations(250, lazy=True)
+
+    log = ExplanationLog(str(tmp_path), segment_size=64)
+    log.extend(records)
+    log.flush()
+
+    assert len(log) == 500
+    assert len(log.segments) == 8
+
+    support = log.query(strategy=Strategy.SUPPORT)
+    expected = [r for r in records if r.strategy_selected == Strategy.SUPPORT]
+    assert len(support["strategy"]) == len(expected)
+
+    restored = ExplanationLog.materialize(support, 0)
+    assert restored.decision_id == expected[0].decision_id
+    assert restored.summary == expected[0].summary
+    assert restored.state_summary == expected[0].state_summary
+    assert restored.state_snapshot == expected[0].state_snapshot
+    assert restored.timestamp == expected[0].timestamp
+
+
+def test_time_range_query_and_reopen(tmp_path):
+    records = _explanations(100, lazy=True)
+    log = ExplanationLog(str(tmp_path), segment_size=30)
+    log.extend(records)
+    log.flush()
+
+    cutoff = records[50].timestamp
+    later = log.query(start=cutoff, columns=("timestamp_us",))
+    assert len(later["timestamp_us"]) == sum(
+        1 for r in records if r.timestamp >= cutoff
+    )
+
+    reopened = ExplanationLog(str(tmp_path))
+    assert len(reopened) == 100
+    none = reopened.query(end=records[0].timestamp - timedelta(days=1))
+    assert len(none["strategy"]) == 0
+
+
+def test_lazy_append_reads_raw_values(tmp_path):
+    records = _explanations(200, lazy=True)
+    log = ExplanationLog(str(tmp_path))
+    log.extend(records)
+    log.flush()
+
+    # Appending must not render the timestamp or id strings
+    assert all(r._timestamp is None and r._decision_id is None for r in records)
+
+    columns = log.query()
+    for index, record in enumerate(records):
+        restored = ExplanationLog.materialize(columns, index)
+        assert restored.timestamp == record.timestamp
+        assert restored.decision_id == record.decision_id
+
+
+def test_non_default_text_fields_are_rejected(tmp_path):
+    record = _explanations(1, lazy=False)[0]
+    log = ExplanationLog(str(tmp_path))
+
+    with pytest.raises(ValueError, match="trigger"):
+        log.append(replace(record, trigger="Manual override"))
+    assert len(log) == 0
+
+
+def test_manifest_ignores_blank_lines(tmp_path):
+    log = ExplanationLog(str(tmp_path), segment_size=10)
+    log.extend(_explanations(20, lazy=True))
+    with (tmp_path / "manifest.jsonl").open("a") as f:
+        f.write("\n")
+
+    assert len(ExplanationLog(str(tmp_path))) == 20
@@ -0,0 +1,65 @@
+"""
+tests/test_lazy_explanations.py
+
+Ensures lazy explanation records render exactly
+what eager records render.
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.explanations import ExplanationRecord
+from governing_brain.state_model import BehavioralState
+
+
+def test_lazy_rendering_matches_eager():
+    state = BehavioralState(0.41, 0.6, 0.25, 0.7, 0.35, -0.123)
+
+    _, eager = GoverningBrain().decide(state)
+    _, lazy = GoverningBrain(lazy_explanations=True).decide(state)
+
+    for name in (
+        "trigger",
+        "strategy_selected",
+        "state_snapshot",
+        "state_summary",
+        "action_summary",
+        "expected_outcome",
+        "reversal_condition",
+        "decision_confidence",
+        "summary",
+    ):
+        assert getattr(lazy, name) == getattr(eager, name)
+
+    assert list(lazy.state_snapshot) == list(eager.state_snapshot)
+    assert lazy.timestamp.tzinfo == eager.timestamp.tzinfo
+
+
+def test_lazy_record_captures_decision_time_state():
+    state = BehavioralState(0.5, 0.5, 0.3, 0.5, 0.5, 0.0)
+    _, lazy = GoverningBrain(lazy_explanations=True).decide(state)
+
+    state.failure_risk = 0.9
+
+    assert lazy.state_snapshot["failure_risk"] == 0.5
+    assert lazy.decision_id == lazy.decision_id
+
+    record = lazy.materialize()
+    assert isinstance(record, ExplanationRecord)
+    assert record.decision_id == lazy.decision_id
+    assert record.timestamp == lazy.timestamp
+    assert record.summary == lazy.summary
+
+
+def test_lazy_record_is_immutable():
+    state = BehavioralState(0.5, 0.5, 0.3, 0.5, 0.5, 0.0)
+    _, lazy = GoverningBrain(lazy_explanations=True).decide(state)
+
+    with pytest.raises(FrozenInstanceError):
+        lazy.strategy_selected = None
+    with pytest.raises(TypeError):
+        lazy.state_snapshot["failure_risk"] = 0.9
+
+    assert lazy.materialize().state_snapshot == lazy.state_snapshot
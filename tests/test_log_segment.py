@@ -0,0 +1,98 @@
+"""
+tests/test_log_segment.py
+
+Checks memory-mapped log segments against in-memory runs.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cli.report_cli import run_report
+from policy_evolution.evaluator import PolicyEvaluator
+from policy_evolution.report import PolicyEvolutionReport
+from policy_evolution.windowed import WindowedEvaluator
+from simulation.log_segment import LogSegment, LogSegmentWriter, save_segment
+from simulation.log_table import SimulationLogTable
+from tests.helpers import make_engine
+
+
+def test_streamed_segment_round_trip(tmp_path):
+    logs = make_engine().run()
+    path = tmp_path / "run.seg"
+    make_engine().run_to(LogSegmentWriter(str(path), "v-1", seed=21, chunk_size=25))
+
+    segment = LogSegment(str(path))
+    assert (segment.policy_version, segment.seed) == ("v-1", 21)
+    assert len(segment) == len(logs)
+    assert isinstance(segment.columns["trust_delta"], np.memmap)
+
+    table = SimulationLogTable.from_logs(logs)
+    assert [segment.table.row(i) for i in range(len(logs))] == [
+        table.row(i) for i in range(len(logs))
+    ]
+    assert not path.with_name("run.seg.tmp").exists()
+
+
+def test_evaluators_read_slices(tmp_path):
+    logs = make_engine().run()
+    path = tmp_path / "run.seg"
+    save_segment(SimulationLogTable.from_logs(logs), str(path), "v-2")
+    segment = LogSegment(str(path))
+
+    assert PolicyEvaluator(segment).evaluate() == PolicyEvaluator(logs).evaluate()
+    assert (
+        PolicyEvaluator(segment[40:75]).evaluate()
+        == PolicyEvaluator(logs[40:75]).evaluate()
+    )
+    assert WindowedEvaluator(segment).series(30) == WindowedEvaluator(logs).series(30)
+    assert (
+        WindowedEvaluator(segment[10:50]).series(7)
+        == WindowedEvaluator(logs[10:50]).series(7)
+    )
+
+    report = PolicyEvolutionReport().generate(
+        evaluation=PolicyEvaluator(segment[90:]).evaluate(),
+        signals=[],
+        recommendation=None,
+        proposed_version=None,
+        run_metadata=segment.metadata(90),
+    )
+    assert "Policy Version       : v-2" in report
+    assert "Days                 : 91-120" in report
+
+
+def test_empty_and_invalid_segments(tmp_path):
+    path = tmp_path / "empty.seg"
+    with LogSegmentWriter(str(path), "v-0"):
+        pass
+    assert len(LogSegment(str(path))) == 0
+
+    with pytest.raises(RuntimeError):
+        with LogSegmentWriter(str(tmp_path / "failed.seg"), "v-0"):
+            raise RuntimeError("simulation failed")
+    assert list(tmp_path.iterdir()) == [path]
+
+    path.write_bytes(b"not a segment")
+    with pytest.raises(ValueError):
+        LogSegment(str(path))
+
+
+def test_report_cli_reads_a_segment_slice(tmp_path, monkeypatch, capsys):
+    logs = make_engine().run()
+    path = tmp_path / "run.seg"
+    save_segment(SimulationLogTable.from_logs(logs), str(path), "v-3")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("builtins.input", lambda prompt="": "n")
+    run_report(segment=str(path), start=90)
+    out = capsys.readouterr().out
+
+    assert "Policy Version       : v-3" in out
+    assert "Days                 : 91-120" in out
+    assert "Day 1" not in out
+
+    with LogSegment(str(path)) as segment:
+        assert len(segment) == 120
+    with pytest.raises(ValueError):
+        len(segment)
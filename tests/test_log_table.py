@@ -0,0 +1,130 @@
+"""
+tests/test_log_table.py
+
+Checks the columnar SimulationLogTable against SimulationLogs.
+"""
+
+import csv
+import json
+import random
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from governing_brain.inputs import Signal, SignalBatch
+from policy_evolution.evaluator import PolicyEvaluator
+from simulation import log_table
+from simulation.log_table import LogTableSink, SimulationLogTable
+from simulation.metrics import SimulationLog
+from tests.helpers import make_engine
+
+
+def _expected_row(log: SimulationLog):
+    row = log.to_dict()
+    del row["explanation"]
+    return row
+
+
+def test_rows_match_logs():
+    logs = make_engine().run()
+    table = SimulationLogTable.from_logs(logs)
+
+    assert len(table) == len(logs)
+    for i, log in enumerate(logs):
+        assert table.row(i) == _expected_row(log)
+        assert table.signal_names_at(i) == [s.name for s in log.signals.signals]
+
+
+@pytest.mark.parametrize("chunk_rows", [7, 65_536])
+def test_policy_evaluator_consumes_table(monkeypatch, chunk_rows):
+    monkeypatch.setattr(log_table, "ACCUMULATE_CHUNK_ROWS", chunk_rows)
+    logs = make_engine().run()
+    table = make_engine().run_to(LogTableSink()).table()
+
+    assert PolicyEvaluator(table).evaluate() == PolicyEvaluator(logs).evaluate()
+    assert (
+        PolicyEvaluator(table[30:60]).evaluate()
+        == PolicyEvaluator(logs[30:60]).evaluate()
+    )
+
+
+def test_slices_and_concat():
+    logs = make_engine().run()
+    table = SimulationLogTable.from_logs(logs)
+
+    parts = [table[:17], table[17:50], table[50:]]
+    joined = SimulationLogTable.concat(parts)
+    assert [joined.row(i) for i in range(len(joined))] == [
+        _expected_row(log) for log in logs
+    ]
+    assert len(table[80:200]) == 40
+    assert len(table[50:10]) == 0
+
+    with pytest.raises(TypeError):
+        table[3]
+
+
+def test_accumulator_sums_trust_exactly(monkeypatch):
+    rng = random.Random(8)
+    logs = [
+        replace(
+            log,
+            trust_delta=rng.uniform(-1.0, 1.0) * 10 ** rng.randint(-300, 3),
+        )
+        for log in make_engine().run()
+    ]
+    logs[0] = replace(logs[0], trust_delta=5e-324)
+    monkeypatch.setattr(log_table, "ACCUMULATE_CHUNK_ROWS", 7)
+
+    assert PolicyEvaluator(SimulationLogTable.from_logs(logs)).evaluate() == (
+        PolicyEvaluator(logs).evaluate()
+    )
+
+
+def test_unregistered_signal_names():
+    log = make_engine(1).run()[0]
+    custom = SimulationLog(
+        day=2,
+        state=log.state,
+        signals=SignalBatch(
+            [
+                Signal("lab_meeting", 1.0, 1.0, log.signals.window_start),
+                Signal("sleep_debt", 0.5, 0.9, log.signals.window_start),
+            ],
+            window_start=log.signals.window_start,
+            window_end=log.signals.window_end,
+        ),
+        directive=log.directive,
+        explanation=log.explanation,
+        alarm_triggered=False,
+        outcome_success=None,
+        trust_delta=0.0,
+    )
+    table = SimulationLogTable.from_logs([log, custom])
+    assert table.row(1) == _expected_row(custom)
+    assert table.signal_names[-1] == "lab_meeting"
+
+
+def test_bulk_export(tmp_path):
+    logs = make_engine().run()
+    table = SimulationLogTable.from_logs(logs)
+
+    jsonl = tmp_path / "logs.jsonl"
+    table.to_jsonl(str(jsonl), chunk_size=7)
+    rows = [json.loads(line) for line in jsonl.read_text().splitlines()]
+    assert rows == [_expected_row(log) for log in logs]
+
+    path = tmp_path / "logs.csv"
+    table.to_csv(str(path), chunk_size=7)
+    with path.open(newline="") as f:
+        records = list(csv.DictReader(f))
+    assert len(records) == len(logs)
+    assert [int(r["day"]) for r in records] == [log.day for log in logs]
+    assert [r["signal_names"] for r in records] == [
+        ";".join(s.name for s in log.signals.signals) for log in logs
+    ]
+    assert [float(r["trust_delta"]) for r in records] == [
+        log.trust_delta for log in logs
+    ]
@@ -0,0 +1,62 @@
+"""
+tests/test_lookup_table.py
+
+Validates the precomputed strategy lookup table
+against the live router, and its persistence.
+"""
+
+import pytest
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.policies.lookup_table import StrategyLookupTable
+from governing_brain.policies.router import select_strategy
+from governing_brain.policies.rules import resolve_rules
+from governing_brain.state_model import BehavioralState
+from governing_brain.strategies import Strategy
+
+
+def test_table_agrees_with_live_router():
+    table = StrategyLookupTable.build()
+
+    assert len(table) == 7 * 9 * 7 * 9 * 5 * 7
+    assert table.validate(samples=20_000, seed=1) == 0
+
+
+def test_saved_table_is_memory_mapped_and_checked(tmp_path):
+    path = tmp_path / "strategy_table.bin"
+    StrategyLookupTable.build().save(str(path))
+
+    loaded = StrategyLookupTable.load(str(path))
+    assert loaded.validate(samples=2_000) == 0
+
+    changed = resolve_rules(
+        parameters={"burnout.acute_overload.failure_risk_min": 0.55}
+    )
+    with pytest.raises(ValueError):
+        StrategyLookupTable.load(str(path), changed)
+
+    rebuilt = StrategyLookupTable.load_or_build(str(path), changed)
+    state = BehavioralState(0.5, 0.55, 0.3, 0.65, 0.5, 0.0)
+    assert rebuilt(state) == Strategy.SUPPORT
+    assert StrategyLookupTable.load(str(path), changed)(state) == (
+        Strategy.SUPPORT
+    )
+
+
+def test_table_can_route_brain_decisions():
+    brain = GoverningBrain(
+        router=StrategyLookupTable.build(), margin_cache=True
+    )
+    directive, _ = brain.decide(BehavioralState(0.5, 0.7, 0.3, 0.7, 0.5, 0.0))
+
+    assert directive.strategy == Strategy.SUPPORT
+
+
+def test_validation_uses_the_tables_own_rules():
+    changed = resolve_rules(
+        parameters={"burnout.acute_overload.failure_risk_min": 0.55}
+    )
+    table = StrategyLookupTable.build(changed)
+
+    assert table.validate(samples=4_000) == 0
+    assert table.validate(router=select_strategy, samples=4_000) > 0
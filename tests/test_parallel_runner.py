@@ -0,0 +1,53 @@
+"""
+tests/test_parallel_runner.py
+
+Checks that parallel simulation results do not depend
+on the worker count and match a serial TimeEngine run.
+"""
+
+from governing_brain.brain import GoverningBrain
+from simulation.parallel_runner import (
+    SimulationAggregate,
+    SyntheticUserConfig,
+    derive_seed,
+    run_parallel_simulation,
+)
+from simulation.time_engine import TimeEngine
+
+
+CONFIGS = [
+    SyntheticUserConfig(
+        name=f"user-{i}",
+        compliance_bias=0.4 + 0.05 * (i % 8),
+        fatigue_sensitivity=0.3 + 0.1 * (i % 5),
+        avoidance_tendency=0.1 + 0.1 * (i % 4),
+    )
+    for i in range(20)
+]
+
+
+def test_results_are_independent_of_worker_count():
+    serial = run_parallel_simulation(CONFIGS, days=15, root_seed=9, workers=1)
+    pooled = run_parallel_simulation(CONFIGS, days=15, root_seed=9, workers=3)
+
+    assert pooled == serial
+    assert pooled.evaluate() == serial.evaluate()
+    assert serial.users == 20 and serial.user_days == 300
+
+
+def test_aggregate_matches_serial_time_engine_runs():
+    expected = SimulationAggregate()
+    for index, config in enumerate(CONFIGS[:5]):
+        user = config.build(derive_seed(3, index))
+        expected.add_user(TimeEngine(GoverningBrain(), user, 10).run())
+
+    result = run_parallel_simulation(
+        CONFIGS[:5], days=10, root_seed=3, workers=1, chunk_size=5
+    )
+    assert result == expected
+
+
+def test_seeds_are_stable_and_distinct():
+    assert derive_seed(0, 0) == derive_seed(0, 0)
+    assert len({derive_seed(0, i) for i in range(1000)}) == 1000
+    assert derive_seed(0, 1) != derive_seed(1, 0)
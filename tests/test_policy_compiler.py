@@ -0,0 +1,117 @@
+"""
+tests/test_policy_compiler.py
+
+Ensures the rule-generated routers and policies match the
+hand-written policy modules and honour policy version
+overrides.
+"""
+
+import random
+
+import pytest
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.policies.compiler import compile_policy, compile_router
+from governing_brain.policies.router import select_strategy
+from governing_brain.policies.burnout import burnout_policy
+from governing_brain.policies.context import context_guard_policy
+from governing_brain.policies.enforcement import enforcement_policy
+from governing_brain.policies.support import early_support_policy
+from governing_brain.policies.rules import policy_rules, rule_parameters
+from governing_brain.state_model import BehavioralState
+from governing_brain.strategies import Strategy
+from policy_evolution.router_cache import PolicyRouterCache
+from policy_evolution.versioning import PolicyVersion
+
+
+def _grid(rng: random.Random, low: float = 0.0) -> float:
+    return round(rng.randint(int(low * 20), 20) * 0.05, 2)
+
+
+HAND_WRITTEN_POLICIES = {
+    "burnout": burnout_policy,
+    "support": early_support_policy,
+    "context": context_guard_policy,
+    "enforcement": enforcement_policy,
+}
+
+
+def _states(seed: int, count: int = 20_000):
+    rng = random.Random(seed)
+    for i in range(count):
+        if i % 2:
+            yield BehavioralState(
+                rng.random(), rng.random(), rng.random(),
+                rng.random(), rng.random(), rng.uniform(-1.0, 1.0),
+            )
+        else:
+            # On the 0.05 grid, so states land exactly on thresholds
+            yield BehavioralState(
+                _grid(rng), _grid(rng), _grid(rng),
+                _grid(rng), _grid(rng), _grid(rng, -1.0),
+            )
+
+
+def test_compiled_router_matches_select_strategy():
+    router = compile_router()
+
+    for state in _states(21):
+        assert router(state) == select_strategy(state)
+
+
+def test_compiled_policies_match_hand_written_policies():
+    compiled = {
+        name: compile_policy(policy_rules(name), f"compiled_{name}")
+        for name in HAND_WRITTEN_POLICIES
+    }
+
+    for state in _states(22):
+        for name, policy in HAND_WRITTEN_POLICIES.items():
+            assert compiled[name](state) == policy(state), name
+
+
+def test_policy_version_overrides_thresholds_and_is_cached():
+    # Acute overload only: failure 0.55 is below the default 0.6
+    state = BehavioralState(0.5, 0.55, 0.3, 0.65, 0.5, 0.0)
+    assert select_strategy(state) == Strategy.STABILIZATION
+
+    version = PolicyVersion(
+        parameters={
+            "alarm_strictness": 0.6,
+            "burnout.acute_overload.failure_risk_min": 0.5,
+        },
+        reason="Lower burnout threshold",
+    )
+
+    cache = PolicyRouterCache()
+    router = cache.router_for(version)
+
+    assert router(state) == Strategy.SUPPORT
+    assert cache.router_for(version) is router
+    assert len(cache) == 1
+    assert "0.5" in router.__source__
+
+
+def test_compiled_policy_returns_none_without_a_match():
+    policy = compile_policy(policy_rules("enforcement"), "enforcement_policy")
+
+    assert policy.__rules__ == policy_rules("enforcement")
+    assert "return None" in policy.__source__
+
+    with pytest.raises(ValueError):
+        policy_rules("unknown")
+
+
+def test_rule_parameters_expose_thresholds():
+    params = rule_parameters()
+
+    assert params["burnout.acute_overload.fatigue_index_min"] == 0.6
+    assert params["support.pre_burnout.failure_risk_below"] == 0.6
+
+
+def test_brain_accepts_compiled_router():
+    state = BehavioralState(0.5, 0.7, 0.3, 0.7, 0.5, 0.0)
+
+    directive, _ = GoverningBrain(router=compile_router()).decide(state)
+
+    assert directive.strategy == Strategy.SUPPORT
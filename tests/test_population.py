@@ -0,0 +1,92 @@
+"""
+tests/test_population.py
+
+Validates the vectorized population engine against
+TimeEngine runs that replay the same random draws.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.strategies import STRATEGY_CODES
+from policy_evolution.evaluator import PolicyEvaluator
+from simulation.population import (
+    PopulationOutcome,
+    PopulationTimeEngine,
+    SyntheticPopulation,
+)
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+class _ReplayRandom:
+    """
+    Stands in for SyntheticUser.random, returning fixed draws.
+    """
+
+    def __init__(self, values):
+        self._values = iter(values)
+
+    def random(self):
+        return next(self._values)
+
+
+def test_population_matches_time_engine_with_replayed_draws():
+    days = 40
+    users = [
+        SyntheticUser(f"u{i}", compliance_bias=c, fatigue_sensitivity=f,
+                      avoidance_tendency=a)
+        for i, (c, f, a) in enumerate([
+            (0.6, 0.5, 0.3), (0.2, 0.9, 0.8), (0.9, 0.1, 0.1),
+            (0.45, 0.7, 0.5), (0.3, 0.3, 0.9),
+        ])
+    ]
+
+    engine = PopulationTimeEngine(
+        SyntheticPopulation.from_users(users), total_days=days, seed=7
+    )
+    draws = [engine.draw() for _ in range(days)]
+    outcome = PopulationOutcome.empty(len(users))
+    population_days = []
+    for day_draws in draws:
+        population_days.append(engine.step(day_draws))
+        outcome.add_day(population_days[-1])
+
+    for i, user in enumerate(users):
+        user.random = _ReplayRandom(
+            value for day_draws in draws for value in day_draws[:, i].tolist()
+        )
+        logs = TimeEngine(GoverningBrain(), user, total_days=days).run()
+
+        for log, day in zip(logs, population_days):
+            assert day.states.state_at(i) == log.state
+            assert day.strategies[i] == STRATEGY_CODES[log.strategy]
+            assert day.alarm_triggered[i] == log.alarm_triggered
+            assert day.outcome_success[i] == log.outcome_success
+            assert day.trust_delta[i] == log.trust_delta
+
+        evaluation = outcome.evaluate_user(i)
+        expected = PolicyEvaluator(logs).evaluate()
+        assert evaluation.trust_delta == pytest.approx(
+            expected.trust_delta, abs=1e-12
+        )
+        assert evaluation == replace(
+            expected, trust_delta=evaluation.trust_delta
+        )
+
+
+def test_population_run_is_seeded_and_evaluates():
+    population = SyntheticPopulation.uniform(1_000, seed=1)
+
+    first = PopulationTimeEngine(population, total_days=30, seed=3).run()
+    second = PopulationTimeEngine(population, total_days=30, seed=3).run()
+    evaluation = first.evaluate()
+
+    assert evaluation == second.evaluate()
+    assert evaluation.window_days == 30
+    assert 0.0 <= evaluation.alarm_trigger_rate <= 1.0
+    assert first.strategy_counts.sum() == 30 * 1_000
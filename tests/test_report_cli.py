@@ -4,3 +4,10 @@ from cli.report_cli import run_report
 def test_report_cli_runs_without_error():
     # Smoke test: should execute without raising
     run_report(days=3)
+
+
+def test_report_cli_quiet_simulation(capsys):
+    run_report(days=30, output="silent")
+    out = capsys.readouterr().out
+    assert "Policy Evolution Report" in out
+    assert "Day 1" not in out
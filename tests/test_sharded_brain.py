@@ -0,0 +1,65 @@
+"""
+tests/test_sharded_brain.py
+
+Checks that sharded workers reproduce sequential
+update_state + decide results in request order.
+"""
+
+import random
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.state_model import update_state
+from service.load_client import make_request_batch
+from service.sharded import ShardError, ShardedBrain
+
+
+def test_sharded_results_match_sequential_processing():
+    rng = random.Random(4)
+    requests = [
+        (f"user-{user}", make_request_batch(rng, day))
+        for day in range(6)
+        for user in range(25)
+    ]
+
+    with ShardedBrain(workers=3) as sharded:
+        results = sharded.process(requests[:70])
+        results += sharded.process(requests[70:])
+        states = sharded.states()
+
+    brain = GoverningBrain()
+    expected_states = {}
+    for (user_id, batch), (state, directive) in zip(requests, results):
+        expected = update_state(expected_states.get(user_id), batch)
+        expected_states[user_id] = expected
+        assert state == expected
+        assert directive == brain.decide(expected)[0]
+
+    assert states == expected_states
+
+
+def test_sharding_is_stable():
+    with ShardedBrain(workers=4) as sharded:
+        assert sharded.shard_of("user-7") == sharded.shard_of("user-7")
+        assert {sharded.shard_of(f"u{i}") for i in range(100)} == {0, 1, 2, 3}
+
+
+def test_failed_requests_are_reported_per_request():
+    rng = random.Random(5)
+    good = [(f"user-{i}", make_request_batch(rng, 0)) for i in range(6)]
+    later = (good[0][0], make_request_batch(rng, 1))
+    requests = good[:3] + [("user-0", None), later] + good[3:]
+
+    with ShardedBrain(workers=2) as sharded:
+        results = sharded.process(requests)
+        states = sharded.states()
+
+    failed = results.pop(3)
+    assert isinstance(failed, ShardError)
+    assert "shard" in str(failed)
+
+    # Every other request was applied, once, in order
+    expected = {}
+    for user_id, batch in good[:3] + [later] + good[3:]:
+        expected[user_id] = update_state(expected.get(user_id), batch)
+    assert states == expected
+    assert results[3][0] == expected["user-0"]
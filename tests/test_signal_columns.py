@@ -0,0 +1,95 @@
+"""
+tests/test_signal_columns.py
+
+Validates columnar signal batches against SignalBatch
+construction rules and the scalar update_state.
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from governing_brain.signal_columns import SignalColumns, epoch_us
+from governing_brain.state_model import (
+    BehavioralState,
+    update_state,
+)
+from tests.helpers import WINDOW_END, WINDOW_START, random_batch
+
+
+def test_update_state_matches_signal_batch_bit_for_bit():
+    rng = random.Random(12)
+
+    for _ in range(300):
+        state = BehavioralState(
+            rng.random(), rng.random(), rng.random(),
+            rng.random(), rng.random(), rng.uniform(-1.0, 1.0),
+        )
+        batch = random_batch(rng)
+        columns = SignalColumns.from_batch(batch)
+
+        expected = update_state(state, batch)
+        actual = update_state(state, columns)
+        for name in vars(expected):
+            assert getattr(actual, name).hex() == getattr(expected, name).hex()
+
+
+def test_round_trip_through_signal_batch():
+    batch = random_batch(random.Random(3))
+    assert SignalColumns.from_batch(batch).to_batch() == batch
+
+
+def test_names_are_normalized_and_interned_once():
+    columns = SignalColumns.from_records(
+        names=[" Alarm_Failure", "alarm_failure", "SLEEP_DEBT"],
+        values=[1.0, 1.0, 1.0],
+        confidences=[0.5, 0.5, 0.5],
+        timestamps_us=[epoch_us(WINDOW_START)] * 3,
+        window_start_us=epoch_us(WINDOW_START),
+        window_end_us=epoch_us(WINDOW_END),
+    )
+
+    assert columns.names == ("alarm_failure", "sleep_debt")
+    assert columns.codes.tolist() == [0, 0, 1]
+
+
+@pytest.mark.parametrize(
+    "overrides, message",
+    [
+        ({"names": ["  "]}, "non-empty"),
+        ({"confidences": [1.5]}, "confidence"),
+        ({"confidences": [float("nan")]}, "confidence"),
+        ({"values": ["high"]}, "numeric"),
+        ({"timestamps_us": [epoch_us(WINDOW_END) + 1]}, "outside batch window"),
+        ({"window_start_us": epoch_us(WINDOW_END) + 1}, "window_start"),
+    ],
+)
+def test_validation_matches_scalar_rules(overrides, message):
+    record = {
+        "names": ["alarm_failure"],
+        "values": [1.0],
+        "confidences": [0.5],
+        "timestamps_us": [epoch_us(WINDOW_START)],
+        "window_start_us": epoch_us(WINDOW_START),
+        "window_end_us": epoch_us(WINDOW_END),
+    }
+    record.update(overrides)
+
+    with pytest.raises(ValueError, match=message):
+        SignalColumns.from_records(**record)
+
+
+def test_other_batch_like_objects_take_the_per_signal_path():
+    class BatchView:
+        def __init__(self, batch):
+            self.signals = tuple(batch.signals)
+
+    rng = random.Random(9)
+    previous = BehavioralState(0.5, 0.4, 0.3, 0.6, 0.5, 0.1)
+    for _ in range(50):
+        batch = random_batch(rng)
+        assert update_state(previous, BatchView(batch)) == update_state(
+            previous, batch
+        )
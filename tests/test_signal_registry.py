@@ -0,0 +1,89 @@
+"""
+tests/test_signal_registry.py
+
+Checks the signal registry against state_model categories
+and the integer-coded state update path.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.signal_registry import (
+    CATEGORY_MEMBERS,
+    EFFECTS_BY_CODE,
+    SIGNAL_CODES,
+    SIGNAL_NAMES,
+    SignalCategory,
+    categories_of,
+    code_of,
+    has_category,
+    name_of,
+)
+from governing_brain.state_model import (
+    BehavioralState,
+    SIGNAL_EFFECTS,
+    update_state,
+)
+
+
+def test_codes_are_stable():
+    # Codes are persisted in logs and wire formats: append only
+    assert SIGNAL_NAMES[:4] == (
+        "alarm_failure",
+        "excessive_snooze",
+        "clean_alarm_dismissal",
+        "early_wake_success",
+    )
+    assert SIGNAL_CODES["holiday"] == 24
+
+
+def test_every_effect_signal_is_registered_with_its_effects():
+    for name, effects in SIGNAL_EFFECTS.items():
+        assert EFFECTS_BY_CODE[SIGNAL_CODES[name]] == effects
+
+
+def test_category_masks_match_state_model_sets():
+    for category, members in CATEGORY_MEMBERS.items():
+        for name in SIGNAL_NAMES:
+            assert has_category(code_of(name), category) == (name in members)
+
+    assert categories_of(code_of("late_night_usage")) == (
+        SignalCategory.FAILURE
+        | SignalCategory.FATIGUE
+        | SignalCategory.MOMENTUM_NEGATIVE
+    )
+
+
+def test_lookup_normalizes_names():
+    assert code_of("  Alarm_Failure ") == 0
+    assert name_of(0) == "alarm_failure"
+    assert code_of("unknown_signal") is None
+
+
+def test_registry_coded_columns_update_state():
+    np = pytest.importorskip("numpy")
+    from governing_brain.signal_columns import SignalColumns, epoch_us
+
+    now = datetime(2025, 1, 1, 8, 0)
+    names = ["alarm_failure", "sleep_debt", "exam_day", "unknown_signal"]
+    batch = SignalBatch(
+        signals=[Signal(name, 1.0, 0.7, now) for name in names],
+        window_start=now,
+        window_end=now,
+    )
+    columns = SignalColumns.from_codes(
+        codes=[code_of(name) for name in names[:3]],
+        values=np.ones(3),
+        confidences=np.full(3, 0.7),
+        timestamps_us=np.full(3, epoch_us(now)),
+        window_start_us=epoch_us(now),
+        window_end_us=epoch_us(now),
+    )
+
+    state = BehavioralState(0.5, 0.5, 0.3, 0.5, 0.5, 0.0)
+    assert update_state(state, columns) == update_state(state, batch)
+    assert SignalColumns.from_batch(batch).registry_codes().tolist() == [
+        0, 5, 19, -1,
+    ]
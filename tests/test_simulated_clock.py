@@ -0,0 +1,90 @@
+"""
+tests/test_simulated_clock.py
+
+Checks that simulated timestamps derive from the day index.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.inputs import epoch_us
+from simulation.checkpoint import decode_checkpoint, encode_checkpoint
+from simulation.clock import DEFAULT_CLOCK, SIMULATION_START, SimulatedClock
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+def _windows(logs):
+    return [
+        (log.signals.window_start, log.signals.window_end,
+         [s.timestamp for s in log.signals.signals])
+        for log in logs
+    ]
+
+
+def test_clock_views_agree():
+    clock = SimulatedClock(datetime(2030, 6, 1, 6, 30), seconds_per_day=3_600)
+
+    assert DEFAULT_CLOCK.now(1) == SIMULATION_START
+    assert clock.now(3) == datetime(2030, 6, 1, 8, 30)
+    for day in (1, 2, 365, 10_000):
+        assert clock.epoch_us(day) == epoch_us(clock.now(day))
+        assert clock.epoch_seconds(day) * 1_000_000 == clock.epoch_us(day)
+
+    assert SimulatedClock.from_epoch_seconds(clock.epoch_seconds(1), 3_600) == clock
+
+    with pytest.raises(ValueError):
+        SimulatedClock(datetime(2030, 6, 1, 6, 30, 0, 5))
+
+
+def test_signal_windows_follow_simulated_days():
+    user = SyntheticUser("Clocked", seed=3)
+    logs = TimeEngine(GoverningBrain(), user, total_days=20).run()
+    again = TimeEngine(
+        GoverningBrain(), SyntheticUser("Clocked", seed=3), total_days=20
+    ).run()
+
+    assert _windows(logs) == _windows(again)
+    for log in logs:
+        assert log.signals.window_end == DEFAULT_CLOCK.now(log.day)
+        assert log.signals.window_start == (
+            DEFAULT_CLOCK.now(log.day) - timedelta(hours=8)
+        )
+
+
+def test_checkpoint_keeps_clock():
+    clock = SimulatedClock(datetime(2031, 1, 1), seconds_per_day=43_200)
+    engine = TimeEngine(
+        GoverningBrain(), SyntheticUser("Clocked", seed=4), total_days=10, clock=clock
+    )
+    for _ in zip(range(4), engine.stream()):
+        pass
+
+    resumed = decode_checkpoint(encode_checkpoint(engine))
+    assert resumed.clock == clock
+    assert _windows(resumed.run()) == _windows(list(engine.stream()))
+
+
+
+def test_columnar_signals_use_the_integer_fast_path():
+    pytest.importorskip("numpy")
+
+    def engine(columnar):
+        return TimeEngine(
+            GoverningBrain(), SyntheticUser("Clocked", seed=6),
+            total_days=40, columnar_signals=columnar,
+        )
+
+    logs = engine(False).run()
+    columnar = engine(True).run()
+
+    for log, fast in zip(logs, columnar):
+        assert fast.state == log.state
+        assert fast.directive == log.directive
+        assert fast.to_dict() == log.to_dict()
+        assert fast.signals.window_end_us == DEFAULT_CLOCK.epoch_us(log.day)
+        assert fast.signals.timestamps_us.tolist() == [
+            epoch_us(s.timestamp) for s in log.signals.signals
+        ]
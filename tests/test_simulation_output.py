@@ -0,0 +1,79 @@
+"""
+tests/test_simulation_output.py
+
+Checks run_basic_simulation's output modes and the
+fixed-rate progress indicator.
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from simulation.progress import ProgressReporter
+from simulation.run_simulation import OutputMode, run_basic_simulation
+
+
+def _summary(logs):
+    return [(log.day, log.state, log.strategy, log.trust_delta) for log in logs]
+
+
+def test_quiet_modes_return_same_logs(capsys):
+    expected = run_basic_simulation(days=20)
+    assert "Day 20" in capsys.readouterr().out
+
+    silent = run_basic_simulation(days=20, output="silent")
+    assert capsys.readouterr().out == ""
+
+    summary = run_basic_simulation(days=20, output=OutputMode.SUMMARY)
+    out = capsys.readouterr().out
+    assert "Simulation Summary" in out
+    assert "Day 1" not in out
+
+    assert _summary(silent) == _summary(summary) == _summary(expected)
+
+
+def test_file_modes(tmp_path, capsys):
+    jsonl = tmp_path / "run.jsonl"
+    jsonl.write_text("stale\n")
+    logs = run_basic_simulation(days=15, output="jsonl", path=str(jsonl))
+    rows = [json.loads(line) for line in jsonl.read_text().splitlines()]
+    assert rows == [log.to_dict() for log in logs]
+
+    path = tmp_path / "run.csv"
+    logs = run_basic_simulation(days=15, output="csv", path=str(path))
+    with path.open(newline="") as f:
+        records = list(csv.DictReader(f))
+    assert [int(r["day"]) for r in records] == [log.day for log in logs]
+    assert [r["explanation"] for r in records] == [
+        log.explanation.summary for log in logs
+    ]
+
+    assert capsys.readouterr().out == ""
+
+    with pytest.raises(ValueError):
+        run_basic_simulation(days=3, output="csv")
+
+
+def test_progress_redraws_at_fixed_rate():
+    now = [0.0]
+    stream = io.StringIO()
+    reporter = ProgressReporter(1_000, interval=1.0, stream=stream,
+                                clock=lambda: now[0])
+
+    for day in range(1, 1_001):
+        now[0] += 0.01
+        reporter.update(day)
+    reporter.close()
+
+    # one redraw per simulated second (10 s), plus the final one
+    assert reporter.redraws == 11
+    assert stream.getvalue().endswith("\rSimulating: 1000/1000 (100.0%)\n")
+
+
+def test_progress_on_stderr(capsys):
+    run_basic_simulation(days=5, output="silent", progress=True)
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Simulating: 5/5" in captured.err
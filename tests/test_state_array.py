@@ -0,0 +1,65 @@
+"""
+tests/test_state_array.py
+
+Validates the vectorized population state update
+against the scalar update_state.
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from governing_brain.state_model import BehavioralState, update_state
+from governing_brain.state_array import (
+    BehavioralStateArray,
+    signal_matrix_from_batches,
+    update_state_batch,
+)
+from tests.helpers import random_batch
+
+
+def _random_state(rng: random.Random) -> BehavioralState:
+    return BehavioralState(
+        discipline_level=rng.random(),
+        failure_risk=rng.random(),
+        avoidance_tendency=rng.random(),
+        fatigue_index=rng.random(),
+        context_importance=rng.random(),
+        momentum_trend=rng.uniform(-1.0, 1.0),
+    )
+
+
+def test_batch_update_matches_scalar_update():
+    rng = random.Random(3)
+    states = [_random_state(rng) for _ in range(300)]
+    batches = [random_batch(rng) for _ in states]
+
+    updated = update_state_batch(
+        BehavioralStateArray.from_states(states),
+        signal_matrix_from_batches(batches),
+    )
+
+    for i, (state, batch) in enumerate(zip(states, batches)):
+        expected = update_state(state, batch)
+        actual = updated.state_at(i)
+        for name, value in vars(expected).items():
+            assert getattr(actual, name) == pytest.approx(value, abs=1e-12)
+
+
+def test_state_array_round_trip_and_cold_start():
+    rng = random.Random(5)
+    states = [_random_state(rng) for _ in range(10)]
+
+    assert BehavioralStateArray.from_states(states).to_states() == states
+    assert BehavioralStateArray.cold_start(3).to_states() == [
+        update_state(None, random_batch(rng))
+    ] * 3
+
+
+def test_signal_matrix_shape_is_validated():
+    states = BehavioralStateArray.cold_start(4)
+
+    with pytest.raises(ValueError):
+        update_state_batch(states, np.zeros((4, 1)))
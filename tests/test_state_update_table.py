@@ -0,0 +1,59 @@
+"""
+tests/test_state_update_table.py
+
+Ensures the single-pass, table-driven update_state
+is bit-identical to the per-dimension reference.
+"""
+
+import random
+from dataclasses import astuple
+from datetime import datetime, timedelta
+
+from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.state_model import (
+    BehavioralState,
+    _update_state_multipass,
+    update_state,
+)
+from tests.helpers import random_batch
+
+
+def _bits(state: BehavioralState):
+    return tuple(value.hex() for value in astuple(state))
+
+
+def test_table_matches_reference_bit_for_bit():
+    rng = random.Random(7)
+
+    for _ in range(500):
+        state = BehavioralState(
+            discipline_level=rng.random(),
+            failure_risk=rng.random(),
+            avoidance_tendency=rng.random(),
+            fatigue_index=rng.random(),
+            context_importance=rng.random(),
+            momentum_trend=rng.uniform(-1.0, 1.0),
+        )
+        batch = random_batch(rng, rng.randint(0, 40))
+
+        assert _bits(update_state(state, batch)) == _bits(
+            _update_state_multipass(state, batch)
+        )
+
+
+def test_signed_zero_preserved():
+    # Neither signal moves momentum, so -0.0 must survive the update.
+    state = BehavioralState(0.5, 0.5, 0.3, 0.5, 0.5, -0.0)
+    now = datetime(2025, 1, 1, 8, 0)
+    batch = SignalBatch(
+        signals=[
+            Signal("recovery_day", 1.0, 0.0, now),
+            Signal("sleep_debt", 1.0, 1.0, now),
+        ],
+        window_start=now - timedelta(hours=8),
+        window_end=now,
+    )
+
+    updated = update_state(state, batch)
+    assert _bits(updated) == _bits(_update_state_multipass(state, batch))
+    assert updated.momentum_trend.hex() == "-0x0.0p+0"
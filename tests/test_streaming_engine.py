@@ -0,0 +1,42 @@
+"""
+tests/test_streaming_engine.py
+
+Checks TimeEngine streaming and the simulation log sinks.
+"""
+
+import json
+
+from policy_evolution.evaluator import PolicyEvaluator
+from simulation.sinks import AggregateSink, FileSink, MemorySink
+from tests.helpers import make_engine
+
+
+def _summary(logs):
+    return [(log.day, log.state, log.strategy, log.trust_delta) for log in logs]
+
+
+def test_stream_matches_run():
+    expected = make_engine().run()
+    engine = make_engine()
+    streamed = list(engine.stream())
+
+    assert _summary(streamed) == _summary(expected)
+    assert engine.logs == []
+
+
+def test_sinks(tmp_path):
+    expected = make_engine().run()
+
+    memory = make_engine().run_to(MemorySink())
+    assert _summary(memory.logs) == _summary(expected)
+
+    aggregate = make_engine().run_to(AggregateSink())
+    assert aggregate.evaluate() == PolicyEvaluator(expected).evaluate()
+
+    path = tmp_path / "logs.jsonl"
+    file_sink = make_engine().run_to(FileSink(str(path)))
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert file_sink.count == len(rows) == 120
+    assert [row["strategy"] for row in rows] == [
+        log.strategy.value for log in expected
+    ]
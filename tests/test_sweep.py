@@ -0,0 +1,123 @@
+"""
+tests/test_sweep.py
+
+Checks the parameter sweep runner and its on-disk cache.
+"""
+
+from governing_brain.brain import GoverningBrain
+from governing_brain.policies.rules import rule_parameters
+from policy_evolution.evaluator import PolicyEvaluator
+from simulation.sweep import (
+    SweepCell,
+    normalize_code,
+    policy_code_version,
+    run_sweep,
+    sweep_cells,
+)
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+GRID = dict(
+    compliance_bias=(0.4, 0.7),
+    fatigue_sensitivity=(0.5,),
+    avoidance_tendency=(0.2, 0.6),
+    days=(20,),
+    seeds=(1, 2),
+)
+
+
+def test_cells_cover_the_grid():
+    cells = sweep_cells(**GRID)
+    assert len(cells) == 8
+    assert cells[0] == SweepCell(0.4, 0.5, 0.2, 20, 1)
+    assert cells[-1] == SweepCell(0.7, 0.5, 0.6, 20, 2)
+
+
+def test_cells_match_policy_evaluator(tmp_path):
+    result = run_sweep(**GRID, cache_dir=str(tmp_path), workers=1)
+    assert (result.computed, result.cached) == (8, 0)
+
+    for cell, evaluation in result.evaluations.items():
+        user = SyntheticUser(
+            "reference",
+            compliance_bias=cell.compliance_bias,
+            fatigue_sensitivity=cell.fatigue_sensitivity,
+            avoidance_tendency=cell.avoidance_tendency,
+            seed=cell.seed,
+        )
+        logs = TimeEngine(GoverningBrain(), user, total_days=cell.days).run()
+        assert evaluation == PolicyEvaluator(logs).evaluate()
+
+
+def test_only_invalidated_cells_recompute(tmp_path):
+    cache = str(tmp_path / "cache")
+    first = run_sweep(**GRID, cache_dir=cache, workers=1)
+
+    again = run_sweep(**GRID, cache_dir=cache, workers=1)
+    assert (again.computed, again.cached) == (0, 8)
+    assert again.evaluations == first.evaluations
+
+    wider = run_sweep(**{**GRID, "seeds": (1, 2, 3)}, cache_dir=cache, workers=1)
+    assert (wider.computed, wider.cached) == (4, 8)
+
+    assert policy_code_version() == first.policy_version
+
+
+def test_threshold_changes_only_recompute_affected_cells(tmp_path):
+    cache = str(tmp_path / "cache")
+    run_sweep(**GRID, cache_dir=cache, workers=1)
+    thresholds = rule_parameters()
+
+    # No simulated state comes near this threshold
+    name = "burnout.avoidance_under_load.avoidance_tendency_min"
+    untouched = {name: thresholds[name] + 0.1}
+    reused = run_sweep(**GRID, cache_dir=cache, parameters=untouched, workers=1)
+    assert (reused.computed, reused.cached) == (0, 8)
+    assert reused.evaluations == run_sweep(
+        **GRID, parameters=untouched, workers=1
+    ).evaluations
+
+    name = "burnout.acute_overload.fatigue_index_min"
+    moved = {name: thresholds[name] + 0.1}
+    changed = run_sweep(**GRID, cache_dir=cache, parameters=moved, workers=1)
+    assert changed.computed > 0
+    assert changed.evaluations == run_sweep(
+        **GRID, parameters=moved, workers=1
+    ).evaluations
+
+    # Both policies stay cached side by side
+    again = run_sweep(**GRID, cache_dir=cache, workers=1)
+    assert again.computed == 0
+
+
+def test_code_version_ignores_comments_and_docstrings():
+    source = 'def f(x):\n    """Doubles x."""\n    return 2 * x\n'
+    edited = (
+        '# helper\ndef f(x):\n    """Returns twice x."""\n\n'
+        '    return 2 * x  # double\n'
+    )
+    assert normalize_code(source) == normalize_code(edited)
+    assert normalize_code(source) != normalize_code(source.replace("2", "3"))
+
+    rules = "RULES: tuple = (0.6,)\nLIMIT = 1\n"
+    assert normalize_code(rules, exclude=("RULES",)) == normalize_code(
+        rules.replace("0.6", "0.7"), exclude=("RULES",)
+    )
+
+
+def test_corrupt_cache_entries_are_recomputed(tmp_path):
+    first = run_sweep(**GRID, cache_dir=str(tmp_path), workers=1)
+    victim = next(tmp_path.iterdir())
+    victim.write_text("{not json")
+
+    again = run_sweep(**GRID, cache_dir=str(tmp_path), workers=1)
+    assert (again.computed, again.cached) == (1, 7)
+    assert again.evaluations == first.evaluations
+
+
+def test_parallel_matches_in_process():
+    serial = run_sweep(**GRID, workers=1, chunk_size=3)
+    parallel = run_sweep(**GRID, workers=2, chunk_size=3)
+    assert parallel.evaluations == serial.evaluations
+    assert list(parallel.evaluations) == sweep_cells(**GRID)
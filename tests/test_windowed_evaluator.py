@@ -0,0 +1,76 @@
+"""
+tests/test_windowed_evaluator.py
+
+Checks prefix-sum window evaluations against
+PolicyEvaluator over the same log slices.
+"""
+
+import random
+from dataclasses import replace
+
+import pytest
+
+from governing_brain.brain import GoverningBrain
+from policy_evolution.evaluator import PolicyEvaluator
+from policy_evolution.signal_engine import EvolutionSignalEngine
+from policy_evolution.windowed import WindowedEvaluator
+from simulation.synthetic_users import SyntheticUser
+from simulation.time_engine import TimeEngine
+
+
+LOGS = TimeEngine(
+    GoverningBrain(),
+    SyntheticUser("Windowed", compliance_bias=0.45, seed=19),
+    total_days=200,
+).run()
+
+
+@pytest.mark.parametrize("window", [1, 7, 30, 90])
+def test_windows_match_policy_evaluator(window):
+    series = WindowedEvaluator(LOGS).series(window)
+    assert len(series) == len(LOGS) - window + 1
+
+    for start, evaluation in enumerate(series):
+        assert evaluation == PolicyEvaluator(
+            LOGS[start:start + window]
+        ).evaluate()
+
+
+def test_arbitrary_trust_deltas_match_policy_evaluator():
+    rng = random.Random(6)
+    logs = [
+        replace(
+            log, trust_delta=rng.uniform(-1.0, 1.0) * 10 ** rng.randint(-9, 1)
+        )
+        for log in LOGS[:60]
+    ]
+    windowed = WindowedEvaluator(logs)
+
+    for start in range(0, 60, 7):
+        for end in (start + 1, min(60, start + 30), 60):
+            assert windowed.evaluate(start, end) == PolicyEvaluator(
+                logs[start:end]
+            ).evaluate()
+
+
+def test_health_flips_and_signal_series():
+    windowed = WindowedEvaluator(LOGS)
+    flips = windowed.health_flips(7)
+    series = windowed.series(7)
+
+    for index, before, after in flips:
+        assert series[index - 1].governance_health == before
+        assert series[index].governance_health == after
+
+    signals = EvolutionSignalEngine().derive_windows(windowed)
+    assert sorted(signals) == [7, 30, 90]
+    assert len(signals[90]) == len(LOGS) - 89
+
+
+def test_invalid_windows_are_rejected():
+    windowed = WindowedEvaluator(LOGS)
+    with pytest.raises(ValueError):
+        windowed.evaluate(5, 5)
+    with pytest.raises(ValueError):
+        windowed.evaluate(0, len(LOGS) + 1)
+    assert windowed.series(len(LOGS) + 1) == []
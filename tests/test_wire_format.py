@@ -0,0 +1,80 @@
+"""
+tests/test_wire_format.py
+
+Round-trip tests for the packed binary SignalBatch encoding.
+"""
+
+import random
+
+import pytest
+
+from governing_brain.inputs import Signal, SignalBatch
+from governing_brain.signal_registry import SIGNAL_NAMES
+from governing_brain.wire_format import (
+    HEADER,
+    RECORD,
+    decode_signal_batch,
+    encode_signal_batch,
+    iter_records,
+)
+from tests.helpers import WINDOW_END, WINDOW_START, random_batch
+
+
+def _registered_batch(rng: random.Random, size: int) -> SignalBatch:
+    # Only registered names can be encoded
+    return random_batch(rng, size, SIGNAL_NAMES, random_values=True)
+
+
+@pytest.mark.parametrize("size", [0, 1, 10, 1000])
+def test_round_trip(size):
+    batch = _registered_batch(random.Random(size), size)
+    data = encode_signal_batch(batch)
+
+    assert len(data) == HEADER.size + size * RECORD.size
+    assert decode_signal_batch(data) == batch
+    assert decode_signal_batch(memoryview(bytearray(data))) == batch
+
+
+def test_records_are_readable_in_place():
+    batch = _registered_batch(random.Random(1), 5)
+    records = list(iter_records(encode_signal_batch(batch)))
+
+    assert [SIGNAL_NAMES[code] for code, *_ in records] == [
+        s.name for s in batch.signals
+    ]
+    assert [confidence for _, _, confidence, _ in records] == [
+        s.confidence for s in batch.signals
+    ]
+
+
+def test_unregistered_names_cannot_be_encoded():
+    batch = SignalBatch(
+        signals=[Signal("unknown_signal", 1.0, 0.5, WINDOW_START)],
+        window_start=WINDOW_START,
+        window_end=WINDOW_END,
+    )
+    with pytest.raises(ValueError, match="not registered"):
+        encode_signal_batch(batch)
+
+
+def test_malformed_buffers_are_rejected():
+    data = encode_signal_batch(_registered_batch(random.Random(2), 3))
+
+    with pytest.raises(ValueError, match="declares 3 records"):
+        decode_signal_batch(data[:-1])
+    with pytest.raises(ValueError, match="Not a binary"):
+        decode_signal_batch(b"XXXX" + data[4:])
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_signal_batch(data[:10])
+
+
+def test_signal_columns_decode_matches():
+    pytest.importorskip("numpy")
+    from governing_brain.signal_columns import SignalColumns
+
+    batch = _registered_batch(random.Random(3), 50)
+    data = encode_signal_batch(batch)
+    columns = SignalColumns.from_wire(data)
+
+    assert columns.to_batch() == batch
+    assert columns.to_wire() == data